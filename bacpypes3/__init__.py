@@ -36,6 +36,7 @@ from . import errors
 
 from . import pdu
 from . import comm
+from . import timer
 
 #
 #   Shell
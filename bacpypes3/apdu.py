@@ -4,7 +4,10 @@ Application Layer Protocol Data Units
 
 from __future__ import annotations
 
-from typing import Callable, Tuple, cast
+import inspect
+
+from functools import partial
+from typing import Any as _Any, Callable, Dict, Iterator, Optional, Tuple, cast
 
 from .basetypes import (
     AtomicReadFileACKAccessMethodChoice,
@@ -50,7 +53,7 @@ from .basetypes import (
     WhoHasObject,
     WriteAccessSpecification,
 )
-from .constructeddata import Any, Sequence, SequenceOf
+from .constructeddata import Any, Sequence, SequenceMetaclass, SequenceOf
 from .debugging import DebugContents, ModuleLogger, bacpypes_debugging
 from .errors import DecodingError, TooManyArguments
 from .pdu import PCI, PDU, PDUData
@@ -925,8 +928,47 @@ class AbortPDU(APDU, ErrorRejectAbortNack):
 #
 
 
+class _LazyElement:
+    """
+    A non-data descriptor that stands in for an element of the lazy subclass
+    of an APCISequence subclass.  Decoded values are in the instance
+    dictionary which takes precedence, so this is only called for elements
+    that have not been decoded yet.
+    """
+
+    def __init__(self, attr: str, value: _Any) -> None:
+        self.attr = attr
+        self.value = value
+
+    def __get__(self, obj: _Any, objtype: Optional[type] = None) -> _Any:
+        if obj is None:
+            return self.value
+
+        # a decoding error is not an AttributeError, that would fall back to
+        # Sequence.__getattr__() and quietly return None
+        obj._lazy_decode(self.attr)
+        try:
+            return obj.__dict__[self.attr]
+        except KeyError:
+            raise AttributeError(self.attr) from None
+
+
+# the lazy subclass of each APCISequence subclass
+_lazy_classes: Dict[type, type] = {}
+
+
 @bacpypes_debugging
 class APCISequence(APCI, Sequence):
+    # when the sequence is decoded lazily these are the tags of the encoded
+    # elements, the elements being decoded in order, the position in the
+    # order of the next one, the initial values of the elements that have
+    # not been decoded yet, and the error if decoding them failed
+    _lazy_tags: Optional[TagList] = None
+    _lazy_elements: Optional[Iterator[Tuple[_Any, _Any]]] = None
+    _lazy_index: int = 0
+    _lazy_inits: Optional[Dict[str, _Any]] = None
+    _lazy_error: Optional[DecodingError] = None
+
     def __init__(self, **kwargs) -> None:
         if _debug:
             APCISequence._debug("__init__ %r", kwargs)
@@ -935,10 +977,115 @@ class APCISequence(APCI, Sequence):
         # pass the rest of the kwargs to the sequence
         Sequence.__init__(self, **kwargs)
 
+    @classmethod
+    def _lazy_class(cls) -> type:
+        """
+        Return a subclass with the same name where the elements are
+        _LazyElement descriptors, references to elements that have not been
+        decoded yet fall through to the descriptor.  The class itself is not
+        changed.
+        """
+        lazy_class = _lazy_classes.get(cls, None)
+        if lazy_class is None:
+            lazy_class = type(cls)(
+                cls.__name__,
+                (cls,),
+                {"__module__": cls.__module__, "__qualname__": cls.__qualname__},
+            )
+            SequenceMetaclass._structures.discard(lazy_class)
+
+            for attr in cls._order:
+                static_value = inspect.getattr_static(cls, attr, None)
+                if isinstance(static_value, property):
+                    continue
+                setattr(lazy_class, attr, _LazyElement(attr, getattr(cls, attr, None)))
+            _lazy_classes[cls] = lazy_class
+
+        return lazy_class
+
+    def _lazy_decode(self, attr: Optional[str] = None) -> None:
+        """
+        Decode the elements of a lazily decoded sequence in order until the
+        element has a value, or all of the remaining elements if attr is None.
+        An error decoding them is raised as a DecodingError, now and for
+        every reference after it.
+        """
+        if _debug:
+            APCISequence._debug("_lazy_decode %r", attr)
+        if self._lazy_error is not None:
+            raise self._lazy_error
+        if self._lazy_inits is None:
+            return
+
+        try:
+            self._lazy_decode_elements(attr)
+        except Exception as err:
+            if _debug:
+                APCISequence._debug("    - decoding error: %r", err)
+            self._lazy_error = DecodingError(f"{self.__class__.__name__}: {err}")
+            raise self._lazy_error from err
+
+    def _lazy_decode_elements(self, attr: Optional[str]) -> None:
+        """Decode the elements for _lazy_decode()."""
+        # the first reference starts decoding the elements
+        if self._lazy_elements is None:
+            tag_list = self._lazy_tags
+            assert tag_list is not None
+            self._lazy_tags = None
+            self._lazy_elements = self._decode_elements(tag_list, tag_list.peek())
+
+        order = self._order
+        for step, value in self._lazy_elements:
+            element_attr = step.attr
+            if _debug:
+                APCISequence._debug(f"    - {element_attr}, {step.element} := {value}")
+
+            # elements skipped over were not encoded
+            index = self._lazy_index
+            while order[index] != element_attr:
+                if order[index] in self._lazy_inits:
+                    self._lazy_restore(order[index])
+                index += 1
+            self._lazy_index = index + 1
+
+            # the application might have already changed the value
+            del self._lazy_inits[element_attr]
+            if element_attr not in self.__dict__:
+                step.element.set_attribute(
+                    getter=partial(self.__dict__.get, element_attr),
+                    setter=partial(self.__setattr__, element_attr),
+                    value=value,
+                )
+            if element_attr == attr:
+                return
+
+        # all done, the rest of the elements were not encoded
+        for skipped_attr in list(self._lazy_inits):
+            self._lazy_restore(skipped_attr)
+        self._lazy_elements = None
+        self._lazy_inits = None
+
+    def _lazy_restore(self, attr: str) -> None:
+        """Give an element that was not encoded its initial value."""
+        value = self._lazy_inits.pop(attr)
+        if attr not in self.__dict__:
+            object.__setattr__(self, attr, value)
+
+    def __eq__(self, other: _Any) -> bool:
+        self._lazy_decode()
+        if isinstance(other, APCISequence):
+            other._lazy_decode()
+        return Sequence.__eq__(self, other)
+
+    __hash__ = Sequence.__hash__
+
     def encode(self) -> APDU:  # type: ignore[override]
         if _debug:
             APCISequence._debug("encode")
 
+        # finish decoding a lazily decoded sequence
+        self._lazy_decode()
+
         # create a tag list
         tag_list: TagList = Sequence.encode(self)
         if _debug:
@@ -946,11 +1093,6 @@ class APCISequence(APCI, Sequence):
             for i, t in enumerate(tag_list):
                 APCISequence._debug("        [%r]: %r", i, t)
 
-        # encode the tag list
-        pdu_data = tag_list.encode()
-        if _debug:
-            APCISequence._debug("    - pdu_data: %r", pdu_data)
-
         # create an APDU, copy the header fields
         apdu: APDU
         if isinstance(self, ConfirmedRequestPDU):
@@ -963,16 +1105,25 @@ class APCISequence(APCI, Sequence):
             apdu = ErrorPDU()
 
         apdu.update(self)
-        apdu.put_data(pdu_data.pduData)
+
+        # encode the tag list directly into the APDU
+        tag_list.encode(apdu)
         if _debug:
             APCISequence._debug("    - apdu: %r, %r", apdu, apdu.pduData)
 
         return apdu
 
     @classmethod
-    def decode(class_, apdu) -> APCISequence:  # type: ignore[override]
+    def decode(class_, apdu, lazy: bool = False) -> APCISequence:  # type: ignore[override]
+        """
+        Decode the APDU as an instance of the service sequence.  When lazy
+        is true the tags are decoded now and the elements are decoded from
+        them when they are first referenced, so a malformed tag is still an
+        error here but an error in the elements is raised as a DecodingError
+        by the reference.
+        """
         if _debug:
-            APCISequence._debug("decode %r", apdu)
+            APCISequence._debug("decode %r lazy=%r", apdu, lazy)
 
         try:
             if apdu.apduType == ConfirmedRequestPDU.pduType:
@@ -994,6 +1145,24 @@ class APCISequence(APCI, Sequence):
                 apci_sequence_subclass.decode,
             )
 
+        if lazy:
+            tag_list = TagList.decode(apdu)
+            apci_sequence = apci_sequence_subclass._lazy_class()()
+
+            # hold on to the initial values of the elements so references
+            # to them fall through to the descriptors
+            apci_sequence._lazy_inits = {
+                attr: apci_sequence.__dict__.pop(attr)
+                for attr in apci_sequence._order
+                if attr in apci_sequence.__dict__
+            }
+            apci_sequence._lazy_tags = tag_list
+
+            # copy the header fields
+            apci_sequence.update(apdu)
+
+            return cast(APCISequence, apci_sequence)
+
         # decode the APDU data as a TagList
         tag_list = TagList.decode(apdu)
         if _debug:
@@ -1033,6 +1202,9 @@ class APCISequence(APCI, Sequence):
         # set the function based on the class name
         use_dict.__setitem__("function", self.__class__.__name__)
 
+        # finish decoding a lazily decoded sequence
+        self._lazy_decode()
+
         # fill in from the sequence contents
         Sequence.dict_contents(self, use_dict=use_dict, as_class=as_class)
 
@@ -7,24 +7,35 @@ from __future__ import annotations
 import argparse
 import asyncio
 import dataclasses
+from collections import deque
 from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any as _Any
-from typing import Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple, Union, cast
 
 # for computing protocol services supported
 from .apdu import (
     APDU,
     AbortPDU,
+    AcknowledgeAlarmRequest,
     ComplexAckPDU,
+    ConfirmedCOVNotificationRequest,
+    ConfirmedEventNotificationRequest,
     ConfirmedRequestPDU,
     ConfirmedServiceChoice,
     Error,
     ErrorPDU,
     IAmRequest,
+    ReadPropertyMultipleRequest,
+    ReadPropertyRequest,
+    ReadRangeRequest,
     RejectPDU,
     SimpleAckPDU,
+    SubscribeCOVPropertyRequest,
+    SubscribeCOVRequest,
     UnconfirmedRequestPDU,
+    WritePropertyMultipleRequest,
+    WritePropertyRequest,
     confirmed_request_types,
     unconfirmed_request_types,
 )
@@ -101,6 +112,12 @@ class DeviceInfo(DebugContents):
         "max_npdu_length",
         "max_segments_accepted",
         "protocol_services_supported",
+        "apdu_rtt",
+        "apdu_rtt_variation",
+        "apdu_rtt_count",
+        "apdu_retry_count",
+        "apdu_failure_count",
+        "rpm_chunk_size",
     )
 
     device_instance: int
@@ -112,6 +129,18 @@ class DeviceInfo(DebugContents):
     max_npdu_length: Optional[int] = None  # See Clause 19.4
     protocol_services_supported: Optional[ServicesSupported] = None
 
+    # smoothed round trip time of confirmed requests and its variation in
+    # milliseconds, the number of samples, retries and requests that failed
+    apdu_rtt: Optional[float] = None
+    apdu_rtt_variation: Optional[float] = None
+    apdu_rtt_count: int = 0
+    apdu_retry_count: int = 0
+    apdu_failure_count: int = 0
+
+    # the number of references in a Read Property Multiple request that is
+    # small enough for the device after a larger one failed
+    rpm_chunk_size: Optional[int] = None
+
 
 #
 #   DeviceInfoCache
@@ -259,6 +288,351 @@ class DeviceInfoCache(DebugContents):
         # decrement the reference count
         device_info._ref_count -= 1
 
+    def rtt_sample(self, device_info: DeviceInfo, rtt: float) -> None:
+        """
+        This function is called by the segmentation state machine with the
+        time in milliseconds it took for the device to respond to a request
+        that was not sent more than once.
+        """
+        if device_info.apdu_rtt is None:
+            device_info.apdu_rtt = rtt
+            device_info.apdu_rtt_variation = rtt / 2.0
+        else:
+            assert device_info.apdu_rtt_variation is not None
+            device_info.apdu_rtt_variation = 0.75 * device_info.apdu_rtt_variation + (
+                0.25 * abs(device_info.apdu_rtt - rtt)
+            )
+            device_info.apdu_rtt = 0.875 * device_info.apdu_rtt + 0.125 * rtt
+        device_info.apdu_rtt_count += 1
+
+        if _debug:
+            DeviceInfoCache._debug(
+                "rtt_sample %r rtt=%r srtt=%r",
+                device_info.device_instance,
+                rtt,
+                device_info.apdu_rtt,
+            )
+
+    def apdu_retry(self, device_info: DeviceInfo) -> None:
+        """
+        This function is called by the segmentation state machine when the
+        device did not respond in time and the request is sent again.
+        """
+        if _debug:
+            DeviceInfoCache._debug("apdu_retry %r", device_info.device_instance)
+
+        device_info.apdu_retry_count += 1
+
+    def apdu_failure(self, device_info: DeviceInfo) -> None:
+        """
+        This function is called by the segmentation state machine when the
+        device did not respond to any of the retries.
+        """
+        if _debug:
+            DeviceInfoCache._debug("apdu_failure %r", device_info.device_instance)
+
+        device_info.apdu_failure_count += 1
+
+    def apdu_statistics(self) -> Dict[int, Dict[str, _Any]]:
+        """
+        Return the round trip time statistics of the devices in the cache
+        keyed by device instance.
+        """
+        return {
+            device_instance: {
+                "address": device_info.device_address,
+                "rtt": device_info.apdu_rtt,
+                "rtt_variation": device_info.apdu_rtt_variation,
+                "rtt_count": device_info.apdu_rtt_count,
+                "retry_count": device_info.apdu_retry_count,
+                "failure_count": device_info.apdu_failure_count,
+            }
+            for device_instance, device_info in self.instance_cache.items()
+        }
+
+
+#
+#   InvokeIDAllocator
+#
+
+# a bit for each invoke ID
+_all_invoke_ids = (1 << 256) - 1
+
+
+@bacpypes_debugging
+class InvokeIDAllocator(DebugContents):
+    """
+    The outstanding confirmed requests to a peer indexed by invoke ID and a
+    bitmap of the invoke IDs in use.
+    """
+
+    _debug_contents = ("requests",)
+    _debug: Callable[..., None]
+
+    used_invoke_ids: int
+    requests: Dict[int, Tuple[APDU, APDUFuture]]
+
+    def __init__(self) -> None:
+        if _debug:
+            InvokeIDAllocator._debug("__init__")
+
+        self.used_invoke_ids = 0
+        self.requests = {}
+
+    def allocate(self, invoke_id: Optional[int], next_invoke_id: int) -> Optional[int]:
+        """
+        Return the invoke ID if it is not in use, otherwise the first one not
+        in use starting with the next invoke ID, or None if all of them are
+        in use.
+        """
+        free_invoke_ids = ~self.used_invoke_ids & _all_invoke_ids
+        if not free_invoke_ids:
+            return None
+
+        if (invoke_id is None) or not ((free_invoke_ids >> invoke_id) & 1):
+            # look at the next invoke ID and above, then wrap around
+            candidates = (free_invoke_ids >> next_invoke_id) << next_invoke_id
+            if not candidates:
+                candidates = free_invoke_ids
+            invoke_id = (candidates & -candidates).bit_length() - 1
+
+        self.used_invoke_ids |= 1 << invoke_id
+        return invoke_id
+
+    def release(self, invoke_id: int) -> None:
+        """Make the invoke ID available."""
+        self.used_invoke_ids &= ~(1 << invoke_id)
+
+
+#
+#   RequestScheduler
+#
+
+# request priorities, lower values are sent first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# there are only so many invoke IDs
+_max_per_address = 256
+
+
+@bacpypes_debugging
+class RequestScheduler(DebugContents):
+    """
+    Limit the number of outstanding confirmed requests to each destination,
+    to each remote network and overall.  Requests that would go over a limit
+    wait in a queue for their priority and are sent round-robin between the
+    destinations when earlier requests complete.
+    """
+
+    _debug_contents = (
+        "max_per_address",
+        "max_per_network",
+        "max_outstanding",
+        "outstanding",
+        "address_outstanding",
+        "network_outstanding",
+    )
+    _debug: Callable[..., None]
+
+    # default priorities of requests, writes and notifications before polling
+    priorities: Dict[type, int] = {
+        AcknowledgeAlarmRequest: PRIORITY_HIGH,
+        ConfirmedCOVNotificationRequest: PRIORITY_HIGH,
+        ConfirmedEventNotificationRequest: PRIORITY_HIGH,
+        SubscribeCOVPropertyRequest: PRIORITY_HIGH,
+        SubscribeCOVRequest: PRIORITY_HIGH,
+        WritePropertyMultipleRequest: PRIORITY_HIGH,
+        WritePropertyRequest: PRIORITY_HIGH,
+        ReadPropertyMultipleRequest: PRIORITY_LOW,
+        ReadPropertyRequest: PRIORITY_LOW,
+        ReadRangeRequest: PRIORITY_LOW,
+    }
+
+    max_per_address: Optional[int]
+    max_per_network: Optional[int]
+    max_outstanding: Optional[int]
+
+    outstanding: int
+    address_outstanding: Dict[Address, int]
+    network_outstanding: Dict[int, int]
+    queues: List[Dict[Address, Deque[Tuple[float, APDU, APDUFuture]]]]
+
+    waited_count: int
+    total_wait_time: float
+    max_wait_time: float
+
+    def __init__(
+        self,
+        max_per_address: Optional[int] = None,
+        max_per_network: Optional[int] = None,
+        max_outstanding: Optional[int] = None,
+    ) -> None:
+        if _debug:
+            RequestScheduler._debug(
+                "__init__ max_per_address=%r max_per_network=%r max_outstanding=%r",
+                max_per_address,
+                max_per_network,
+                max_outstanding,
+            )
+
+        self.max_per_address = max_per_address
+        self.max_per_network = max_per_network
+        self.max_outstanding = max_outstanding
+
+        self.outstanding = 0
+        self.address_outstanding = {}
+        self.network_outstanding = {}
+        self.queues = [{} for _ in range(PRIORITY_LOW + 1)]
+
+        self.waited_count = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def priority(self, apdu: APDU) -> int:
+        """Return the default priority of a request."""
+        return self.priorities.get(type(apdu), PRIORITY_NORMAL)
+
+    def ready(self, address: Address) -> bool:
+        """Return True if a request to the address can be sent now."""
+        if (self.max_outstanding is not None) and (
+            self.outstanding >= self.max_outstanding
+        ):
+            return False
+
+        max_per_address = _max_per_address
+        if self.max_per_address is not None:
+            max_per_address = min(self.max_per_address, max_per_address)
+        if self.address_outstanding.get(address, 0) >= max_per_address:
+            return False
+
+        if (self.max_per_network is not None) and (address.addrNet is not None):
+            if (
+                self.network_outstanding.get(address.addrNet, 0)
+                >= self.max_per_network
+            ):
+                return False
+
+        return True
+
+    def start(self, address: Address) -> None:
+        """A request to the address has been sent."""
+        self.outstanding += 1
+        self.address_outstanding[address] = self.address_outstanding.get(address, 0) + 1
+        if address.addrNet is not None:
+            self.network_outstanding[address.addrNet] = (
+                self.network_outstanding.get(address.addrNet, 0) + 1
+            )
+
+    def finish(self, address: Address) -> None:
+        """A request to the address has completed."""
+        self.outstanding -= 1
+
+        count = self.address_outstanding[address] - 1
+        if count:
+            self.address_outstanding[address] = count
+        else:
+            del self.address_outstanding[address]
+
+        if address.addrNet is not None:
+            count = self.network_outstanding[address.addrNet] - 1
+            if count:
+                self.network_outstanding[address.addrNet] = count
+            else:
+                del self.network_outstanding[address.addrNet]
+
+    def put(self, apdu: APDU, future: APDUFuture, priority: int) -> None:
+        """Add a request to the queue for its priority and destination."""
+        if _debug:
+            RequestScheduler._debug("put %r %r %r", apdu, future, priority)
+
+        queue = self.queues[priority]
+        requests = queue.get(apdu.pduDestination, None)
+        if requests is None:
+            requests = queue[apdu.pduDestination] = deque()
+        requests.append((asyncio.get_running_loop().time(), apdu, future))
+
+    def get(self) -> Optional[Tuple[APDU, APDUFuture]]:
+        """
+        Return the next request that can be sent, the highest priority
+        first and then round-robin between the destinations.
+        """
+        if (self.max_outstanding is not None) and (
+            self.outstanding >= self.max_outstanding
+        ):
+            return None
+
+        for queue in self.queues:
+            for address, requests in queue.items():
+                if self.ready(address):
+                    break
+            else:
+                continue
+
+            # move the destination to the end of the line
+            del queue[address]
+            when, apdu, future = requests.popleft()
+            if requests:
+                queue[address] = requests
+
+            wait_time = asyncio.get_running_loop().time() - when
+            self.waited_count += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+            if _debug:
+                RequestScheduler._debug("    - wait time: %r", wait_time)
+
+            return (apdu, future)
+
+        return None
+
+    def remove(self, apdu: APDU) -> bool:
+        """Remove a request from the queues, returns True if it was found."""
+        for queue in self.queues:
+            requests = queue.get(apdu.pduDestination, None)
+            if not requests:
+                continue
+            for indx, (when, pdu, future) in enumerate(requests):
+                if apdu is pdu:
+                    del requests[indx]
+                    if not requests:
+                        del queue[apdu.pduDestination]
+                    return True
+
+        return False
+
+    def waiting(self) -> int:
+        """Return the number of requests waiting to be sent."""
+        return sum(
+            len(requests) for queue in self.queues for requests in queue.values()
+        )
+
+    def stats(self) -> Dict[str, _Any]:
+        """Return the queue depths and wait times for monitoring."""
+        waiting_by_address: Dict[Address, int] = {}
+        for queue in self.queues:
+            for address, requests in queue.items():
+                waiting_by_address[address] = waiting_by_address.get(
+                    address, 0
+                ) + len(requests)
+
+        return {
+            "outstanding": self.outstanding,
+            "waiting": sum(waiting_by_address.values()),
+            "waiting_by_priority": [
+                sum(len(requests) for requests in queue.values())
+                for queue in self.queues
+            ],
+            "waiting_by_address": waiting_by_address,
+            "waited_count": self.waited_count,
+            "total_wait_time": self.total_wait_time,
+            "max_wait_time": self.max_wait_time,
+            "mean_wait_time": (
+                self.total_wait_time / self.waited_count if self.waited_count else 0.0
+            ),
+        }
+
 
 #
 #   Application
@@ -291,7 +665,9 @@ class Application(
     link_layers: Dict[ObjectIdentifier, _Any]
 
     next_invoke_id: int
-    _requests: Dict[Address, List[Tuple[APDU, APDUFuture]]]
+    request_scheduler: RequestScheduler
+    _requests: Dict[Address, InvokeIDAllocator]
+    _request_tasks: Set[asyncio.Task]
 
     def __init__(
         self, *args, device_info_cache: Optional[DeviceInfoCache] = None, **kwargs
@@ -314,7 +690,9 @@ class Application(
         self.device_info_cache = device_info_cache or DeviceInfoCache()
 
         self.next_invoke_id = 0
+        self.request_scheduler = RequestScheduler()
         self._requests = {}
+        self._request_tasks = set()
 
         # other services
         ChangeOfValueServices.__init__(self)
@@ -770,7 +1148,9 @@ class Application(
 
     # -----
 
-    def request(self, apdu: APDU) -> APDUFuture:  # type: ignore[override]
+    def request(  # type: ignore[override]
+        self, apdu: APDU, priority: Optional[int] = None
+    ) -> APDUFuture:
         """
         This function is called by a subclass of Application when it has a
         confirmed or unconfirmed request to send.  It returns a future that
@@ -780,10 +1160,12 @@ class Application(
         it will be reassigned to a new one if there is already an outstanding
         request with the same one.
 
-        There is no throttling of the number of outstanding requests.
+        Confirmed requests are throttled by the request scheduler, requests
+        that would go over its limits wait to be sent in priority order, the
+        default priority depends on the kind of request.
         """
         if _debug:
-            Application._debug("request %r", apdu)
+            Application._debug("request %r priority=%r", apdu, priority)
 
         # create a future
         future = APDUFuture()
@@ -794,37 +1176,75 @@ class Application(
             pdu_destination = apdu.pduDestination
             assert pdu_destination
 
-            # make sure the invoke ID is set
-            if apdu.apduInvokeID is None:
-                apdu.apduInvokeID = self.next_invoke_id
-                self.next_invoke_id = (self.next_invoke_id + 1) % 256
-
-            # check to see if there are any requests for this destination
-            if pdu_destination in self._requests:
-                # make sure the invoke ID isn't already being used
-                used_invoke_ids: Set[int] = set(
-                    pdu.apduInvokeID for pdu, fut in self._requests[pdu_destination]
-                )
-                while apdu.apduInvokeID in used_invoke_ids:
-                    apdu.apduInvokeID = self.next_invoke_id
-                    self.next_invoke_id = (self.next_invoke_id + 1) % 256
-
-                self._requests[pdu_destination].append((apdu, future))
-            else:
-                self._requests[pdu_destination] = [(apdu, future)]
-            if _debug:
-                Application._debug("    - _requests: %r", self._requests)
-
             # add a callback in case the request is canceled (timeout)
             future.add_done_callback(partial(self._request_done, apdu))
+
+            # wait if this would go over the limits
+            if not self.request_scheduler.ready(pdu_destination):
+                if priority is None:
+                    priority = self.request_scheduler.priority(apdu)
+                if _debug:
+                    Application._debug("    - waiting, priority %r", priority)
+                self.request_scheduler.put(apdu, future, priority)
+            else:
+                self._send_request(apdu, future)
+
+            return future
         else:
             raise TypeError("APDU expected")
 
         # create a task to send it
-        asyncio.create_task(ApplicationServiceElement.request(self, apdu))
+        self._send_task(apdu, future)
 
         return future
 
+    def _send_request(self, apdu: APDU, future: APDUFuture) -> None:
+        """
+        Make sure the invoke ID of a confirmed request is set and isn't already
+        being used, track it, and create a task to send it.
+        """
+        pdu_destination = apdu.pduDestination
+
+        # find the requests for this destination
+        allocator = self._requests.get(pdu_destination, None)
+        if allocator is None:
+            allocator = self._requests[pdu_destination] = InvokeIDAllocator()
+
+        # the scheduler does not let all of them be used
+        invoke_id = allocator.allocate(apdu.apduInvokeID, self.next_invoke_id)
+        assert invoke_id is not None
+
+        if invoke_id != apdu.apduInvokeID:
+            apdu.apduInvokeID = invoke_id
+            self.next_invoke_id = (invoke_id + 1) % 256
+        allocator.requests[invoke_id] = (apdu, future)
+        self.request_scheduler.start(pdu_destination)
+        if _debug:
+            Application._debug("    - _requests: %r", self._requests)
+
+        # create a task to send it
+        self._send_task(apdu, future)
+
+    def _send_task(self, apdu: APDU, future: APDUFuture) -> None:
+        """
+        Create a task to send the request and keep a reference to it until it
+        is done, if sending it fails the exception is passed to the future.
+        """
+        task = asyncio.create_task(ApplicationServiceElement.request(self, apdu))
+        self._request_tasks.add(task)
+        task.add_done_callback(partial(self._send_task_done, future))
+
+    def _send_task_done(self, future: APDUFuture, task: asyncio.Task) -> None:
+        self._request_tasks.discard(task)
+        if task.cancelled():
+            return
+
+        err = task.exception()
+        if err:
+            Application._exception("exception sending request: %r", err)
+            if not future.done():
+                future.set_exception(err)
+
     def _request_done(self, apdu, future) -> None:
         """
         This function is called when the future that was created for sending
@@ -837,28 +1257,38 @@ class Application(
         pdu_destination = apdu.pduDestination
 
         # check to see if there are any requests for this destination
-        if pdu_destination not in self._requests:
-            if _debug:
+        allocator = self._requests.get(pdu_destination, None)
+        request = allocator and allocator.requests.get(apdu.apduInvokeID, None)
+        if (not request) or (request[0] is not apdu):
+            # it might not have been sent
+            if self.request_scheduler.remove(apdu):
+                if _debug:
+                    Application._debug("    - removed from waiting")
+            elif _debug:
                 Application._debug("    - not in _requests")
             return
 
-        # find the apdu in the list
-        requests = self._requests[pdu_destination]
-        for indx, (pdu, fut) in enumerate(requests):
-            if apdu is pdu:
-                del requests[indx]
-                break
-        else:
-            if _debug:
-                Application._debug("    - not in _requests for source")
-            return
-
-        # see if the list is empty
-        if not requests:
+        del allocator.requests[apdu.apduInvokeID]
+        allocator.release(apdu.apduInvokeID)
+        if not allocator.requests:
             del self._requests[pdu_destination]
         if _debug:
             Application._debug("    - removed from _requests")
 
+        # send the requests that were waiting
+        self.request_scheduler.finish(pdu_destination)
+        while True:
+            waiting = self.request_scheduler.get()
+            if not waiting:
+                break
+            pdu, fut = waiting
+            if fut.done():
+                continue
+            if _debug:
+                Application._debug("    - no longer waiting: %r", pdu)
+
+            self._send_request(pdu, fut)
+
     async def indication(self, apdu) -> None:  # type: ignore[override]
         """
         This function is called when the application service element has
@@ -946,21 +1376,19 @@ class Application(
         assert apdu.pduSource
 
         # check to see if there are any requests for this address
-        pdu_source = apdu.pduSource
-        if pdu_source not in self._requests:
+        allocator = self._requests.get(apdu.pduSource, None)
+        if allocator is None:
             if _debug:
                 Application._debug("   - no requests")
             return
 
         # look for a matching invoke ID
-        requests = self._requests[pdu_source]
-        for indx, (request, future) in enumerate(requests):
-            if request.apduInvokeID == apdu.apduInvokeID:
-                break
-        else:
+        match = allocator.requests.get(apdu.apduInvokeID, None)
+        if match is None:
             if _debug:
                 Application._debug("   - no match")
             return
+        request, future = match
         if _debug:
             Application._debug("   - match: %s %s", str(request), str(future))
 
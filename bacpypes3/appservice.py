@@ -8,6 +8,8 @@ import asyncio
 
 from typing import (
     Callable,
+    Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -16,6 +18,7 @@ from typing import (
 from .debugging import ModuleLogger, DebugContents, bacpypes_debugging
 from .comm import Client, ServiceAccessPoint
 from .errors import CommuncationError
+from .timer import Timer, get_timer_wheel
 
 from .pdu import Address, PDU
 from .basetypes import Segmentation
@@ -88,13 +91,18 @@ class SSM(DebugContents):
         "lastSequenceNumber",
         "initialSequenceNumber",
         "actualWindowSize",
+        "proposedWindowSize",
+        "segmentTimeout",
     )
 
     invokeID: Optional[int]
-    _timer_handle: Optional[asyncio.Handle]
+    _timer_handle: Optional[Timer]
+    _transaction_key: Optional[Tuple]
 
     segmentState: int
     segmentAPDU: Optional[APDU]
+    _segment_header: Optional[bytes]
+    _segment_body: Optional[memoryview]
     segmentSize: Optional[int]
     segmentCount: Optional[int]
 
@@ -104,6 +112,9 @@ class SSM(DebugContents):
     lastSequenceNumber: Optional[int]
     initialSequenceNumber: Optional[int]
     actualWindowSize: Optional[int]
+    proposedWindowSize: int
+    segmentationInfo: Optional[SegmentationInfo]
+    _segment_sent_time: Optional[float]
 
     def __init__(
         self, sap: ApplicationServiceAccessPoint, pdu_address: Address
@@ -118,9 +129,12 @@ class SSM(DebugContents):
         self.pdu_address = pdu_address
         self.invokeID = None  # invoke ID
         self._timer_handle = None  # no timer scheduled
+        self._transaction_key = None  # not in a transaction table
 
         self.state = IDLE  # initial state
         self.segmentAPDU = None  # refers to request or response
+        self._segment_header = None  # encoded header of the segments
+        self._segment_body = None  # view of the content being segmented
         self.segmentSize = None  # how big the pieces are
         self.segmentCount = None
 
@@ -152,19 +166,32 @@ class SSM(DebugContents):
             sap.device_object, "maxApduLengthAccepted", sap.maxApduLengthAccepted
         )
 
+        # adaptive segmentation starts with what has been learned about the
+        # peer from earlier transactions
+        self.proposedWindowSize = sap.proposedWindowSize
+        self.segmentationInfo = None
+        if sap.adaptiveSegmentation:
+            self.segmentationInfo = sap.get_segmentation_info(
+                pdu_address, self.proposedWindowSize, self.segmentTimeout
+            )
+            self.proposedWindowSize = self.segmentationInfo.proposedWindowSize
+            self.segmentTimeout = self.segmentationInfo.segmentTimeout
+        self._segment_sent_time = None
+
     def start_timer(self, msecs: int) -> None:
         if _debug:
             SSM._debug("start_timer %r", msecs)
 
-        # if this is set, cancel it
+        # if this is set, move it, otherwise schedule a call to
+        # self.timer_expired()
         if self._timer_handle:
             if _debug:
-                SSM._debug("    - is scheduled")
-            self._timer_handle.cancel()
-
-        # schedule a call to self.timer_expired()
-        loop = asyncio.get_event_loop()
-        self._timer_handle = loop.call_later(msecs / 1000.0, self.timer_expired)
+                SSM._debug("    - restart")
+            self._timer_handle.restart(msecs / 1000.0)
+        else:
+            self._timer_handle = get_timer_wheel().call_later(
+                msecs / 1000.0, self.timer_expired
+            )
         if _debug:
             SSM._debug("    - timer handle: %r", self._timer_handle)
 
@@ -172,12 +199,11 @@ class SSM(DebugContents):
         if _debug:
             SSM._debug("stop_timer")
 
-        # if this is set, cancel it
+        # if this is set, cancel it, it can be restarted
         if self._timer_handle:
             if _debug:
                 SSM._debug("    - is scheduled")
             self._timer_handle.cancel()
-            self._timer_handle = None
 
     def restart_timer(self, msecs: int) -> None:
         if _debug:
@@ -232,6 +258,8 @@ class SSM(DebugContents):
 
         # set the context
         self.segmentAPDU = apdu
+        self._segment_header = None
+        self._segment_body = None
 
     def get_segment(self, indx: int) -> APDU:
         """
@@ -303,10 +331,8 @@ class SSM(DebugContents):
             # first segment sends proposed window size, rest get actual
             if indx == 0:
                 if _debug:
-                    SSM._debug(
-                        "    - proposedWindowSize: %r", self.ssmSAP.proposedWindowSize
-                    )
-                segAPDU.apduWin = self.ssmSAP.proposedWindowSize
+                    SSM._debug("    - proposedWindowSize: %r", self.proposedWindowSize)
+                segAPDU.apduWin = self.proposedWindowSize
             else:
                 if _debug:
                     SSM._debug("    - actualWindowSize: %r", self.actualWindowSize)
@@ -321,11 +347,104 @@ class SSM(DebugContents):
         assert self.segmentSize
 
         offset = indx * self.segmentSize
-        segAPDU.put_data(self.segmentAPDU.pduData[offset : offset + self.segmentSize])
+        segAPDU.put_data(self.get_segment_body()[offset : offset + self.segmentSize])
 
         # success
         return segAPDU
 
+    def get_segment_body(self) -> memoryview:
+        """
+        Return a view of the content of the segmentation context, the content
+        is copied once so the segments can be sliced from it without copying.
+        """
+        if self._segment_body is None:
+            assert self.segmentAPDU
+            self._segment_body = memoryview(bytes(self.segmentAPDU.pduData))
+
+        return self._segment_body
+
+    def get_segment_pdu(self, indx: int) -> PDU:
+        """
+        This function returns the encoded PDU of a particular segment, the same
+        as get_segment(indx).encode(), built from a header template and a slice
+        of the segmentation context.
+        """
+        if _debug:
+            SSM._debug("get_segment_pdu %r", indx)
+
+        # check for no context
+        if not self.segmentAPDU:
+            raise RuntimeError("no segmentation context established")
+        assert self.segmentCount is not None
+        assert self.segmentSize
+
+        # check for invalid segment number
+        if indx >= self.segmentCount:
+            raise RuntimeError(
+                "invalid segment number {0}, APDU has {1} segments".format(
+                    indx, self.segmentCount
+                )
+            )
+
+        # build the header template the first time
+        if self._segment_header is None:
+            if self.segmentAPDU.apduType == ConfirmedRequestPDU.pduType:
+                assert self.invokeID is not None
+                template = [
+                    ConfirmedRequestPDU.pduType << 4,
+                    (encode_max_segments_accepted(self.maxSegmentsAccepted) << 4)
+                    + encode_max_apdu_length_accepted(self.maxApduLengthAccepted),
+                    self.invokeID,
+                ]
+
+                # segmented response accepted?
+                if self.segmentationSupported in (
+                    Segmentation.segmentedReceive,
+                    Segmentation.segmentedBoth,
+                ):
+                    template[0] |= 0x02
+            elif self.segmentAPDU.apduType == ComplexAckPDU.pduType:
+                template = [
+                    ComplexAckPDU.pduType << 4,
+                    self.segmentAPDU.apduInvokeID,
+                ]
+            else:
+                raise RuntimeError("invalid APDU type for segmentation context")
+
+            # segmented message, first segment sends proposed window size
+            if self.segmentCount != 1:
+                template[0] |= 0x08
+                template.extend((0, self.proposedWindowSize))
+            template.append(self.segmentAPDU.apduService)
+
+            self._segment_header = bytes(template)
+            if _debug:
+                SSM._debug("    - segment header: %r", self._segment_header)
+
+        # the sequence number and window size are the third and second octets
+        # from the end, the rest get the actual window size
+        header = bytearray(self._segment_header)
+        if self.segmentCount != 1:
+            if indx < (self.segmentCount - 1):
+                header[0] |= 0x04  # more follows
+            header[-3] = indx % 256
+            if indx != 0:
+                assert self.actualWindowSize is not None
+                header[-2] = self.actualWindowSize
+
+        # add the content
+        offset = indx * self.segmentSize
+        header += self.get_segment_body()[offset : offset + self.segmentSize]
+
+        pdu = PDU(
+            user_data=self.segmentAPDU.pduUserData,
+            destination=self.pdu_address,
+            expectingReply=(self.segmentAPDU.apduType == ConfirmedRequestPDU.pduType),
+        )
+        pdu.pduData = header
+
+        return pdu
+
     def append_segment(self, apdu: APDU) -> None:
         """
         This function appends the apdu content to the end of the current
@@ -360,18 +479,69 @@ class SSM(DebugContents):
         if _debug:
             SSM._debug("    - actualWindowSize: %r", self.actualWindowSize)
         assert self.actualWindowSize
+        assert self.segmentCount is not None
 
-        for ix in range(self.actualWindowSize):
-            apdu = self.get_segment(seqNum + ix)
-
-            # now continue downstream
-            await self.ssmSAP.request(apdu)
+        # build the segments of the window
+        pdus = []
+        for indx in range(seqNum, seqNum + self.actualWindowSize):
+            pdus.append(self.get_segment_pdu(indx))
 
             # check for no more follows
-            if not apdu.apduMor:
-                self.sentAllSegments = True
+            if indx == self.segmentCount - 1:
                 break
 
+        # now continue downstream
+        self._segment_sent_time = asyncio.get_event_loop().time()
+        await self.ssmSAP.request_segments(pdus)
+        if indx == self.segmentCount - 1:
+            self.sentAllSegments = True
+
+    def segment_ack_received(self) -> None:
+        """
+        This function is called when a segment ack is received for segments
+        that were sent, with adaptive segmentation the time it took for the
+        ack is a sample unless the segments had to be sent again.
+        """
+        if self.segmentationInfo is None:
+            return
+
+        ack_time = None
+        if (self.segmentRetryCount == 0) and (self._segment_sent_time is not None):
+            ack_time = (
+                asyncio.get_event_loop().time() - self._segment_sent_time
+            ) * 1000.0
+        if _debug:
+            SSM._debug("segment_ack_received, ack time: %r", ack_time)
+
+        self.ssmSAP.segments_acknowledged(self.segmentationInfo, ack_time)
+        self.segmentTimeout = self.segmentationInfo.segmentTimeout
+
+    def segments_received(self) -> None:
+        """
+        This function is called when a window of segments has been received
+        in order, with adaptive segmentation the window size grows.
+        """
+        if self.segmentationInfo is None:
+            return
+        if _debug:
+            SSM._debug("segments_received")
+
+        self.ssmSAP.segments_acknowledged(self.segmentationInfo, None)
+
+    def segment_lost(self) -> None:
+        """
+        This function is called when segments that were sent have not been
+        acknowledged in time or segments are missing, with adaptive
+        segmentation the window is made smaller and the segment timeout longer.
+        """
+        if self.segmentationInfo is None:
+            return
+        if _debug:
+            SSM._debug("segment_lost")
+
+        self.ssmSAP.segments_lost(self.segmentationInfo)
+        self.segmentTimeout = self.segmentationInfo.segmentTimeout
+
 
 #
 #   ClientSSM - Client Segmentation State Machine
@@ -390,6 +560,46 @@ class ClientSSM(SSM):
         # initialize the retry count
         self.retryCount = 0
 
+        # when the unsegmented request was sent for round trip time samples
+        self._request_sent_time: Optional[float] = None
+
+    def get_apdu_timeout(self) -> int:
+        """
+        Return the APDU timeout for the first attempt at sending the request,
+        with an adaptive APDU timeout it is derived from the smoothed round
+        trip time of the device and its variation.
+        """
+        if (
+            (not self.ssmSAP.adaptiveApduTimeout)
+            or (not self.device_info)
+            or (self.device_info.apdu_rtt is None)
+        ):
+            return self.apduTimeout
+
+        apdu_timeout = self.device_info.apdu_rtt + 4.0 * (
+            self.device_info.apdu_rtt_variation or 0.0
+        )
+        apdu_timeout = max(apdu_timeout, self.ssmSAP.minApduTimeout)
+        apdu_timeout = min(apdu_timeout, self.ssmSAP.maxApduTimeout)
+
+        return int(apdu_timeout)
+
+    def response_received(self) -> None:
+        """
+        This function is called when the device responds to the request, the
+        round trip time is a sample when the request was sent only once.
+        """
+        if self._request_sent_time is None:
+            return
+
+        rtt = (asyncio.get_event_loop().time() - self._request_sent_time) * 1000.0
+        self._request_sent_time = None
+        if _debug:
+            ClientSSM._debug("response_received, rtt: %r", rtt)
+
+        if self.device_info and (self.retryCount == 0):
+            self.ssmSAP.device_info_cache.rtt_sample(self.device_info, rtt)
+
     def set_state(self, newState: int, timer: int = 0) -> None:
         """This function is called when the client wants to change state."""
         if _debug:
@@ -442,6 +652,12 @@ class ClientSSM(SSM):
         if _debug:
             ClientSSM._debug("    - device_info: %r", self.device_info)
 
+        # retries keep the timeout that was backed off
+        if self.retryCount == 0:
+            self.apduTimeout = self.get_apdu_timeout()
+            if _debug:
+                ClientSSM._debug("    - APDU timeout: %r", self.apduTimeout)
+
         # if the max apdu length of the server isn't known, assume that it
         # is the same size as our own and will be the segment size
         if (not self.device_info) or (
@@ -534,6 +750,7 @@ class ClientSSM(SSM):
             self.sentAllSegments = True
             self.retryCount = 0
             self.set_state(AWAIT_CONFIRMATION, self.apduTimeout)
+            self._request_sent_time = asyncio.get_event_loop().time()
         else:
             # segmented
             self.sentAllSegments = False
@@ -542,6 +759,7 @@ class ClientSSM(SSM):
             self.initialSequenceNumber = 0
             self.actualWindowSize = None  # segment ack will set value
             self.set_state(SEGMENTED_REQUEST, self.segmentTimeout)
+            self._segment_sent_time = asyncio.get_event_loop().time()
 
         # deliver to the device
         try:
@@ -660,6 +878,7 @@ class ClientSSM(SSM):
             elif self.sentAllSegments:
                 if _debug:
                     ClientSSM._debug("    - all done sending request")
+                self.segment_ack_received()
                 self.set_state(AWAIT_CONFIRMATION, self.apduTimeout)
 
             # more segments to send
@@ -667,6 +886,7 @@ class ClientSSM(SSM):
                 if _debug:
                     ClientSSM._debug("    - more segments to send")
 
+                self.segment_ack_received()
                 self.initialSequenceNumber = (apdu.apduSeq + 1) % 256
                 self.segmentRetryCount = 0
                 await self.fill_window(self.initialSequenceNumber)
@@ -704,9 +924,7 @@ class ClientSSM(SSM):
                 self.set_segmentation_context(apdu)
 
                 # minimum of what the server is proposing and this client proposes
-                self.actualWindowSize = min(
-                    apdu.apduWin, self.ssmSAP.proposedWindowSize
-                )
+                self.actualWindowSize = min(apdu.apduWin, self.proposedWindowSize)
                 self.lastSequenceNumber = 0
                 self.initialSequenceNumber = 0
                 self.set_state(SEGMENTED_CONFIRMATION, self.segmentTimeout)
@@ -731,6 +949,7 @@ class ClientSSM(SSM):
             ClientSSM._debug("segmented_request_timeout")
 
         # try again
+        self.segment_lost()
         if self.segmentRetryCount < self.numberOfApduRetries:
             if _debug:
                 ClientSSM._debug("    - retry segmented request")
@@ -753,6 +972,9 @@ class ClientSSM(SSM):
         if _debug:
             ClientSSM._debug("await_confirmation %r", apdu)
 
+        if apdu.apduType != SegmentAckPDU.pduType:
+            self.response_received()
+
         if apdu.apduType == AbortPDU.pduType:
             if _debug:
                 ClientSSM._debug("    - server aborted")
@@ -845,6 +1067,15 @@ class ClientSSM(SSM):
                     self.numberOfApduRetries,
                 )
             self.retryCount += 1
+            if self.device_info:
+                self.ssmSAP.device_info_cache.apdu_retry(self.device_info)
+
+            # back off, the device might be slower than it has been
+            if self.ssmSAP.adaptiveApduTimeout:
+                self.apduTimeout = min(
+                    2 * self.apduTimeout,
+                    max(self.ssmSAP.maxApduTimeout, self.apduTimeout),
+                )
 
             # save the retry count, indication acts like the request is coming
             # from the application so the retryCount gets re-initialized.
@@ -854,6 +1085,9 @@ class ClientSSM(SSM):
         else:
             if _debug:
                 ClientSSM._debug("    - retry count exceeded")
+            if self.device_info:
+                self.ssmSAP.device_info_cache.apdu_failure(self.device_info)
+
             abort = self.abort(AbortReason.noResponse)
             await self.response(abort)
 
@@ -891,6 +1125,7 @@ class ClientSSM(SSM):
                 )
 
             # segment received out of order
+            self.segment_lost()
             self.restart_timer(self.segmentTimeout)
             segack = SegmentAckPDU(
                 1, 0, self.invokeID, self.lastSequenceNumber, self.actualWindowSize
@@ -910,6 +1145,7 @@ class ClientSSM(SSM):
                 ClientSSM._debug("    - no more follows")
 
             # send a final ack
+            self.segments_received()
             segack = SegmentAckPDU(
                 0, 0, self.invokeID, self.lastSequenceNumber, self.actualWindowSize
             )
@@ -924,6 +1160,7 @@ class ClientSSM(SSM):
             if _debug:
                 ClientSSM._debug("    - last segment in the group")
 
+            self.segments_received()
             self.initialSequenceNumber = self.lastSequenceNumber
             self.restart_timer(self.segmentTimeout)
             segack = SegmentAckPDU(
@@ -942,6 +1179,7 @@ class ClientSSM(SSM):
         if _debug:
             ClientSSM._debug("segmented_confirmation_timeout")
 
+        self.segment_lost()
         abort = self.abort(AbortReason.noResponse)
         await self.response(abort)
 
@@ -960,6 +1198,9 @@ class ServerSSM(SSM):
             ServerSSM._debug("__init__ %s %r", sap, pdu_address)
         SSM.__init__(self, sap, pdu_address)
 
+        # key of the request in the response cache
+        self._response_key: Optional[Tuple] = None
+
     def set_state(self, newState, timer=0):
         """This function is called when the client wants to change state."""
         if _debug:
@@ -1043,6 +1284,13 @@ class ServerSSM(SSM):
             if _debug:
                 ServerSSM._debug("    - warning: not expecting a response")
 
+        # save the response in case the request is sent again
+        if (self._response_key is not None) and (apdu.apduType != AbortPDU.pduType):
+            assert self.ssmSAP.responseCache is not None
+            self.ssmSAP.responseCache.put(
+                self._response_key, apdu, self.apduTimeout * self.numberOfApduRetries
+            )
+
         # abort response
         if apdu.apduType == AbortPDU.pduType:
             if _debug:
@@ -1153,6 +1401,7 @@ class ServerSSM(SSM):
                 await self.response(apdu)
                 self.set_state(COMPLETED)
             else:
+                self._segment_sent_time = asyncio.get_event_loop().time()
                 await self.response(self.get_segment(0))
                 self.set_state(SEGMENTED_RESPONSE, self.segmentTimeout)
 
@@ -1281,6 +1530,20 @@ class ServerSSM(SSM):
         # unsegmented request
         if not apdu.apduSeg:
             self.set_state(AWAIT_RESPONSE, self.ssmSAP.applicationTimeout)
+
+            # if this request has already been answered send the same response,
+            # it is not saved again so the entry still expires on time
+            response_cache = self.ssmSAP.responseCache
+            if response_cache is not None:
+                response_key = response_cache.key(apdu)
+                response = response_cache.get(response_key)
+                if response is not None:
+                    if _debug:
+                        ServerSSM._debug("    - replay response: %r", response)
+                    await self.confirmation(response)
+                    return
+                self._response_key = response_key
+
             await self.request(apdu)
             return
 
@@ -1298,12 +1561,12 @@ class ServerSSM(SSM):
 
         # the window size is the minimum of what I would propose and what the
         # device has proposed
-        self.actualWindowSize = min(apdu.apduWin, self.ssmSAP.proposedWindowSize)
+        self.actualWindowSize = min(apdu.apduWin, self.proposedWindowSize)
         if _debug:
             ServerSSM._debug(
                 "    - actualWindowSize? min(%r, %r) -> %r",
                 apdu.apduWin,
-                self.ssmSAP.proposedWindowSize,
+                self.proposedWindowSize,
                 self.actualWindowSize,
             )
 
@@ -1355,6 +1618,7 @@ class ServerSSM(SSM):
                 )
 
             # segment received out of order
+            self.segment_lost()
             self.restart_timer(self.segmentTimeout)
 
             # send back a segment ack
@@ -1377,6 +1641,7 @@ class ServerSSM(SSM):
                 ServerSSM._debug("    - no more follows")
 
             # send back a final segment ack
+            self.segments_received()
             segack = SegmentAckPDU(
                 0, 1, self.invokeID, self.lastSequenceNumber, self.actualWindowSize
             )
@@ -1392,6 +1657,7 @@ class ServerSSM(SSM):
             if _debug:
                 ServerSSM._debug("    - last segment in the group")
 
+            self.segments_received()
             self.initialSequenceNumber = self.lastSequenceNumber
             self.restart_timer(self.segmentTimeout)
 
@@ -1412,7 +1678,8 @@ class ServerSSM(SSM):
         if _debug:
             ServerSSM._debug("segmented_request_timeout")
 
-        # give up
+        # segments were lost, give up
+        self.segment_lost()
         self.set_state(ABORTED)
 
     async def await_response(self, apdu):
@@ -1466,12 +1733,14 @@ class ServerSSM(SSM):
             elif self.sentAllSegments:
                 if _debug:
                     ServerSSM._debug("    - all done sending response")
+                self.segment_ack_received()
                 self.set_state(COMPLETED)
 
             else:
                 if _debug:
                     ServerSSM._debug("    - more segments to send")
 
+                self.segment_ack_received()
                 self.initialSequenceNumber = (apdu.apduSeq + 1) % 256
                 self.actualWindowSize = apdu.apduWin
                 self.segmentRetryCount = 0
@@ -1491,6 +1760,7 @@ class ServerSSM(SSM):
             ServerSSM._debug("segmented_response_timeout")
 
         # try again
+        self.segment_lost()
         if self.segmentRetryCount < self.numberOfApduRetries:
             self.segmentRetryCount += 1
             self.start_timer(self.segmentTimeout)
@@ -1500,6 +1770,218 @@ class ServerSSM(SSM):
             self.set_state(ABORTED)
 
 
+#
+#   ResponseCache
+#
+
+
+@bacpypes_debugging
+class ResponseCache(DebugContents):
+    """
+    The responses to the last confirmed requests that were answered, kept for
+    a short time so a request that is sent again because the response was lost
+    is answered without running the service again.  The key is the source,
+    invoke ID, service choice and the encoded request.
+
+    A replayed response is the one that was sent the first time, so when a
+    client reuses the invoke ID for an identical request before the entry
+    expires, like polling the same property again, it gets the old value and
+    the service is not run.  The entries should only live as long as a client
+    keeps sending a request again, by default that is the APDU timeout times
+    the number of retries of the state machine that answered it, a timeout
+    in milliseconds for all of the entries overrides it.
+    """
+
+    _debug: Callable[..., None]
+    _debug_contents: Tuple[str, ...] = ("timeout", "maxsize", "hits")
+
+    timeout: Optional[int]
+    maxsize: int
+    hits: int
+
+    def __init__(self, timeout: Optional[int] = None, maxsize: int = 256) -> None:
+        if _debug:
+            ResponseCache._debug("__init__ timeout=%r maxsize=%r", timeout, maxsize)
+
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.hits = 0
+
+        # dictionaries keep insertion order, the oldest entry is first, the
+        # values are the time the entry expires and the encoded response
+        self._cache: Dict[Tuple, Tuple[float, APDU]] = {}
+
+    @staticmethod
+    def key(apdu: APDU) -> Tuple:
+        """Return the key for a confirmed request."""
+        return (
+            apdu.pduSource,
+            apdu.apduInvokeID,
+            apdu.apduService,
+            bytes(apdu.pduData),
+        )
+
+    def get(self, key: Tuple) -> Optional[APDU]:
+        """Return the response to the request or None."""
+        entry = self._cache.get(key, None)
+        if entry is None:
+            return None
+
+        expires, apdu = entry
+        if expires <= asyncio.get_event_loop().time():
+            del self._cache[key]
+            return None
+
+        self.hits += 1
+        return apdu
+
+    def put(self, key: Tuple, apdu: APDU, retry_window: int) -> None:
+        """
+        Save the response to a request for the retry window in milliseconds
+        or the timeout when there is one, dropping the oldest one when full.
+        """
+        if self.maxsize <= 0:
+            return
+        timeout = retry_window if self.timeout is None else self.timeout
+
+        cache = self._cache
+        cache.pop(key, None)
+        while len(cache) >= self.maxsize:
+            del cache[next(iter(cache))]
+        cache[key] = (asyncio.get_event_loop().time() + timeout / 1000.0, apdu)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+#
+#   SegmentationInfo
+#
+
+
+@bacpypes_debugging
+class SegmentationInfo(DebugContents):
+    """
+    What adaptive segmentation has learned about a peer, the window size to
+    propose and the segment timeout computed from the smoothed time it takes
+    for segments to be acknowledged and its variation.
+    """
+
+    _debug_contents: Tuple[str, ...] = (
+        "proposedWindowSize",
+        "segmentTimeout",
+        "ackTime",
+        "ackTimeVariation",
+        "ackCount",
+        "lossCount",
+    )
+
+    proposedWindowSize: int
+    segmentTimeout: int
+    ackTime: Optional[float]
+    ackTimeVariation: Optional[float]
+    ackCount: int
+    lossCount: int
+
+    def __init__(self, proposed_window_size: int, segment_timeout: int) -> None:
+        self.proposedWindowSize = proposed_window_size
+        self.segmentTimeout = segment_timeout
+        self.ackTime = None
+        self.ackTimeVariation = None
+        self.ackCount = 0
+        self.lossCount = 0
+
+
+#
+#   TransactionTable
+#
+
+
+@bacpypes_debugging
+class TransactionTable(DebugContents):
+    """
+    The active client or server transactions of an application service
+    access point, indexed by the peer address and invoke ID, along with a
+    count of the active transactions with each peer.
+    """
+
+    _debug: Callable[..., None]
+    _debug_contents: Tuple[str, ...] = ("peerCounts",)
+
+    transactions: Dict[Tuple, SSM]
+    peerCounts: Dict[Address, int]
+
+    def __init__(self) -> None:
+        if _debug:
+            TransactionTable._debug("__init__")
+
+        self.transactions = {}
+        self.peerCounts = {}
+
+    @staticmethod
+    def key(address: Address, invoke_id: Optional[int]) -> Tuple:
+        """
+        Return the key for a transaction with a peer.  Routes are deliberately
+        left out, a request is usually sent to an address without a route and
+        the response comes back with one, so the same address through two
+        different routes is the same peer here even though the addresses are
+        not equal.
+        """
+        return (address.addrType, address.addrNet, address.addrAddr, invoke_id)
+
+    def __len__(self) -> int:
+        return len(self.transactions)
+
+    def __iter__(self) -> Iterator[SSM]:
+        return iter(list(self.transactions.values()))
+
+    def get(self, address: Address, invoke_id: Optional[int]) -> Optional[SSM]:
+        """Return the transaction with the peer and invoke ID, or None."""
+        return self.transactions.get(self.key(address, invoke_id), None)
+
+    def add(self, tr: SSM, invoke_id: Optional[int]) -> None:
+        """Add a transaction to the table."""
+        if _debug:
+            TransactionTable._debug("add %r %r", tr, invoke_id)
+
+        key = self.key(tr.pdu_address, invoke_id)
+
+        # a transaction with the same key is replaced
+        old_tr = self.transactions.get(key, None)
+        if old_tr is not None:
+            if _debug:
+                TransactionTable._debug("    - replacing: %r", old_tr)
+            self.remove(old_tr)
+
+        tr._transaction_key = key
+        self.transactions[key] = tr
+        self.peerCounts[tr.pdu_address] = self.peerCounts.get(tr.pdu_address, 0) + 1
+
+    def remove(self, tr: SSM) -> None:
+        """Remove a transaction from the table."""
+        if _debug:
+            TransactionTable._debug("remove %r", tr)
+
+        key = tr._transaction_key
+        if (key is None) or (self.transactions.get(key, None) is not tr):
+            if _debug:
+                TransactionTable._debug("    - not in the table")
+            return
+
+        del self.transactions[key]
+        tr._transaction_key = None
+
+        count = self.peerCounts[tr.pdu_address] - 1
+        if count:
+            self.peerCounts[tr.pdu_address] = count
+        else:
+            del self.peerCounts[tr.pdu_address]
+
+    def peer_count(self, address: Address) -> int:
+        """Return the number of active transactions with a peer."""
+        return self.peerCounts.get(address, 0)
+
+
 #
 #   ApplicationServiceAccessPoint
 #
@@ -1509,8 +1991,8 @@ class ServerSSM(SSM):
 class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
     _debug: Callable[..., None]
 
-    clientTransactions: List[ClientSSM]
-    serverTransactions: List[ServerSSM]
+    clientTransactions: TransactionTable
+    serverTransactions: TransactionTable
 
     def __init__(
         self, device_object=None, device_info_cache=None, sap=None, cid=None
@@ -1534,27 +2016,49 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         self.device_info_cache = device_info_cache
 
         # running state machines
-        self.clientTransactions = []
-        self.serverTransactions = []
+        self.clientTransactions = TransactionTable()
+        self.serverTransactions = TransactionTable()
 
         # confirmed request defaults
         self.numberOfApduRetries = 3
         self.apduTimeout = 3000
         self.maxApduLengthAccepted = 1024
 
+        # an adaptive APDU timeout follows the smoothed round trip time of
+        # each device in the device information cache
+        self.adaptiveApduTimeout = False
+        self.minApduTimeout = 100
+        self.maxApduTimeout = 10000
+
         # segmentation defaults
         self.segmentationSupported = Segmentation.noSegmentation
         self.segmentTimeout = 1500
         self.maxSegmentsAccepted = 2
         self.proposedWindowSize = 2
 
+        # adaptive segmentation learns the window size to propose and the
+        # segment timeout for each peer
+        self.adaptiveSegmentation = False
+        self.maxProposedWindowSize = 32
+        self.minSegmentTimeout = 250
+        self.maxSegmentTimeout = 10000
+        self.segmentationInfo: Dict[Address, SegmentationInfo] = {}
+
         # device communication control
         self.dccEnableDisable = "enable"
 
+        # decode the elements of unconfirmed requests when they are referenced,
+        # a request with a malformed element is not dropped here, referencing
+        # the element in the do_*() handler raises a DecodingError
+        self.lazyDecoding = False
+
         # how long the state machine is willing to wait for the application
         # layer to form a response and send it
         self.applicationTimeout = 3000
 
+        # responses to replay when a request is sent again
+        self.responseCache: Optional[ResponseCache] = None
+
     async def request(self, apdu: APDU) -> None:
         """
         Packets going down the stack are APDUs but to be delivered to the
@@ -1571,6 +2075,90 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         # now it can go
         await Client.request(self, pdu)
 
+    def get_segmentation_info(
+        self, address: Address, proposed_window_size: int, segment_timeout: int
+    ) -> SegmentationInfo:
+        """
+        Return what has been learned about segmented transactions with the
+        peer, starting with the window size and segment timeout provided.
+        """
+        segmentation_info = self.segmentationInfo.get(address, None)
+        if segmentation_info is None:
+            segmentation_info = SegmentationInfo(proposed_window_size, segment_timeout)
+            self.segmentationInfo[address] = segmentation_info
+            if _debug:
+                ApplicationServiceAccessPoint._debug(
+                    "    - new segmentation info: %r", segmentation_info
+                )
+
+        return segmentation_info
+
+    def segments_acknowledged(
+        self, segmentation_info: SegmentationInfo, ack_time: Optional[float]
+    ) -> None:
+        """
+        A window of segments to or from the peer has been acknowledged, the
+        window size grows by one and when there is an ack time sample
+        (milliseconds) the segment timeout follows the smoothed ack time.
+        """
+        segmentation_info.ackCount += 1
+        segmentation_info.proposedWindowSize = min(
+            segmentation_info.proposedWindowSize + 1, self.maxProposedWindowSize
+        )
+
+        if ack_time is not None:
+            if segmentation_info.ackTime is None:
+                segmentation_info.ackTime = ack_time
+                segmentation_info.ackTimeVariation = ack_time / 2.0
+            else:
+                assert segmentation_info.ackTimeVariation is not None
+                segmentation_info.ackTimeVariation = (
+                    0.75 * segmentation_info.ackTimeVariation
+                    + 0.25 * abs(segmentation_info.ackTime - ack_time)
+                )
+                segmentation_info.ackTime = (
+                    0.875 * segmentation_info.ackTime + 0.125 * ack_time
+                )
+
+            segment_timeout = (
+                segmentation_info.ackTime + 4.0 * segmentation_info.ackTimeVariation
+            )
+            segment_timeout = max(segment_timeout, self.minSegmentTimeout)
+            segment_timeout = min(segment_timeout, self.maxSegmentTimeout)
+            segmentation_info.segmentTimeout = int(segment_timeout)
+
+        if _debug:
+            ApplicationServiceAccessPoint._debug(
+                "segments_acknowledged %r", segmentation_info
+            )
+
+    def segments_lost(self, segmentation_info: SegmentationInfo) -> None:
+        """
+        Segments to or from the peer were lost, the window size is cut in half
+        and the segment timeout is doubled.
+        """
+        segmentation_info.lossCount += 1
+        segmentation_info.proposedWindowSize = max(
+            1, segmentation_info.proposedWindowSize // 2
+        )
+        segmentation_info.segmentTimeout = min(
+            2 * segmentation_info.segmentTimeout, self.maxSegmentTimeout
+        )
+
+        if _debug:
+            ApplicationServiceAccessPoint._debug("segments_lost %r", segmentation_info)
+
+    async def request_segments(self, pdus: List[PDU]) -> None:
+        """
+        The segments of a window are already encoded, send them down the
+        stack one after the other.
+        """
+        if _debug:
+            ApplicationServiceAccessPoint._debug("request_segments %r", pdus)
+
+        for pdu in pdus:
+            await Client.request(self, pdu)
+
     async def confirmation(self, pdu: PDU) -> None:
         """
         Packets coming up the stack are PDUs.  First decode them as one
@@ -1619,17 +2207,13 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         # confirmed requests need a ServerSSM
         if isinstance(apdu, ConfirmedRequestPDU):
             # find duplicates of this request
-            for tr in self.serverTransactions:
-                if (apdu.apduInvokeID == tr.invokeID) and (
-                    apdu.pduSource == tr.pdu_address
-                ):
-                    break
-            else:
+            tr = self.serverTransactions.get(apdu.pduSource, apdu.apduInvokeID)
+            if tr is None:
                 # build a server transaction
                 tr = ServerSSM(self, apdu.pduSource)
 
                 # add it to our transactions to track it
-                self.serverTransactions.append(tr)
+                self.serverTransactions.add(tr, apdu.apduInvokeID)
 
             # let it run with the apdu
             await tr.indication(apdu)
@@ -1637,7 +2221,7 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         elif isinstance(apdu, UnconfirmedRequestPDU):
             # decode this now, the APDU is complete
             try:
-                apdu = APCISequence.decode(apdu)
+                apdu = APCISequence.decode(apdu, lazy=self.lazyDecoding)
                 if _debug:
                     ApplicationServiceAccessPoint._debug("    - apdu: %r", apdu)
             except AttributeError as err:
@@ -1657,12 +2241,8 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
             or isinstance(apdu, RejectPDU)
         ):
             # find the client transaction this is acking
-            for tr in self.clientTransactions:
-                if (apdu.apduInvokeID == tr.invokeID) and (
-                    apdu.pduSource == tr.pdu_address
-                ):
-                    break
-            else:
+            tr = self.clientTransactions.get(apdu.pduSource, apdu.apduInvokeID)
+            if tr is None:
                 return
 
             # send the packet on to the transaction
@@ -1671,23 +2251,15 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         elif isinstance(apdu, AbortPDU):
             # find the transaction being aborted
             if apdu.apduSrv:
-                for tr in self.clientTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.clientTransactions.get(apdu.pduSource, apdu.apduInvokeID)
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
                 await tr.confirmation(apdu)
             else:
-                for tr in self.serverTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.serverTransactions.get(apdu.pduSource, apdu.apduInvokeID)
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
@@ -1696,23 +2268,15 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
         elif isinstance(apdu, SegmentAckPDU):
             # find the transaction being aborted
             if apdu.apduSrv:
-                for tr in self.clientTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.clientTransactions.get(apdu.pduSource, apdu.apduInvokeID)
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
                 await tr.confirmation(apdu)
             else:
-                for tr in self.serverTransactions:
-                    if (apdu.apduInvokeID == tr.invokeID) and (
-                        apdu.pduSource == tr.pdu_address
-                    ):
-                        break
-                else:
+                tr = self.serverTransactions.get(apdu.pduSource, apdu.apduInvokeID)
+                if tr is None:
                     return
 
                 # send the packet on to the transaction
@@ -1783,7 +2347,7 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
                 )
 
             # add it to our transactions to track it
-            self.clientTransactions.append(tr)
+            self.clientTransactions.add(tr, apdu.apduInvokeID)
 
             # let it run
             await tr.indication(apdu)
@@ -1856,12 +2420,8 @@ class ApplicationServiceAccessPoint(Client[PDU], ServiceAccessPoint):
                     ApplicationServiceAccessPoint._debug("    - encoded apdu: %r", apdu)
 
             # find the appropriate server transaction
-            for tr in self.serverTransactions:
-                if (apdu.apduInvokeID == tr.invokeID) and (
-                    apdu.pduDestination == tr.pdu_address
-                ):
-                    break
-            else:
+            tr = self.serverTransactions.get(apdu.pduDestination, apdu.apduInvokeID)
+            if tr is None:
                 return
 
             # pass control to the transaction
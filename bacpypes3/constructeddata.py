@@ -11,7 +11,7 @@ import inspect
 import sys
 from functools import partial
 from typing import Any as _Any
-from typing import Callable, Dict, FrozenSet
+from typing import Callable, Dict, FrozenSet, Iterator
 from typing import List as _List
 from typing import Optional, Set, TextIO, Tuple, Union, cast, get_type_hints
 
@@ -49,6 +49,68 @@ _list_type_signatures: Dict[FrozenSet[Tuple[str, _Any]], type] = {}
 _list_of_classes: Set[type] = set()
 
 
+# kinds of codec steps, see _CodecStep
+_STEP_LIST = 0  # Choice or ExtendedList, decoded unconditionally
+_STEP_ATOMIC = 1  # Atomic, decoded if the application tag matches
+_STEP_OTHER = 2  # some other element, decoded if it can be
+
+
+class _CodecStep:
+    """
+    One element of the codec plan of a Sequence subclass, the things about
+    the element that do not change from one message to the next.  The
+    get_attribute and set_attribute functions are None when the element
+    uses the ElementInterface defaults, which just get and set the value.
+    """
+
+    __slots__ = (
+        "attr",
+        "element",
+        "optional",
+        "context",
+        "kind",
+        "app_tags",
+        "get_attribute",
+        "set_attribute",
+    )
+
+    def __init__(self, attr: str, element: type) -> None:
+        self.attr = attr
+        self.element = element
+        self.optional = element._optional
+        self.context = element._context
+
+        if issubclass(element, (Choice, ExtendedList)):
+            self.kind = _STEP_LIST
+        elif issubclass(element, Atomic):
+            self.kind = _STEP_ATOMIC
+        else:
+            self.kind = _STEP_OTHER
+
+        # application tag numbers that can be decoded as this element
+        self.app_tags = frozenset(
+            tag_number
+            for tag_number, tag_class in enumerate(Tag._app_tag_class)
+            if tag_class and issubclass(element, tag_class)
+        )
+
+        if element.get_attribute.__func__ is _default_get_attribute:
+            self.get_attribute = None
+        else:
+            self.get_attribute = element.get_attribute
+        if element.set_attribute.__func__ is _default_set_attribute:
+            self.set_attribute = None
+        else:
+            self.set_attribute = element.set_attribute
+
+    def __repr__(self) -> str:
+        return f"<_CodecStep {self.attr}>"
+
+
+_default_get_attribute = ElementInterface.get_attribute.__func__
+_default_set_attribute = ElementInterface.set_attribute.__func__
+
+
 @bacpypes_debugging
 class SequenceMetaclass(ElementMetaclass):
     """
@@ -301,15 +363,13 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
             super().__setattr__(attr, value)
 
         # clear out the rest of the elements
+        property_elements = self._property_elements()
         for attr in elements:
-            try:
-                # guard agaist elements defined as a property
-                if isinstance(inspect.getattr_static(self, attr), property):
-                    if _debug:
-                        Sequence._debug(f"    - {attr} is a property")
-                    continue
-            except AttributeError:
-                pass
+            # guard agaist elements defined as a property
+            if attr in property_elements:
+                if _debug:
+                    Sequence._debug(f"    - {attr} is a property")
+                continue
 
             super().__setattr__(attr, None)
             if _debug:
@@ -401,18 +461,21 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
         if self._context is not None:
             tag_list.append(OpeningTag(self._context))
 
-        for attr in self._order:
-            element = self._elements[attr]
+        for step in self._codec_plan():
+            attr = step.attr
 
             # ask the element to get the value
-            getattr_fn = partial(super().__getattribute__, attr)
-            value = element.get_attribute(getter=getattr_fn)
+            if step.get_attribute is None:
+                value = object.__getattribute__(self, attr)
+            else:
+                getattr_fn = partial(super().__getattribute__, attr)
+                value = step.get_attribute(getter=getattr_fn)
             if _debug:
-                Sequence._debug(f"    - {attr}, {element}: {value}")
+                Sequence._debug(f"    - {attr}, {step.element}: {value}")
 
             # check for optional elements
             if value is None:
-                if not element._optional:
+                if not step.optional:
                     raise AttributeError(
                         f"{attr} is a required element of {self.__class__.__name__}"
                     )
@@ -460,64 +523,121 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
         # result is an instance of a subclass of Sequence
         result = cls()
 
+        # values of the decoded elements can be saved directly when nothing
+        # is going to intercept them
+        direct = cls.__setattr__ is Sequence.__setattr__
+
         # look for the elements in order
-        for attr in cls._order:
-            element = cls._elements[attr]
+        for step, value in cls._decode_elements(tag_list, tag):
+            attr = step.attr
+            if _debug:
+                Sequence._debug(f"    - {attr}, {step.element} := {value}")
+
+            if direct and (step.set_attribute is None) and (type(value) is step.element):
+                object.__setattr__(result, attr, value)
+                continue
+
+            # ask the element to set the value
+            getattr_fn = partial(result.__getattribute__, attr)
+            setattr_fn = partial(result.__setattr__, attr)
+            step.element.set_attribute(
+                getter=getattr_fn,
+                setter=setattr_fn,
+                value=value,
+            )
+
+        # if this is context encoded, check and consume the closing tag
+        if cls._context is not None:
+            tag = tag_list.peek()
+            if (not tag) or (tag.tag_class != TagClass.closing):
+                raise InvalidTag(f"closing tag {cls._context} expected")
+            if tag.tag_number != cls._context:
+                raise InvalidTag("mismatched context")
+            tag_list.pop()
+
+        # return the sequence
+        return result
+
+    @classmethod
+    def _property_elements(cls) -> FrozenSet[str]:
+        """
+        Return the names of the elements that are defined as properties.  This
+        is built the first time an instance of the class is created.
+        """
+        property_elements = cls.__dict__.get("_property_element_names")
+        if property_elements is None:
+            property_elements = frozenset(
+                attr
+                for attr in cls._elements
+                if isinstance(inspect.getattr_static(cls, attr, None), property)
+            )
+            cls._property_element_names = property_elements
+
+        return property_elements
+
+    @classmethod
+    def _codec_plan(cls) -> Tuple[_CodecStep, ...]:
+        """
+        Return the codec plan of the class, the steps for encoding and
+        decoding the elements in order.  This is built the first time the
+        class is encoded or decoded.
+        """
+        plan = cls.__dict__.get("_codec_steps")
+        if plan is None:
+            if not cls._order:
+                raise RuntimeError("sequences must be ordered")
+            plan = tuple(_CodecStep(attr, cls._elements[attr]) for attr in cls._order)
+            if _debug:
+                Sequence._debug("(%s)._codec_plan %r", cls.__name__, plan)
+            cls._codec_steps = plan
+
+        return plan
+
+    @classmethod
+    def _decode_elements(
+        cls, tag_list: TagList, tag: Optional[Tag]
+    ) -> Iterator[Tuple[_CodecStep, _Any]]:
+        """Decode the elements of the sequence in order from the tag list,
+        generating (step, value) for each one that is present."""
+        for step in cls._codec_plan():
+            element = step.element
             if _debug:
                 Sequence._debug(
-                    "    - attr, element, tag: %r, %r, %r", attr, element, tag
+                    "    - attr, element, tag: %r, %r, %r", step.attr, element, tag
                 )
 
-            value: _Any = None
-
             # no tag or closing tag is the end of the encoded elements in
             # this sequence so all of the rest of the elements must be optional
             if (not tag) or (tag.tag_class == TagClass.closing):
-                if not element._optional:
+                if not step.optional:
                     raise AttributeError(
-                        f"{attr} is a required element of {cls.__name__}"
+                        f"{step.attr} is a required element of {cls.__name__}"
                     )
                 else:
                     continue
 
-            # check for a choice of somethings
-            if issubclass(element, Choice):
+            # check for a choice of somethings or a sequence of something else
+            if step.kind == _STEP_LIST:
                 value = element.decode(tag_list)
-                tag = tag_list.peek()
-                if _debug:
-                    Sequence._debug("    - next tag: %r", tag)
-
-            # check for a sequence of something else
-            elif issubclass(element, ExtendedList):
-                value = element.decode(tag_list)
-                tag = tag_list.peek()
-                if _debug:
-                    Sequence._debug("    - next tag: %r", tag)
 
             # check for a specific context
             elif tag.tag_class == TagClass.context or tag.tag_class == TagClass.opening:
-                if tag.tag_number == element._context:
+                if tag.tag_number == step.context:
                     value = element.decode(tag_list)
-                    tag = tag_list.peek()
-                    if _debug:
-                        Sequence._debug("    - next tag: %r", tag)
-                elif not element._optional:
+                elif not step.optional:
                     raise AttributeError(
-                        f"{attr} is a context tagged {element._context} required element of {cls.__name__}"
+                        f"{step.attr} is a context tagged {step.context} required element of {cls.__name__}"
                     )
                 else:
                     continue
 
             # application encoded atomic value
-            elif issubclass(element, Atomic):
-                if issubclass(element, Tag._app_tag_class[tag.tag_number]):
+            elif step.kind == _STEP_ATOMIC:
+                if tag.tag_number in step.app_tags:
                     value = element.decode(tag_list)
-                    tag = tag_list.peek()
-                    if _debug:
-                        Sequence._debug("    - next tag: %r", tag)
-                elif not element._optional:
+                elif not step.optional:
                     raise AttributeError(
-                        f"{attr} is an application tagged required element of {cls.__name__}"
+                        f"{step.attr} is an application tagged required element of {cls.__name__}"
                     )
                 else:
                     continue
@@ -526,38 +646,18 @@ class Sequence(Element, DebugContents, metaclass=SequenceMetaclass):
                     if _debug:
                         Sequence._debug("    - generic decode: %r", element)
                     value = element.decode(tag_list)
-                    tag = tag_list.peek()
-                    if _debug:
-                        Sequence._debug("    - next tag: %r", tag)
                 except InvalidTag:
-                    if not element._optional:
+                    if not step.optional:
                         raise AttributeError(
-                            f"{attr} is a required element of {cls.__name__}"
+                            f"{step.attr} is a required element of {cls.__name__}"
                         )
                     continue
 
+            tag = tag_list.peek()
             if _debug:
-                Sequence._debug(f"    - {attr}, {element} := {value}")
-
-            # ask the element to set the value
-            getattr_fn = partial(result.__getattribute__, attr)
-            setattr_fn = partial(result.__setattr__, attr)
-            element.set_attribute(
-                getter=getattr_fn,
-                setter=setattr_fn,
-                value=value,
-            )
-
-        # if this is context encoded, check and consume the closing tag
-        if cls._context is not None:
-            if (not tag) or (tag.tag_class != TagClass.closing):
-                raise InvalidTag(f"closing tag {cls._context} expected")
-            if tag.tag_number != cls._context:
-                raise InvalidTag("mismatched context")
-            tag_list.pop()
+                Sequence._debug("    - next tag: %r", tag)
 
-        # return the sequence
-        return result
+            yield step, value
 
     def __eq__(self, other: _Any) -> bool:
         """Compare two sequences for equality."""
@@ -784,9 +884,7 @@ class Choice(Sequence):
                     value = element.decode(tag_list_copy)
 
                     # delete from this list the tags that were consumed
-                    del tag_list.tagList[
-                        : len(tag_list.tagList) - len(tag_list_copy.tagList)
-                    ]
+                    tag_list.skip(len(tag_list) - len(tag_list_copy))
                 except (AttributeError, InvalidTag):
                     continue
 
@@ -1011,10 +1109,17 @@ class ExtendedList(list, ElementInterface, metaclass=ExtendedListMetaclass):  #
         if self._context is not None:
             tag_list.append(OpeningTag(self._context))
 
-        # loop through the items
-        for item in self:
-            # append the encoded element
-            tag_list.extend(item.encode())
+        # atomic values might be encoded all at once
+        tags = None
+        if issubclass(self._subtype, Atomic):
+            tags = self._subtype.encode_app_tags(self)
+        if tags is not None:
+            tag_list.extend(tags)
+        else:
+            # loop through the items
+            for item in self:
+                # append the encoded element
+                tag_list.extend(item.encode())
 
         # maybe context tagged
         if self._context is not None:
@@ -1047,8 +1152,12 @@ class ExtendedList(list, ElementInterface, metaclass=ExtendedListMetaclass):  #
             tag_list.pop()
             tag = tag_list.peek()
 
-        # result is an instance of an extended list
+        # result is an instance of an extended list, atomic values might be
+        # decoded all at once
         list_elements = []
+        if issubclass(cls._subtype, Atomic):
+            list_elements.extend(cls._subtype.decode_app_tags(tag_list))
+            tag = tag_list.peek()
 
         # look for a matching element
         while tag:
@@ -1072,9 +1181,7 @@ class ExtendedList(list, ElementInterface, metaclass=ExtendedListMetaclass):  #
                     ExtendedList._debug("    - value: %r", value)
 
                 # delete from this list the tags that were consumed
-                del tag_list.tagList[
-                    : len(tag_list.tagList) - len(tag_list_copy.tagList)
-                ]
+                tag_list.skip(len(tag_list) - len(tag_list_copy))
             except (AttributeError, InvalidTag):
                 break
 
@@ -1664,8 +1771,8 @@ class Any(Element):
         # look for the matching closing tag
         i = 1
         lvl = 0
-        while i < len(tag_list.tagList):
-            tag = tag_list.tagList[i]
+        while i < len(tag_list):
+            tag = tag_list[i]
             if tag.tag_class == TagClass.opening:
                 lvl += 1
             elif tag.tag_class == TagClass.closing:
@@ -1681,8 +1788,7 @@ class Any(Element):
             raise InvalidTag("mismatched open/close tags")
 
         # result is the list of tags
-        value = TagList(tag_list.tagList[: i + 1])
-        del tag_list.tagList[: i + 1]
+        value = tag_list._view(i + 1)
 
         return cls(value)
 
@@ -1717,8 +1823,22 @@ class Any(Element):
         if _debug:
             Any._debug("cast_out %r null=%r", cls.__name__, null)
 
+        # a single application tagged atomic value skips the tag list
+        if (
+            (self._context is None)
+            and (self.tagList is not None)
+            and (len(self.tagList) == 1)
+            and isinstance(cls, type)
+            and issubclass(cls, Atomic)
+        ):
+            result = cls.decode_app_tag(self.tagList[0])
+            if result is not None:
+                if _debug:
+                    Any._debug("    - fast decode: %r", result)
+                return result
+
         # make a copy of the tag list so this is non-destructive
-        tag_list = TagList(self.tagList[:])
+        tag_list = TagList(self.tagList)
 
         # look ahead for elements
         tag: Optional[Tag] = tag_list.peek()
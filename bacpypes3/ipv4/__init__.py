@@ -50,7 +50,9 @@ class IPv4DatagramProtocol(asyncio.DatagramProtocol):
         if _debug:
             IPv4DatagramProtocol._debug("datagram_received %r %r", data, addr)
 
-        pdu = PDU(data, source=IPv4Address(addr), destination=self.destination)
+        pdu = PDU(
+            data, source=IPv4Address.from_tuple(addr), destination=self.destination
+        )
         asyncio.ensure_future(self.server.confirmation(pdu))
 
     def error_received(self, exc: Exception) -> None:
@@ -104,7 +104,7 @@ class LPCI(PCI, DebugContents):
         lpci.bvlciFunction = pdu.get()
         lpci.bvlciLength = pdu.get_short()
 
-        if lpci.bvlciLength != len(pdu.pduData) + 4:
+        if lpci.bvlciLength != pdu.remaining() + 4:
             raise DecodingError("invalid LPCI length")
 
         return lpci
@@ -422,7 +422,7 @@ class WriteBroadcastDistributionTable(LPDU):
 
         lpdu = WriteBroadcastDistributionTable()
         lpdu.bvlciBDT = []
-        while pdu.pduData:
+        while pdu.remaining():
             addr = socket.inet_ntoa(pdu.get_data(4))
             port = pdu.get_short()
             mask = _count_set_bits(pdu.get_long())
@@ -518,7 +518,7 @@ class ReadBroadcastDistributionTableAck(LPDU):
 
         lpdu = ReadBroadcastDistributionTableAck()
         lpdu.bvlciBDT = []
-        while pdu.pduData:
+        while pdu.remaining():
             addr = socket.inet_ntoa(pdu.get_data(4))
             port = pdu.get_short()
             mask = _count_set_bits(pdu.get_long())
@@ -581,7 +581,7 @@ class ForwardedNPDU(LPDU):
             ForwardedNPDU._debug("decode %r", pdu)
 
         addr = IPv4Address(pdu.get_data(6))
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return ForwardedNPDU(addr, data)
 
@@ -730,7 +730,7 @@ class ReadForeignDeviceTableAck(LPDU):
 
         lpdu = ReadForeignDeviceTableAck()
         lpdu.bvlciFDT = []
-        while pdu.pduData:
+        while pdu.remaining():
             fdte = FDTEntry()
             fdte.fdAddress = IPv4Address(pdu.get_data(6))
             fdte.fdTTL = pdu.get_short()
@@ -837,7 +837,7 @@ class DistributeBroadcastToNetwork(LPDU):
         if _debug:
             DistributeBroadcastToNetwork._debug("decode %r", pdu)
 
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return DistributeBroadcastToNetwork(data)
 
@@ -895,7 +895,7 @@ class OriginalUnicastNPDU(LPDU):
         if _debug:
             OriginalUnicastNPDU._debug("decode %r", pdu)
 
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return OriginalUnicastNPDU(data)
 
@@ -953,7 +953,7 @@ class OriginalBroadcastNPDU(LPDU):
         if _debug:
             OriginalBroadcastNPDU._debug("decode %r", pdu)
 
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return OriginalBroadcastNPDU(data)
 
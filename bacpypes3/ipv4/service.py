@@ -6,9 +6,10 @@ from __future__ import annotations
 
 import asyncio
 from asyncio.exceptions import TimeoutError
-from typing import Callable, Dict, List, Optional, cast
+from typing import Callable, Dict, List, Optional, Union, cast
 
 from ..debugging import ModuleLogger, DebugContents, bacpypes_debugging
+from ..timer import COARSE_RESOLUTION, Timer, get_timer_wheel
 from ..comm import Client, Server, ServiceAccessPoint, ApplicationServiceElement
 from ..pdu import Address, LocalBroadcast, IPv4Address, PDU
 
@@ -853,7 +854,7 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
     bbmdBDT: List[IPv4Address]
     bbmdFDT: List[FDTEntry]
 
-    _fdt_clock_handle: asyncio.Handle
+    _fdt_clock_handle: Union[asyncio.Handle, Timer]
 
     def __init__(self, addr: IPv4Address, **kwargs):
         if _debug:
@@ -1210,7 +1211,12 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
                 del self.bbmdFDT[i]
 
         # again, again!
-        self._fdt_clock_handle = asyncio.get_event_loop().call_later(1, self.fdt_clock)
+        if isinstance(self._fdt_clock_handle, Timer):
+            self._fdt_clock_handle.restart(1)
+        else:
+            self._fdt_clock_handle = get_timer_wheel(COARSE_RESOLUTION).call_later(
+                1, self.fdt_clock
+            )
 
     def add_peer(self, addr: IPv4Address) -> None:
         if _debug:
@@ -103,7 +103,7 @@ class LPCI(PCI, DebugContents):
         lpci.bvlciFunction = pdu.get()
         lpci.bvlciLength = pdu.get_short()
 
-        if lpci.bvlciLength != len(pdu.pduData) + 4:
+        if lpci.bvlciLength != pdu.remaining() + 4:
             raise DecodingError("invalid LPCI length")
 
         return lpci
@@ -434,7 +434,7 @@ class OriginalUnicastNPDU(LPDU):
 
         source_virtual_address = VirtualAddress(pdu.get_data(3))
         destination_virtual_address = VirtualAddress(pdu.get_data(3))
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return OriginalUnicastNPDU(
             source_virtual_address, destination_virtual_address, data
@@ -498,7 +498,7 @@ class OriginalBroadcastNPDU(LPDU):
             OriginalBroadcastNPDU._debug("decode %r", pdu)
 
         source_virtual_address = VirtualAddress(pdu.get_data(3))
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return OriginalBroadcastNPDU(source_virtual_address, data)
 
@@ -921,7 +921,7 @@ class ForwardedNPDU(LPDU):
 
         source_virtual_address = VirtualAddress(pdu.get_data(3))
         source_ipv6_address = IPv6Address(pdu.get_data(18))
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return ForwardedNPDU(source_virtual_address, source_ipv6_address, data)
 
@@ -1133,7 +1133,7 @@ class DistributeBroadcastToNetwork(LPDU):
             DistributeBroadcastToNetwork._debug("decode %r", pdu)
 
         source_virtual_address = VirtualAddress(pdu.get_data(3))
-        data = pdu.get_data(len(pdu.pduData))
+        data = pdu.get_data(pdu.remaining())
 
         return DistributeBroadcastToNetwork(source_virtual_address, data)
 
@@ -9,6 +9,7 @@ from functools import partial
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
 from ..debugging import ModuleLogger, DebugContents, bacpypes_debugging
+from ..timer import COARSE_RESOLUTION, Timer, get_timer_wheel
 
 from ..comm import Client, Server, ServiceAccessPoint, ApplicationServiceElement
 from ..pdu import Address, LocalBroadcast, IPv6Address, VirtualAddress, PDU
@@ -953,7 +954,7 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
     bbmdBDT: List[IPv6Address]
     bbmdFDT: List[FDTEntry]
 
-    _fdt_clock_handle: asyncio.TimerHandle
+    _fdt_clock_handle: Union[asyncio.Handle, Timer]
 
     def __init__(self, bbmd_address: IPv6Address, **kwargs):
         if _debug:
@@ -1505,7 +1506,12 @@ class BIPBBMD(BVLLServiceAccessPoint, DebugContents):
                 del self.bbmdFDT[i]
 
         # again, again!
-        self._fdt_clock_handle = asyncio.get_event_loop().call_later(1, self.fdt_clock)
+        if isinstance(self._fdt_clock_handle, Timer):
+            self._fdt_clock_handle.restart(1)
+        else:
+            self._fdt_clock_handle = get_timer_wheel(COARSE_RESOLUTION).call_later(
+                1, self.fdt_clock
+            )
 
     def add_peer(self, addr: IPv6Address) -> None:
         if _debug:
@@ -3,3 +3,4 @@
 #
 
 from . import batchread
+from . import pollscheduler
@@ -6,29 +6,124 @@ from __future__ import annotations
 
 import asyncio
 
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from functools import partial
 
-from typing import Any, Callable, Dict, DefaultDict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    DefaultDict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ..debugging import bacpypes_debugging, ModuleLogger
 
 from ..pdu import Address
-from ..primitivedata import ObjectIdentifier
+from ..primitivedata import (
+    BitString,
+    Boolean,
+    CharacterString,
+    Date,
+    Double,
+    Enumerated,
+    Null,
+    ObjectIdentifier,
+    OctetString,
+    Real,
+    Time,
+    Unsigned,
+)
+from ..constructeddata import Array, ExtendedList
 from ..basetypes import (
     ObjectType,
     PropertyIdentifier,
     PropertyReference,
+    Segmentation,
     ServicesSupported,
 )
-from ..apdu import ErrorRejectAbortNack
-from ..app import Application
+from ..apdu import AbortPDU, AbortReason, ErrorRejectAbortNack, RejectPDU
+from ..app import Application, DeviceInfo
+from ..vendor import get_vendor_info
 
 
 # some debugging
 _debug = 0
 _log = ModuleLogger(globals())
 
+# encoded sizes used to estimate how many property references fit in a Read
+# Property Multiple request and its response, the header of a confirmed
+# request and a segmented complex ack, and an object identifier with the
+# opening and closing tags of its list of references or results
+_request_header_size = 4
+_response_header_size = 5
+_object_size = 7
+
+# the encoded size of a property value by datatype, the sizes of strings and
+# constructed values are a guess, and the size of a property access error
+_value_sizes: List[Tuple[type, int]] = [
+    (Null, 1),
+    (Boolean, 1),
+    (Double, 10),
+    (Real, 5),
+    (Enumerated, 3),
+    (Unsigned, 5),
+    (ObjectIdentifier, 5),
+    (Date, 5),
+    (Time, 5),
+    (BitString, 5),
+    (CharacterString, 34),
+    (OctetString, 34),
+    (ExtendedList, 128),
+]
+_default_value_size = 24
+_error_size = 8
+
+# leave room for the guesses being too small
+_size_margin = 0.9
+
+# a Read Property Multiple request that is aborted for one of these reasons, or
+# rejected, is split in half and tried again
+_retry_smaller_abort_reasons = (
+    AbortReason.other,
+    AbortReason.bufferOverflow,
+    AbortReason.segmentationNotSupported,
+    AbortReason.outOfResources,
+    AbortReason.apduTooLong,
+)
+
+
+def _tag_size(value: int) -> int:
+    """Return the size of a context tag encoding an unsigned value."""
+    if value < 0x100:
+        return 2
+    if value < 0x10000:
+        return 3
+    if value < 0x1000000:
+        return 4
+    return 5
+
+
+def estimate_value_size(datatype: Optional[type]) -> int:
+    """
+    Return a guess at the size of a property value of the datatype as it
+    would be encoded in a response, but no smaller than an error.
+    """
+    if datatype is not None:
+        for value_class, value_size in _value_sizes:
+            if issubclass(datatype, value_class):
+                return max(value_size, _error_size)
+
+    return _default_value_size
+
 
 @dataclass(eq=True, order=True, frozen=True)
 class DeviceAddressObjectPropertyReference:
@@ -89,6 +184,26 @@ class DeviceAddressObjectPropertyReference:
 
 DeviceAddressObjectPropertyReferenceList = List[DeviceAddressObjectPropertyReference]
 
+
+@dataclass
+class ReadMetadata:
+    """
+    Information about how the value of a property was read, the service
+    and number of the request in the batch (None if nothing was sent), how
+    many references were in the request, how many times the reference was in
+    a request that had to be split and tried again, and how long the request
+    took in seconds.
+    """
+
+    address: Address
+    service: Optional[str] = None
+    request_id: Optional[int] = None
+    request_size: int = 0
+    retries: int = 0
+    start_time: float = 0.0
+    latency: Optional[float] = None
+
+
 AddressGroupDefaultDict = DefaultDict[Address, DeviceAddressObjectPropertyReferenceList]
 
 
@@ -121,6 +236,53 @@ class NetworkGroup(NetworkGroupDefaultDict):
         super().__init__(AddressGroup, arg, **kwargs)
 
 
+ChunkEntry = Tuple[DeviceAddressObjectPropertyReferenceList, int]
+
+
+class ChunkQueue:
+    """
+    The chunks of references to an address waiting to be read and the number
+    of times they have been split.  A chunk that is being read might be split
+    and put back, so the queue is only finished when it is empty and none of
+    the chunks are in flight.
+    """
+
+    chunks: Deque[ChunkEntry]
+    in_flight: int
+
+    def __init__(self, chunk_list: List[DeviceAddressObjectPropertyReferenceList]):
+        self.chunks = deque((chunk, 0) for chunk in chunk_list)
+        self.in_flight = 0
+        self._changed = asyncio.Event()
+
+    async def get(self) -> Optional[ChunkEntry]:
+        """
+        Return the next chunk, waiting for the ones in flight to be done or
+        put back, or None when there are no more.
+        """
+        while not self.chunks:
+            if not self.in_flight:
+                return None
+            self._changed.clear()
+            await self._changed.wait()
+
+        self.in_flight += 1
+        return self.chunks.popleft()
+
+    def put(self, chunk_list: List[ChunkEntry]) -> None:
+        """Put chunks back at the front of the queue, in order."""
+        self.chunks.extendleft(reversed(chunk_list))
+        self._changed.set()
+
+    def done(self) -> None:
+        """A chunk from get() has been read, put back, or abandoned."""
+        self.in_flight -= 1
+        self._changed.set()
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+
 @bacpypes_debugging
 class AddressGroupWorker:
     """
@@ -167,9 +329,12 @@ class AddressGroupWorker:
             if _debug:
                 AddressGroupWorker._debug("    - i_ams: %r", i_ams)
             if not i_ams:
-                if batch.callback:
-                    for daopr in self.daopr_list:
-                        batch.callback(daopr.key, RuntimeError("no response"))
+                for daopr in self.daopr_list:
+                    batch._deliver(
+                        daopr.key,
+                        RuntimeError("no response"),
+                        ReadMetadata(self.address),
+                    )
                 return
             if len(i_ams) > 1:
                 if _debug:
@@ -201,118 +366,391 @@ class AddressGroupWorker:
 
         # try to use RPM if its available
         if device_info.protocol_services_supported["read-property-multiple"]:
-            await self.read_property_multiple(batch)
+            await self.read_property_multiple(batch, device_info)
         else:
             await self.read_property(batch)
 
-    async def read_property(self, batch: BatchRead) -> None:
-        if _debug:
-            AddressGroupWorker._debug("read_property(%s)", self.address)
+    def size_limits(
+        self, batch: BatchRead, device_info: Optional[DeviceInfo]
+    ) -> Tuple[int, int]:
+        """
+        Return the largest request the device can receive and the largest
+        response it can send back, with segmentation if both sides support it.
+        """
+        app = batch.app
+        assert app is not None
 
-        # get the running loop to create tasks
-        loop = asyncio.get_running_loop()
+        # local device object provides these or the SAP provides defaults
+        max_apdu_length_accepted = getattr(
+            app.device_object, "maxApduLengthAccepted", app.asap.maxApduLengthAccepted
+        )
+        segmentation_supported = getattr(
+            app.device_object, "segmentationSupported", app.asap.segmentationSupported
+        )
+        max_segments_accepted = getattr(
+            app.device_object, "maxSegmentsAccepted", app.asap.maxSegmentsAccepted
+        )
 
-        for daopr in self.daopr_list:
-            if batch._stop.is_set():
-                if _debug:
-                    AddressGroupWorker._debug("    - all stop")
-                break
+        if (not device_info) or (device_info.max_apdu_length_accepted is None):
+            max_request_size = max_apdu_length_accepted
+            max_response_size = max_apdu_length_accepted
+        else:
+            max_request_size = device_info.max_apdu_length_accepted
+            max_response_size = min(
+                max_apdu_length_accepted, device_info.max_apdu_length_accepted
+            )
 
-            # task to read the value
-            read_task = loop.create_task(
-                batch.app.read_property(  # type: ignore[union-attr]
-                    daopr.deviceAddress,
-                    daopr.objectIdentifier,
-                    daopr.propertyReference.propertyIdentifier,
-                    daopr.propertyReference.propertyArrayIndex,
-                ),
-                name=f"reading {daopr.key}",
+        # the response can be segmented
+        if (
+            device_info
+            and (
+                device_info.segmentation_supported
+                in (Segmentation.segmentedTransmit, Segmentation.segmentedBoth)
             )
-            read_task.add_done_callback(
-                partial(batch._read_property_callback, daopr.key)
+            and (
+                segmentation_supported
+                in (Segmentation.segmentedReceive, Segmentation.segmentedBoth)
             )
+        ):
+            max_response_size = (max_response_size - _response_header_size) * (
+                max_segments_accepted or 64
+            ) + _response_header_size
 
-            # task for the batch being stopped
-            stop_wait = loop.create_task(batch._stop.wait(), name="stop wait")
+        return (max_request_size, max_response_size)
 
-            # wait for one of them to complete
-            done, pending = await asyncio.wait(
-                {read_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED
+    def chunk_list(
+        self, batch: BatchRead, device_info: Optional[DeviceInfo]
+    ) -> List[DeviceAddressObjectPropertyReferenceList]:
+        """
+        Pack the references into chunks that are each small enough to be
+        read with one Read Property Multiple request.
+        """
+        max_request_size, max_response_size = self.size_limits(batch, device_info)
+        max_request_size = int(max_request_size * _size_margin)
+        max_response_size = int(max_response_size * _size_margin)
+        if _debug:
+            AddressGroupWorker._debug(
+                "    - size limits: %r, %r", max_request_size, max_response_size
             )
 
-            # cancel the pending task(s)
-            for task in pending:
-                task.cancel()
-            if _debug:
-                AddressGroupWorker._debug("    - %r finished", daopr)
+        # the device might have failed with larger chunks before
+        chunk_limit = device_info.rpm_chunk_size if device_info else None
+
+        # the vendor information has the property datatypes
+        vendor_info = get_vendor_info(
+            device_info.vendor_identifier if device_info else 0
+        )
+
+        chunk_list: List[DeviceAddressObjectPropertyReferenceList] = []
+        chunk: DeviceAddressObjectPropertyReferenceList = []
+        objid = None
+        object_class = None
+        request_size = response_size = 0
+
+        for daopr in self.daopr_list:
+            request_delta = response_delta = 0
+
+            if daopr.objectIdentifier != objid:
+                object_class = vendor_info.get_object_class(
+                    daopr.objectIdentifier[0]
+                )
+                request_delta += _object_size
+                response_delta += _object_size
+
+            # the property identifier and maybe array index
+            property_identifier = daopr.propertyReference.propertyIdentifier
+            property_array_index = daopr.propertyReference.propertyArrayIndex
+            reference_size = _tag_size(property_identifier)
+            if property_array_index is not None:
+                reference_size += _tag_size(property_array_index)
+            request_delta += reference_size
+
+            # the result has the reference, the value in opening and closing
+            # tags, and the value could be an array element
+            datatype = None
+            if object_class:
+                datatype = object_class.get_property_type(property_identifier)
+                if (
+                    datatype
+                    and issubclass(datatype, Array)
+                    and (property_array_index is not None)
+                ):
+                    if property_array_index == 0:
+                        datatype = Unsigned
+                    else:
+                        datatype = datatype._subtype
+            response_delta += reference_size + 2 + estimate_value_size(datatype)
+
+            # start a new chunk if this doesn't fit
+            if chunk and (
+                (chunk_limit and (len(chunk) >= chunk_limit))
+                or (
+                    _request_header_size + request_size + request_delta
+                    > max_request_size
+                )
+                or (
+                    _response_header_size + response_size + response_delta
+                    > max_response_size
+                )
+            ):
+                chunk_list.append(chunk)
+                chunk = []
+                request_size = response_size = 0
+                if daopr.objectIdentifier == objid:
+                    request_delta += _object_size
+                    response_delta += _object_size
+
+            chunk.append(daopr)
+            objid = daopr.objectIdentifier
+            request_size += request_delta
+            response_size += response_delta
+
+        if chunk:
+            chunk_list.append(chunk)
+
+        return chunk_list
+
+    async def read_property(self, batch: BatchRead) -> None:
         if _debug:
-            AddressGroupWorker._debug("    - finished(%s)", self.address)
+            AddressGroupWorker._debug("read_property(%s)", self.address)
 
-    async def read_property_multiple(self, batch: BatchRead) -> None:
+        # keep more than one request outstanding if the batch allows it
+        daopr_iter = iter(self.daopr_list)
+        await asyncio.gather(
+            *(
+                self._read_properties(batch, daopr_iter)
+                for _ in range(min(batch.max_outstanding, len(self.daopr_list)))
+            )
+        )
         if _debug:
-            AddressGroupWorker._debug("read_property_multiple(%s)", self.address)
+            AddressGroupWorker._debug("    - finished(%s)", self.address)
 
+    async def _read_properties(
+        self,
+        batch: BatchRead,
+        daopr_iter: Iterator[DeviceAddressObjectPropertyReference],
+    ) -> None:
         # get the running loop to create tasks
         loop = asyncio.get_running_loop()
 
-        ### calc based on device_info.max_apdu_length_accepted // 10
-        chunk_size = 10
+        for daopr in daopr_iter:
+            async with batch.request_slot():
+                if batch._stop.is_set():
+                    if _debug:
+                        AddressGroupWorker._debug("    - all stop")
+                    break
+
+                # task to read the value
+                read_task = loop.create_task(
+                    batch.app.read_property(  # type: ignore[union-attr]
+                        daopr.deviceAddress,
+                        daopr.objectIdentifier,
+                        daopr.propertyReference.propertyIdentifier,
+                        daopr.propertyReference.propertyArrayIndex,
+                    ),
+                    name=f"reading {daopr.key}",
+                )
+                read_task.add_done_callback(
+                    partial(
+                        batch._read_property_callback,
+                        daopr.key,
+                        metadata=batch.read_metadata(self.address, "read-property"),
+                    )
+                )
 
-        i = 0
-        while i < len(self.daopr_list):
-            chunk = self.daopr_list[i:i+chunk_size]
-            if _debug:
-                AddressGroupWorker._debug("    - chunk: %r", chunk)
-            i += chunk_size
-
-            objid = None
-            key_list = []
-            parameter_list = []
-            for daopr in chunk:
-                if daopr.objectIdentifier != objid:
-                    objid = daopr.objectIdentifier
-                    property_reference_list = []
-                    parameter_list.extend([objid, property_reference_list])
-
-                key_list.append(daopr.key)
-                property_reference_list.append(daopr.propertyReference)
+                # wait for it to complete or the batch to be stopped
+                await self.wait_for_task(batch, read_task)
             if _debug:
-                AddressGroupWorker._debug("    - parameter_list: %r", parameter_list)
+                AddressGroupWorker._debug("    - %r finished", daopr)
 
-            # task to read the values
-            read_task = loop.create_task(
-                batch.app.read_property_multiple(  # type: ignore[union-attr]
-                    self.address,
-                    parameter_list,
-                ),
-                name=f"reading {key_list}",
-            )
-            read_task.add_done_callback(
-                partial(batch._read_property_multiple_callback, key_list)
+    async def read_property_multiple(
+        self, batch: BatchRead, device_info: Optional[DeviceInfo] = None
+    ) -> None:
+        if _debug:
+            AddressGroupWorker._debug("read_property_multiple(%s)", self.address)
+
+        # keep more than one request outstanding if the batch allows it, the
+        # chunks that are split go back in the queue for any of them, so
+        # there are workers for the pieces even if there is one chunk to start
+        chunk_queue = ChunkQueue(self.chunk_list(batch, device_info))
+        await asyncio.gather(
+            *(
+                self._read_chunks(batch, device_info, chunk_queue)
+                for _ in range(min(batch.max_outstanding, len(self.daopr_list)))
             )
+        )
+        if _debug:
+            AddressGroupWorker._debug("    - finished(%s)", self.address)
 
-            # task for the batch being stopped
-            stop_wait = loop.create_task(batch._stop.wait(), name="stop wait")
+    async def _read_chunks(
+        self,
+        batch: BatchRead,
+        device_info: Optional[DeviceInfo],
+        chunk_queue: ChunkQueue,
+    ) -> None:
+        # get the running loop to create tasks
+        loop = asyncio.get_running_loop()
 
-            # wait for one of them to complete
-            done, pending = await asyncio.wait(
-                {read_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED
-            )
+        while True:
+            # wait for a chunk, the ones in flight might be split
+            entry = await chunk_queue.get()
+            if entry is None:
+                break
+            chunk, retries = entry
 
-            # cancel the pending task(s)
-            for task in pending:
-                task.cancel()
+            try:
+                async with batch.request_slot():
+                    if batch._stop.is_set():
+                        if _debug:
+                            AddressGroupWorker._debug("    - all stop")
+                        break
+
+                    # the device might have failed with larger chunks before
+                    chunk_limit = device_info.rpm_chunk_size if device_info else None
+                    if chunk_limit and (len(chunk) > chunk_limit):
+                        chunk_queue.put(
+                            [
+                                (chunk[i : i + chunk_limit], retries)
+                                for i in range(chunk_limit, len(chunk), chunk_limit)
+                            ]
+                        )
+                        chunk = chunk[:chunk_limit]
+                    if _debug:
+                        AddressGroupWorker._debug("    - chunk: %r", chunk)
+
+                    objid = None
+                    key_list = []
+                    parameter_list = []
+                    for daopr in chunk:
+                        if daopr.objectIdentifier != objid:
+                            objid = daopr.objectIdentifier
+                            property_reference_list = []
+                            parameter_list.extend([objid, property_reference_list])
+
+                        key_list.append(daopr.key)
+                        property_reference_list.append(daopr.propertyReference)
+                    if _debug:
+                        AddressGroupWorker._debug(
+                            "    - parameter_list: %r", parameter_list
+                        )
+
+                    # task to read the values
+                    metadata = batch.read_metadata(
+                        self.address, "read-property-multiple", len(chunk), retries
+                    )
+                    read_task = loop.create_task(
+                        batch.app.read_property_multiple(  # type: ignore[union-attr]
+                            self.address,
+                            parameter_list,
+                        ),
+                        name=f"reading {key_list}",
+                    )
+
+                    # the results are unknown if the batch is stopped
+                    if not await self.wait_for_task(batch, read_task):
+                        read_task.add_done_callback(
+                            partial(
+                                batch._read_property_multiple_callback,
+                                key_list,
+                                metadata=metadata,
+                            )
+                        )
+                        break
+
+                    # if the chunk was too much for the device split it in half
+                    if read_task.cancelled() or not self.retry_smaller(
+                        read_task.exception()
+                    ):
+                        batch._read_property_multiple_callback(
+                            key_list, read_task, metadata=metadata
+                        )
+                    elif len(chunk) > 1:
+                        half = (len(chunk) + 1) // 2
+                        if _debug:
+                            AddressGroupWorker._debug("    - split: %r", half)
+                        chunk_queue.put(
+                            [(chunk[:half], retries + 1), (chunk[half:], retries + 1)]
+                        )
+
+                        # remember the smaller size for the rest of the references
+                        # and for the next time
+                        if device_info and (
+                            (device_info.rpm_chunk_size is None)
+                            or (half < device_info.rpm_chunk_size)
+                        ):
+                            device_info.rpm_chunk_size = half
+                    else:
+                        if _debug:
+                            AddressGroupWorker._debug(
+                                "    - read property: %r", chunk[0]
+                            )
+                        daopr = chunk[0]
+
+                        read_task = loop.create_task(
+                            batch.app.read_property(  # type: ignore[union-attr]
+                                daopr.deviceAddress,
+                                daopr.objectIdentifier,
+                                daopr.propertyReference.propertyIdentifier,
+                                daopr.propertyReference.propertyArrayIndex,
+                            ),
+                            name=f"reading {daopr.key}",
+                        )
+                        read_task.add_done_callback(
+                            partial(
+                                batch._read_property_callback,
+                                daopr.key,
+                                metadata=batch.read_metadata(
+                                    self.address, "read-property", 1, retries + 1
+                                ),
+                            )
+                        )
+                        if not await self.wait_for_task(batch, read_task):
+                            break
+            finally:
+                chunk_queue.done()
             if _debug:
                 AddressGroupWorker._debug("    - finished")
-        if _debug:
-            AddressGroupWorker._debug("    - finished(%s)", self.address)
+
+    @staticmethod
+    def retry_smaller(exception: Optional[BaseException]) -> bool:
+        """
+        Return True if a Read Property Multiple request failed in a way that
+        might work if it asked for fewer properties.
+        """
+        if isinstance(exception, RejectPDU):
+            return True
+        if isinstance(exception, AbortPDU):
+            return exception.apduAbortRejectReason in _retry_smaller_abort_reasons
+        return False
+
+    async def wait_for_task(self, batch: BatchRead, read_task: asyncio.Task) -> bool:
+        """
+        Wait for the task to complete or for the batch to be stopped, in which
+        case the task is canceled.  Return True if the task completed.
+        """
+        loop = asyncio.get_running_loop()
+
+        # task for the batch being stopped
+        stop_wait = loop.create_task(batch._stop.wait(), name="stop wait")
+
+        # wait for one of them to complete
+        done, pending = await asyncio.wait(
+            {read_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        # cancel the pending task(s)
+        for task in pending:
+            task.cancel()
+
+        return read_task in done
 
 
 @bacpypes_debugging
 class NetworkGroupWorker:
     """
     A NetworkGroupWorker is responsible for running AddressGroupWorker
-    instances sequentially for all of the addresses on its network.
+    instances for all of the addresses on its network, as many at the same
+    time as the batch allows for the network.
     """
 
     _debug: Callable[..., None]
@@ -324,28 +762,42 @@ class NetworkGroupWorker:
         # save the network for debugging
         self.network = network
 
-        # make a worker for each address
-        self.address_worker_list = []
-        for address, daopr_list in address_group.items():
-            self.address_worker_list.append(AddressGroupWorker(address, daopr_list))
+        # workers for each address are made when it is their turn
+        self.address_group = address_group
 
     async def run(self, batch: BatchRead) -> None:
         if _debug:
             NetworkGroupWorker._debug("run(%s)", self.network)
 
         # give each address on the network a turn in reading
-        for address_worker in self.address_worker_list:
+        concurrency = batch.network_concurrency.get(self.network, batch.concurrency)
+        address_worker_iter = (
+            AddressGroupWorker(address, daopr_list)
+            for address, daopr_list in self.address_group.items()
+        )
+        await asyncio.gather(
+            *(
+                self._run_address_workers(batch, address_worker_iter)
+                for _ in range(min(concurrency, len(self.address_group)))
+            )
+        )
+        if _debug:
+            NetworkGroupWorker._debug("    - finished(%s)", self.network)
+
+    async def _run_address_workers(
+        self, batch: BatchRead, address_worker_iter: Iterator[AddressGroupWorker]
+    ) -> None:
+        for address_worker in address_worker_iter:
             if batch._stop.is_set():
                 if _debug:
                     NetworkGroupWorker._debug("    - all stop")
                 break
 
             await address_worker.run(batch)
-        if _debug:
-            NetworkGroupWorker._debug("    - finished(%s)", self.network)
 
 
 CallbackFn = Callable[[Any, Any], None]
+StreamItem = Union[Tuple[Any, Any], Tuple[Any, Any, ReadMetadata]]
 
 
 @bacpypes_debugging
@@ -354,6 +806,12 @@ class BatchRead:
     Given a list of references to the properties of objects in some devices,
     read the values of the properties and pass the results to a callback
     function.
+
+    The concurrency is the number of devices on a network that are read at the
+    same time, which can be different for each network, like more for an IP
+    network and fewer for an MS/TP network behind a router.  Each device can
+    have max_outstanding requests at the same time and max_requests limits
+    the number of requests for the whole batch.
     """
 
     _debug: Callable[..., None]
@@ -362,10 +820,41 @@ class BatchRead:
     fini: Optional[asyncio.Event]
     callback: Optional[CallbackFn]
 
-    def __init__(self, daopr_list: DeviceAddressObjectPropertyReferenceList) -> None:
+    concurrency: int
+    network_concurrency: Dict[Optional[int], int]
+    max_outstanding: int
+    max_requests: Optional[int]
+
+    def __init__(
+        self,
+        daopr_list: DeviceAddressObjectPropertyReferenceList,
+        concurrency: int = 1,
+        network_concurrency: Optional[Dict[Optional[int], int]] = None,
+        max_outstanding: int = 1,
+        max_requests: Optional[int] = None,
+    ) -> None:
         if _debug:
             BatchRead._debug("__init__ ...")
 
+        if concurrency < 1:
+            raise ValueError("concurrency")
+        if max_outstanding < 1:
+            raise ValueError("max_outstanding")
+        if (max_requests is not None) and (max_requests < 1):
+            raise ValueError("max_requests")
+
+        self.concurrency = concurrency
+        self.network_concurrency = dict(network_concurrency or {})
+        self.max_outstanding = max_outstanding
+        self.max_requests = max_requests
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        self._request_count = 0
+
+        # results waiting to be streamed
+        self._buffer: Optional[Deque[Tuple[Any, Any, ReadMetadata]]] = None
+        self._buffer_size = 0
+        self._buffer_changed: Optional[asyncio.Event] = None
+
         # filter the samples into buckets
         self.network_group = NetworkGroup()
         for daopr in daopr_list:
@@ -401,6 +890,10 @@ class BatchRead:
         self._stop = asyncio.Event()
         self.fini = asyncio.Event()
 
+        # limit the number of requests for the whole batch
+        if self.max_requests is not None:
+            self._request_semaphore = asyncio.Semaphore(self.max_requests)
+
         # create a set of network workers
         network_task_set = set()
         for network, address_group in self.network_group.items():
@@ -421,15 +914,117 @@ class BatchRead:
         # set the event we are done
         self.fini.set()
 
-    def _read_property_callback(self, key: Any, task: Any) -> None:
+    async def stream(
+        self,
+        app: Application,
+        buffer_size: int = 100,
+        metadata: bool = False,
+    ) -> AsyncIterator[StreamItem]:
+        """
+        Read the contents of the buckets and generate (key, value) tuples, or
+        (key, value, metadata) tuples, as they are read.  When there are
+        buffer_size results that have not been consumed no more requests are
+        sent until there are fewer, so at most buffer_size plus the results of
+        the outstanding requests are kept.
+        """
+        if _debug:
+            BatchRead._debug("stream %r", app)
+        if buffer_size < 1:
+            raise ValueError("buffer_size")
+
+        self._buffer = deque()
+        self._buffer_size = buffer_size
+        self._buffer_changed = buffer_changed = asyncio.Event()
+
+        run_task = asyncio.create_task(self.run(app), name="batch read")
+        run_task.add_done_callback(lambda _: buffer_changed.set())
+
+        try:
+            while True:
+                if self._buffer:
+                    key, value, read_metadata = self._buffer.popleft()
+                    self._buffer_changed.set()
+                    if metadata:
+                        yield (key, value, read_metadata)
+                    else:
+                        yield (key, value)
+                elif run_task.done():
+                    break
+                else:
+                    self._buffer_changed.clear()
+                    await self._buffer_changed.wait()
+
+            # pass along any exception
+            run_task.result()
+        finally:
+            # the consumer stopped early
+            if not run_task.done():
+                self.stop()
+                await run_task
+            self._buffer = None
+
+    @asynccontextmanager
+    async def request_slot(self) -> AsyncIterator[None]:
+        """
+        Wait until the batch is allowed to have another request outstanding.
+        """
+        # wait for results to be consumed when streaming
+        if self._buffer is not None:
+            assert self._buffer_changed is not None
+            while (len(self._buffer) >= self._buffer_size) and (
+                not self._stop.is_set()
+            ):
+                self._buffer_changed.clear()
+                await self._buffer_changed.wait()
+
+        if self._request_semaphore is None:
+            yield
+        else:
+            async with self._request_semaphore:
+                yield
+
+    def read_metadata(
+        self,
+        address: Address,
+        service: str,
+        request_size: int = 1,
+        retries: int = 0,
+    ) -> ReadMetadata:
+        """
+        Return the metadata for a new request.
+        """
+        self._request_count += 1
+        return ReadMetadata(
+            address,
+            service,
+            self._request_count,
+            request_size,
+            retries,
+            asyncio.get_running_loop().time(),
+        )
+
+    def _deliver(self, key: Any, value: Any, metadata: ReadMetadata) -> None:
+        """
+        Pass the result to the callback and the stream.
+        """
+        if self.callback:
+            self.callback(key, value)
+        if self._buffer is not None:
+            assert self._buffer_changed is not None
+            self._buffer.append((key, value, metadata))
+            self._buffer_changed.set()
+
+    def _read_property_callback(
+        self, key: Any, task: Any, metadata: ReadMetadata
+    ) -> None:
         if _debug:
             BatchRead._debug("_read_property_callback %r %r", key, task)
-        if not self.callback:
-            return
+        if metadata.service:
+            metadata.latency = asyncio.get_running_loop().time() - metadata.start_time
 
         # if the task is canceled use None
         if task.cancelled():
-            self.callback(key, None)
+            self._deliver(key, None, metadata)
             return
 
         # get the exception or result from the task
@@ -438,18 +1033,20 @@ class BatchRead:
             BatchRead._debug("    - key, value: %r, %r", key, value)
 
         # pass the value back to the run() caller
-        self.callback(key, value)
+        self._deliver(key, value, metadata)
 
-    def _read_property_multiple_callback(self, key_list: List[Any], task: Any) -> None:
+    def _read_property_multiple_callback(
+        self, key_list: List[Any], task: Any, metadata: ReadMetadata
+    ) -> None:
         if _debug:
             BatchRead._debug("_read_property_multiple_callback %r %r", key_list, task)
-        if not self.callback:
-            return
+        if metadata.service:
+            metadata.latency = asyncio.get_running_loop().time() - metadata.start_time
 
         # if the task is canceled use None
         if task.cancelled():
             for key in key_list:
-                self.callback(key, None)
+                self._deliver(key, None, metadata)
             return
 
         exception = task.exception()
@@ -457,7 +1054,7 @@ class BatchRead:
             if _debug:
                 BatchRead._debug("    - exception: %r", exception)
             for key in key_list:
-                self.callback(key, exception)
+                self._deliver(key, exception, metadata)
         else:
             result = task.result()
             if _debug:
@@ -472,7 +1069,7 @@ class BatchRead:
             ) in zip(key_list, result):
                 if _debug:
                     BatchRead._debug("    - key, value: %r, %r", key, property_value)
-                self.callback(key, property_value)
+                self._deliver(key, property_value, metadata)
 
     def stop(self):
         """
@@ -481,3 +1078,5 @@ class BatchRead:
         possible.
         """
         self._stop.set()
+        if self._buffer_changed:
+            self._buffer_changed.set()
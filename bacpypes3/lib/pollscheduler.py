@@ -0,0 +1,341 @@
+"""
+Poll Scheduler
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import random
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..debugging import bacpypes_debugging, ModuleLogger
+
+from ..pdu import Address
+from ..app import Application
+from .batchread import BatchRead, CallbackFn, DeviceAddressObjectPropertyReference
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+class PollPoint:
+    """
+    A property to read every interval seconds, the deadline is when it should
+    be read next and missed is the number of deadlines that were skipped
+    because the point could not be read in time.
+    """
+
+    __slots__ = ("daopr", "interval", "deadline", "missed")
+
+    def __init__(
+        self, daopr: DeviceAddressObjectPropertyReference, interval: float
+    ) -> None:
+        self.daopr = daopr
+        self.interval = interval
+        self.deadline = 0.0
+        self.missed = 0
+
+    def __repr__(self) -> str:
+        return "<%s %r every %rs>" % (
+            self.__class__.__name__,
+            self.daopr.key,
+            self.interval,
+        )
+
+
+@bacpypes_debugging
+class PollScheduler:
+    """
+    Read the values of properties periodically, each one at its own interval.
+    The points that are due within group_window seconds of each other are
+    read together by a BatchRead so the ones for the same device are combined
+    into Read Property Multiple requests.
+
+    Each device is given a random phase up to jitter seconds so the devices
+    are not all polled at the same moment.  The deadlines of the points of a
+    device line up with its phase, so points with intervals that are
+    multiples of each other are read in the same requests.
+
+    The lag is how late a batch started, when a point is so late that it
+    would be read again within its interval the deadlines in between are
+    skipped and counted as missed.
+    """
+
+    _debug: Callable[..., None]
+    _exception: Callable[..., None]
+
+    app: Optional[Application]
+    callback: Optional[CallbackFn]
+
+    points: Dict[Any, PollPoint]
+    batch_count: int
+    read_count: int
+    missed_deadlines: int
+    lag: float
+    max_lag: float
+
+    def __init__(
+        self,
+        jitter: float = 60.0,
+        group_window: float = 0.1,
+        max_batches: int = 1,
+        **batch_args: Any,
+    ) -> None:
+        """
+        The max_batches is the number of batches that can be running at the
+        same time and the rest of the keyword arguments are passed to
+        BatchRead.
+        """
+        if _debug:
+            PollScheduler._debug("__init__ ...")
+
+        if jitter < 0.0:
+            raise ValueError("jitter")
+        if group_window < 0.0:
+            raise ValueError("group_window")
+        if max_batches < 1:
+            raise ValueError("max_batches")
+
+        self.jitter = jitter
+        self.group_window = group_window
+        self.max_batches = max_batches
+        self.batch_args = batch_args
+
+        # all of the points and a heap of (deadline, sequence, point) entries,
+        # entries for points that have been removed are skipped
+        self.points = {}
+        self._heap: List[Tuple[float, int, PollPoint]] = []
+        self._sequence: Iterator[int] = itertools.count()
+
+        # deadlines are relative to the epoch and the phase of the device
+        self._epoch: Optional[float] = None
+        self._phases: Dict[Address, float] = {}
+
+        # running batches
+        self._batches: Dict[asyncio.Task, BatchRead] = {}
+
+        self.batch_count = 0
+        self.read_count = 0
+        self.missed_deadlines = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+
+        # no application or events until we run
+        self.app = None
+        self.callback = None
+        self._stop: Optional[asyncio.Event] = None
+        self._changed: Optional[asyncio.Event] = None
+
+    def add_point(
+        self, daopr: DeviceAddressObjectPropertyReference, interval: float
+    ) -> PollPoint:
+        """
+        Read the property every interval seconds, a point with the same key
+        is replaced.
+        """
+        if _debug:
+            PollScheduler._debug("add_point %r %r", daopr, interval)
+        if interval <= 0.0:
+            raise ValueError("interval")
+
+        if daopr.key in self.points:
+            self.remove_point(daopr.key)
+
+        loop = asyncio.get_event_loop()
+        if self._epoch is None:
+            self._epoch = loop.time()
+
+        # the first deadline is the next one that lines up with the phase
+        phase = self._phases.get(daopr.deviceAddress, None)
+        if phase is None:
+            phase = self._phases[daopr.deviceAddress] = random.uniform(
+                0.0, self.jitter
+            )
+        start = self._epoch + phase
+
+        point = PollPoint(daopr, interval)
+        point.deadline = start + math.ceil((loop.time() - start) / interval) * interval
+
+        self.points[daopr.key] = point
+        self._schedule(point)
+
+        return point
+
+    def remove_point(self, key: Any) -> None:
+        """
+        Stop reading the property, a read that is in progress is still passed
+        to the callback.
+        """
+        if _debug:
+            PollScheduler._debug("remove_point %r", key)
+
+        del self.points[key]
+
+        # rebuild the heap when it is mostly removed points
+        if len(self._heap) > 2 * len(self.points) + 64:
+            self._heap = [entry for entry in self._heap if self._valid(entry[2])]
+            heapq.heapify(self._heap)
+
+    def _valid(self, point: PollPoint) -> bool:
+        return self.points.get(point.daopr.key, None) is point
+
+    def _schedule(self, point: PollPoint) -> None:
+        heapq.heappush(self._heap, (point.deadline, next(self._sequence), point))
+
+        # wake up the run loop if this is the next one
+        if self._changed and (self._heap[0][2] is point):
+            self._changed.set()
+
+    async def run(
+        self, app: Application, callback: Optional[CallbackFn] = None
+    ) -> None:
+        """
+        Read the points as they come due until stop() is called.
+        """
+        if _debug:
+            PollScheduler._debug("run %r", app)
+
+        # save a reference to the application and callback
+        self.app = app
+        self.callback = callback
+
+        # set when the process must stop, changed when the heap changes
+        self._stop = asyncio.Event()
+        self._changed = asyncio.Event()
+
+        loop = asyncio.get_running_loop()
+        batch_slots = asyncio.Semaphore(self.max_batches)
+
+        try:
+            while not self._stop.is_set():
+                self._changed.clear()
+
+                # toss the points that have been removed
+                while self._heap and not self._valid(self._heap[0][2]):
+                    heapq.heappop(self._heap)
+
+                # wait for the next deadline or a change
+                if self._heap:
+                    timeout: Optional[float] = self._heap[0][0] - loop.time()
+                else:
+                    timeout = None
+                if (timeout is None) or (timeout > 0.0):
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                # the points are late while waiting for another batch
+                await batch_slots.acquire()
+                if self._stop.is_set():
+                    batch_slots.release()
+                    break
+
+                # collect the points that are due
+                now = loop.time()
+                point_list = []
+                while self._heap and (self._heap[0][0] <= now + self.group_window):
+                    point = heapq.heappop(self._heap)[2]
+                    if self._valid(point):
+                        point_list.append(point)
+                if not point_list:
+                    batch_slots.release()
+                    continue
+
+                self.lag = max(0.0, now - point_list[0].deadline)
+                self.max_lag = max(self.max_lag, self.lag)
+                if _debug:
+                    PollScheduler._debug(
+                        "    - batch of %d, lag: %r", len(point_list), self.lag
+                    )
+
+                batch = BatchRead(
+                    [point.daopr for point in point_list], **self.batch_args
+                )
+                batch_task = asyncio.create_task(
+                    batch.run(app, callback), name=f"poll {self.batch_count}"
+                )
+                batch_task.add_done_callback(
+                    lambda task, point_list=point_list: self._batch_done(
+                        task, point_list, batch_slots
+                    )
+                )
+                self._batches[batch_task] = batch
+
+                self.batch_count += 1
+                self.read_count += len(point_list)
+        finally:
+            # stop the batches that are running and wait for them
+            for batch in self._batches.values():
+                batch.stop()
+            if self._batches:
+                await asyncio.wait(set(self._batches))
+
+    def _batch_done(
+        self,
+        task: asyncio.Task,
+        point_list: List[PollPoint],
+        batch_slots: asyncio.Semaphore,
+    ) -> None:
+        if _debug:
+            PollScheduler._debug("_batch_done %r", task)
+
+        del self._batches[task]
+        batch_slots.release()
+        if not task.cancelled() and task.exception():
+            PollScheduler._exception("exception in %r: %r", task, task.exception())
+
+        # the next deadline of each point, skipping the ones that are too late
+        now = asyncio.get_running_loop().time()
+        for point in point_list:
+            if not self._valid(point):
+                continue
+
+            point.deadline += point.interval
+            missed = math.floor((now - point.deadline) / point.interval)
+            if missed > 0:
+                point.deadline += missed * point.interval
+                point.missed += missed
+                self.missed_deadlines += missed
+
+            self._schedule(point)
+
+        if self._changed:
+            self._changed.set()
+
+    def stop(self) -> None:
+        """
+        Stop polling, the batches that are running are stopped too.
+        """
+        if _debug:
+            PollScheduler._debug("stop")
+
+        if self._stop:
+            self._stop.set()
+        if self._changed:
+            self._changed.set()
+
+        # run() might be waiting for one of these to finish
+        for batch in self._batches.values():
+            batch.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of points, batches, reads, missed deadlines, and the
+        latest and largest lag.
+        """
+        return {
+            "points": len(self.points),
+            "batch_count": self.batch_count,
+            "read_count": self.read_count,
+            "running": len(self._batches),
+            "missed_deadlines": self.missed_deadlines,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+        }
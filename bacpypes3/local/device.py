@@ -45,6 +45,20 @@ class DeviceObject(Object, _DeviceObject):
 
     _debug: Callable[..., None]
 
+    # the services and object types supported are computed from the
+    # application, which can change without the cache knowing about it
+    _cached_properties = Object._cached_properties | {
+        "vendorName",
+        "vendorIdentifier",
+        "modelName",
+        "firmwareRevision",
+        "applicationSoftwareVersion",
+        "protocolVersion",
+        "protocolRevision",
+        "maxApduLengthAccepted",
+        "segmentationSupported",
+    }
+
     objectType = ObjectType("device")
 
     systemStatus = DeviceStatus.operational
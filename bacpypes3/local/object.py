@@ -10,13 +10,23 @@ from collections import defaultdict
 from copy import deepcopy
 from functools import partial
 from threading import Thread
-from typing import cast, Any as _Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    cast,
+    Any as _Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ..debugging import bacpypes_debugging, ModuleLogger
 from ..errors import PropertyError
-from ..primitivedata import CharacterString, ObjectIdentifier
+from ..primitivedata import CharacterString, ObjectIdentifier, TagList
 from ..basetypes import EventState, PropertyIdentifier, Reliability, StatusFlags
-from ..constructeddata import ArrayOf
+from ..constructeddata import Any, ArrayOf
 
 from ..object import Object as _Object, NotificationClassObject
 
@@ -31,6 +41,9 @@ ExecuteMethod = Callable[["Algorithm"], _Any]
 # this is for sample applications
 _vendor_id = 999
 
+# the cached properties of each class that are plain stored values
+_stored_properties: Dict[type, FrozenSet[str]] = {}
+
 
 @bacpypes_debugging
 class PropertyGetterThread(Thread):
@@ -385,6 +398,26 @@ class Object(_Object):
     __objectName: CharacterString
     __objectIdentifier: ObjectIdentifier
     _property_monitors: Dict[str, List[Callable[..., None]]]
+
+    # the encoded values of these properties are saved for reading when
+    # they are stored values, they are forgotten when the property is
+    # changed so the values must be replaced rather than modified in place
+    _cached_properties: FrozenSet[str] = frozenset(
+        (
+            "objectIdentifier",
+            "objectName",
+            "objectType",
+            "propertyList",
+            "description",
+            "units",
+            "numberOfStates",
+            "stateText",
+            "activeText",
+            "inactiveText",
+            "profileName",
+        )
+    )
+    _encoded_cache: Dict[str, TagList]
     _event_algorithm: Optional[Algorithm] = None
     _fault_algorithm: Optional[Algorithm] = None
     _notification_class_object: Optional[NotificationClassObject] = None
@@ -396,6 +429,7 @@ class Object(_Object):
         self.__objectName = None
         self.__objectIdentifier = None
         self._property_monitors = defaultdict(list)
+        self._encoded_cache = {}
 
         super().__init__(**kwargs)
 
@@ -540,10 +574,94 @@ class Object(_Object):
                 value=value,
             )
 
+        # forget the encoded value, the property list changes when a value
+        # comes or goes
+        if self._encoded_cache:
+            self._encoded_cache.pop(attr, None)
+            if (current_value is None) != (value is None):
+                self._encoded_cache.pop("propertyList", None)
+
         # tell the monitors
         for fn in self._property_monitors[attr]:
             fn(current_value, value)
 
+    async def read_property_to_any(
+        self,
+        attr: Union[int, str],
+        index: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Read the value of a property and return it encoded in an Any, using
+        the saved encoding for the cached properties.
+        """
+        if _debug:
+            Object._debug("read_property_to_any %r %r", attr, index)
+
+        if isinstance(attr, int):
+            attr = self._property_identifier_class(attr).attr
+        if (index is not None) or (attr not in self._stored_properties()):
+            return await super().read_property_to_any(attr, index)
+
+        tag_list = self._encoded_cache.get(attr, None)
+        if tag_list is None:
+            value = await self.read_property(attr)
+            if value is None:
+                return None
+
+            tag_list = self._encoded_cache[attr] = Any.cast(value)
+        elif _debug:
+            Object._debug("    - cached")
+
+        # the copy shares the tags with the saved one
+        return Any(TagList(tag_list))
+
+    def _stored_properties(self) -> FrozenSet[str]:
+        """
+        Return the cached properties that are plain stored values.  When the
+        class reads properties its own way, or a property is computed by a
+        getter other than the ones defined here, the value is read every time.
+        """
+        object_class = type(self)
+        stored_properties = _stored_properties.get(object_class, None)
+        if stored_properties is None:
+            if object_class.read_property is not Object.read_property:
+                stored_properties = frozenset()
+            else:
+                stored_properties = frozenset(
+                    attr
+                    for attr in self._cached_properties
+                    if not isinstance(
+                        inspect.getattr_static(object_class, attr, None), property
+                    )
+                    or inspect.getattr_static(object_class, attr)
+                    is inspect.getattr_static(Object, attr, None)
+                )
+            _stored_properties[object_class] = stored_properties
+
+        return stored_properties
+
+    async def write_property(  # type: ignore[override]
+        self,
+        attr: Union[int, str],
+        value: _Any,
+        index: Optional[int] = None,
+        priority: Optional[int] = None,
+    ) -> None:
+        """
+        Writing a property does not go through __setattr__() so forget the
+        encoded value here.
+        """
+        if _debug:
+            Object._debug("write_property %r %r %r %r", attr, value, index, priority)
+        if isinstance(attr, int):
+            attr = self._property_identifier_class(attr).attr
+
+        try:
+            await super().write_property(attr, value, index, priority)
+        finally:
+            self._encoded_cache.pop(attr, None)
+            self._encoded_cache.pop("propertyList", None)
+
     @property
     def objectName(self) -> CharacterString:
         """Return the private value of the object name."""
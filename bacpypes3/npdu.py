@@ -172,7 +172,7 @@ class NPCI(PCI, DebugContents):
         PCI.update(npci, pdu)
 
         # check the length
-        if len(pdu.pduData) < 2:
+        if pdu.remaining() < 2:
             raise DecodingError("invalid length")
 
         # only version 1 messages supported
@@ -508,7 +508,7 @@ class IAmRouterToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         network_list = []
-        while pdu.pduData:
+        while pdu.remaining():
             network_list.append(pdu.get_short())
         return IAmRouterToNetwork(network_list)
 
@@ -641,7 +641,7 @@ class RouterBusyToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         network_list = []
-        while pdu.pduData:
+        while pdu.remaining():
             network_list.append(pdu.get_short())
         return RouterBusyToNetwork(network_list)
 
@@ -684,7 +684,7 @@ class RouterAvailableToNetwork(NPDU):
     @classmethod
     def decode(class_, pdu: PDU) -> NPDU:
         network_list = []
-        while pdu.pduData:
+        while pdu.remaining():
             network_list.append(pdu.get_short())
         return RouterAvailableToNetwork(network_list)
 
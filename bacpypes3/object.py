@@ -38,6 +38,7 @@ from .primitivedata import (
 )
 
 from .constructeddata import (
+    Any,
     AnyAtomic,
     ArrayOf,
     ListOf,
@@ -440,6 +441,24 @@ class Object(Sequence, metaclass=ObjectMetaclass):
 
         return value
 
+    async def read_property_to_any(
+        self,
+        attr: Union[int, str],
+        index: Optional[int] = None,
+    ) -> Optional[Any]:
+        """
+        Read the value of a property and return it encoded in an Any, or None
+        if the property is defined but does not have a value.
+        """
+        if _debug:
+            Object._debug("read_property_to_any %r %r", attr, index)
+
+        value = await self.read_property(attr, index)
+        if value is None:
+            return None
+
+        return Any(value)
+
     async def write_property(  # type: ignore[override]
         self,
         attr: Union[int, str],
@@ -30,6 +30,8 @@ except ImportError:
 # pack/unpack constants
 _short_mask = 0xFFFF
 _long_mask = 0xFFFFFFFF
+_short_struct = struct.Struct(">H")
+_long_struct = struct.Struct(">L")
 
 # some debugging
 _debug = 0
@@ -135,6 +137,28 @@ class AddressMetaclass(type):
         if cls is not Address:
             return cast(Address, type.__call__(cls, *args, **kwargs))
 
+        # strings, octets and (host, port) tuples are parsed once and shared
+        if (len(args) == 1) and (not kwargs):
+            key = args[0]
+            if isinstance(key, bytearray):
+                key = bytes(key)
+            if isinstance(key, (str, bytes, tuple)):
+                address = address_cache.get(key)
+                if address is None:
+                    address = cls._make_address(key)
+
+                    # names are resolved each time, they might change
+                    if not (isinstance(key, str) and interface_port_re.match(key)):
+                        address_cache.put(key, address)
+
+                return address
+
+        return cls._make_address(*args, **kwargs)
+
+    def _make_address(cls, *args: Any, **kwargs: Any) -> "Address":
+        if _debug:
+            AddressMetaclass._debug("_make_address %r %r %r", cls, args, kwargs)
+
         network_type = kwargs.get("network_type", None)
 
         # network type was provided
@@ -356,6 +380,68 @@ class AddressMetaclass(type):
         raise ValueError("invalid address")
 
 
+#
+#   AddressCache
+#
+
+
+@bacpypes_debugging
+class AddressCache(DebugContents):
+    """
+    A bounded, least recently used cache of parsed addresses.  The key is the
+    string, octets, or (host, port) tuple the address was built from and the
+    addresses are shared, so they must not be changed.
+    """
+
+    _debug: Callable[..., None]
+    _debug_contents = ("maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if _debug:
+            AddressCache._debug("__init__ maxsize=%r", maxsize)
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        # dictionaries keep insertion order, the oldest entry is first
+        self._cache: Dict[Any, Address] = {}
+
+    def get(self, key: Any) -> Optional[Address]:
+        """Return the cached address or None."""
+        address = self._cache.pop(key, None)
+        if address is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._cache[key] = address
+
+        return address
+
+    def put(self, key: Any, address: Address) -> None:
+        """Add an address to the cache, dropping the oldest one when full."""
+        if self.maxsize <= 0:
+            return
+
+        cache = self._cache
+        cache.pop(key, None)
+        while len(cache) >= self.maxsize:
+            del cache[next(iter(cache))]
+        cache[key] = address
+
+    def clear(self) -> None:
+        """Remove all the addresses and reset the counters."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# the cache used by Address() and IPv4Address.from_tuple()
+address_cache = AddressCache()
+
+
 #
 #   Address
 #
@@ -1217,6 +1303,19 @@ class IPv4Address(Address, ipaddress.IPv4Interface):
         self.addrTuple = (self.ip.compressed, port)
         self.addrBroadcastTuple = (self.network.broadcast_address.compressed, port)
 
+    @classmethod
+    def from_tuple(cls, addr: Tuple[str, int]) -> IPv4Address:
+        """
+        Return the address for a (host, port) tuple from a socket, the
+        address may be shared and must not be changed.
+        """
+        address = address_cache.get(addr)
+        if address is None:
+            address = cls(addr)
+            address_cache.put(addr, address)
+
+        return cast(IPv4Address, address)
+
     def __str__(self) -> str:
         prefix = str(self.addrNet) + ":" if self.addrNet else ""
         suffix = ":" + str(self.addrPort) if (self.addrPort != 47808) else ""
@@ -1882,12 +1981,16 @@ class PCI(DebugContents):
 @bacpypes_debugging
 class PDUData:
     """
-    Amazing documentation here.
+    The data portion of a PDU is a buffer and a read cursor.  Decoding moves
+    the cursor forward rather than deleting octets from the front of the
+    buffer, the consumed octets are trimmed off the front only when the
+    pduData attribute is referenced.
     """
 
     _debug: Callable[..., None]
 
-    pduData: bytearray
+    _pdu_buffer: bytearray
+    _pdu_offset: int
 
     def __init__(self, data: Union[bytes, bytearray, "PDUData", None] = None):
         if _debug:
@@ -1907,52 +2010,92 @@ class PDUData:
         else:
             raise TypeError("bytes or bytearray expected")
 
+    @property
+    def pduData(self) -> bytearray:
+        """The octets that have not been consumed."""
+        if self._pdu_offset:
+            del self._pdu_buffer[: self._pdu_offset]
+            self._pdu_offset = 0
+
+        return self._pdu_buffer
+
+    @pduData.setter
+    def pduData(self, data: bytearray) -> None:
+        self._pdu_buffer = data
+        self._pdu_offset = 0
+
+    def remaining(self) -> int:
+        """Return the number of octets that have not been consumed."""
+        return len(self._pdu_buffer) - self._pdu_offset
+
     def get(self) -> int:
-        if len(self.pduData) == 0:
+        offset = self._pdu_offset
+        if offset >= len(self._pdu_buffer):
             raise DecodingError("no more packet data")
 
-        octet = self.pduData[0]
-        del self.pduData[0]
+        self._pdu_offset = offset + 1
+        return self._pdu_buffer[offset]
+
+    def get_view(self, dlen: int) -> memoryview:
+        """
+        Return a read-only view of the next dlen octets without copying them.
+        The view must be released before the PDU data is modified.
+        """
+        offset = self._pdu_offset
+        if len(self._pdu_buffer) - offset < dlen:
+            raise DecodingError("no more packet data")
 
-        return octet
+        self._pdu_offset = offset + dlen
+        return memoryview(self._pdu_buffer).toreadonly()[offset : offset + dlen]
 
     def get_data(self, dlen: int) -> bytearray:
-        if len(self.pduData) < dlen:
+        offset = self._pdu_offset
+        if len(self._pdu_buffer) - offset < dlen:
             raise DecodingError("no more packet data")
 
-        data = self.pduData[:dlen]
-        del self.pduData[:dlen]
-
-        return data
+        self._pdu_offset = offset + dlen
+        return self._pdu_buffer[offset : offset + dlen]
 
     def get_short(self) -> int:
-        return struct.unpack(">H", self.get_data(2))[0]  # type: ignore[no-any-return]
+        offset = self._pdu_offset
+        if len(self._pdu_buffer) - offset < 2:
+            raise DecodingError("no more packet data")
+
+        self._pdu_offset = offset + 2
+        return _short_struct.unpack_from(self._pdu_buffer, offset)[0]  # type: ignore[no-any-return]
 
     def get_long(self) -> int:
-        return struct.unpack(">L", self.get_data(4))[0]  # type: ignore[no-any-return]
+        offset = self._pdu_offset
+        if len(self._pdu_buffer) - offset < 4:
+            raise DecodingError("no more packet data")
+
+        self._pdu_offset = offset + 4
+        return _long_struct.unpack_from(self._pdu_buffer, offset)[0]  # type: ignore[no-any-return]
 
     def put(self, n: int) -> None:
         # pduData is a bytearray
-        self.pduData += bytes([n])
+        self._pdu_buffer.append(n)
 
-    def put_data(self, data: Union[bytes, bytearray, List[int]]) -> None:
+    def put_data(self, data: Union[bytes, bytearray, memoryview, List[int]]) -> None:
         if isinstance(data, bytes):
             pass
         elif isinstance(data, bytearray):
             pass
+        elif isinstance(data, memoryview):
+            pass
         elif isinstance(data, list):
             data = bytes(data)
         else:
             raise TypeError("data must be bytes, bytearray, or a list")
 
         # regular append works
-        self.pduData += data
+        self._pdu_buffer += data
 
     def put_short(self, n: int) -> None:
-        self.pduData += struct.pack(">H", n & _short_mask)
+        self._pdu_buffer += _short_struct.pack(n & _short_mask)
 
     def put_long(self, n: int) -> None:
-        self.pduData += struct.pack(">L", n & _long_mask)
+        self._pdu_buffer += _long_struct.pack(n & _long_mask)
 
     def debug_contents(
         self,
@@ -12,6 +12,7 @@ import time
 import re
 
 from enum import IntEnum
+from itertools import groupby, islice
 
 from typing import (
     Any as _Any,
@@ -92,11 +93,77 @@ class TagNumber(IntEnum):
     reserved15 = 15
 
 
+def _encode_tag_header(tclass: int, tnum: int, tlvt: int) -> bytes:
+    """Return the encoded octets of a tag without the data."""
+    # check for special encoding
+    if tclass == TagClass.context:
+        data = 0x08
+    elif tclass == TagClass.opening:
+        data = 0x0E
+    elif tclass == TagClass.closing:
+        data = 0x0F
+    else:
+        data = 0x00
+
+    # encode the tag number part
+    if tnum < 15:
+        data += tnum << 4
+    else:
+        data += 0xF0
+
+    # encode the length/value/type part
+    if tlvt < 5:
+        data += tlvt
+    else:
+        data += 0x05
+
+    # save this and the extended tag value
+    header = bytearray([data])
+    if tnum >= 15:
+        header.append(tnum)
+
+    # really short lengths are already done
+    if tlvt >= 5:
+        if tlvt <= 253:
+            header.append(tlvt)
+        elif tlvt <= 65535:
+            header.append(254)
+            header += struct.pack(">H", tlvt)
+        else:
+            header.append(255)
+            header += struct.pack(">L", tlvt)
+
+    return bytes(header)
+
+
+# encoded tag headers for the common tag numbers and lengths, the key is
+# (tag_class, tag_number, tag_lvt) and the value is the header octets
+_tag_headers: Dict[Tuple[int, int, int], bytes] = {
+    (tclass, tnum, tlvt): _encode_tag_header(tclass, tnum, tlvt)
+    for tclass in TagClass
+    for tnum in range(15)
+    for tlvt in range(5)
+}
+
+# decoded tags are never changed, so the ones without data (opening and
+# closing tags, application booleans) are shared, the key is (tag_class,
+# tag_number) or (TagClass.application, boolean value)
+_tag_pool: Dict[Tuple[int, int], Tag] = {}
+
+# tag classes by the bit in the initial octet
+_tag_classes = (TagClass.application, TagClass.context)
+
+# build tags without calling __init__()
+_new_tag = object.__new__
+
+
 class Tag:
     """
     Amazing documentation here.
     """
 
+    __slots__ = ("tag_class", "tag_number", "tag_lvt", "tag_data")
+
     tag_class: TagClass
     tag_number: Union[TagNumber, int]
     tag_lvt: int
@@ -161,50 +228,23 @@ class Tag:
         self.tag_lvt = len(tdata)
         self.tag_data = tdata
 
-    def encode(self) -> PDUData:
+    def encode(self, pdu_data: Optional[PDUData] = None) -> PDUData:
         """Encode a tag on the end of the PDU."""
-        pdu_data = PDUData()
-
-        # check for special encoding
-        if self.tag_class == TagClass.context:
-            data = 0x08
-        elif self.tag_class == TagClass.opening:
-            data = 0x0E
-        elif self.tag_class == TagClass.closing:
-            data = 0x0F
-        else:
-            data = 0x00
-
-        # encode the tag number part
-        if self.tag_number < 15:
-            data += self.tag_number << 4
-        else:
-            data += 0xF0
-
-        # encode the length/value/type part
-        if self.tag_lvt < 5:
-            data += self.tag_lvt
-        else:
-            data += 0x05
-
-        # save this and the extended tag value
-        pdu_data.put(data)
-        if self.tag_number >= 15:
-            pdu_data.put(self.tag_number)
-
-        # really short lengths are already done
-        if self.tag_lvt >= 5:
-            if self.tag_lvt <= 253:
-                pdu_data.put(self.tag_lvt)
-            elif self.tag_lvt <= 65535:
-                pdu_data.put(254)
-                pdu_data.put_short(self.tag_lvt)
-            else:
-                pdu_data.put(255)
-                pdu_data.put_long(self.tag_lvt)
-
-        # now put the data
-        pdu_data.put_data(self.tag_data)
+        if pdu_data is None:
+            pdu_data = PDUData()
+
+        # most tags have a header that has already been built
+        key = (self.tag_class, self.tag_number, self.tag_lvt)
+        header = _tag_headers.get(key)
+        if header is None:
+            header = _encode_tag_header(*key)
+            if (self.tag_number <= 254) and (self.tag_lvt <= 253):
+                _tag_headers[key] = header
+
+        # the header then the data
+        pdu_data.put_data(header)
+        if self.tag_data:
+            pdu_data.put_data(self.tag_data)
 
         return pdu_data
 
@@ -212,45 +252,68 @@ class Tag:
     def decode(cls, pdu_data: PDUData) -> Tag:
         """Decode a tag from the PDU."""
         try:
-            tag = Tag()
-
             initial_octet = pdu_data.get()
 
             # extract the type
-            tag.tag_class = TagClass((initial_octet >> 3) & 0x01)
+            tag_class = (initial_octet >> 3) & 0x01
 
             # extract the tag number
-            tag.tag_number = initial_octet >> 4
-            if tag.tag_number == 0x0F:
-                tag.tag_number = pdu_data.get()
+            tag_number = initial_octet >> 4
+            if tag_number == 0x0F:
+                tag_number = pdu_data.get()
 
             # extract the length
-            tag.tag_lvt = initial_octet & 0x07
-            if tag.tag_lvt == 5:
-                tag.tag_lvt = pdu_data.get()
-                if tag.tag_lvt == 254:
-                    tag.tag_lvt = pdu_data.get_short()
-                elif tag.tag_lvt == 255:
-                    tag.tag_lvt = pdu_data.get_long()
-            elif tag.tag_lvt == 6:
-                tag.tag_class = TagClass.opening
-                tag.tag_lvt = 0
-            elif tag.tag_lvt == 7:
-                tag.tag_class = TagClass.closing
-                tag.tag_lvt = 0
+            tag_lvt = initial_octet & 0x07
+            if tag_lvt == 5:
+                tag_lvt = pdu_data.get()
+                if tag_lvt == 254:
+                    tag_lvt = pdu_data.get_short()
+                elif tag_lvt == 255:
+                    tag_lvt = pdu_data.get_long()
+            elif tag_lvt >= 6:
+                # opening and closing tags have no data, share them
+                tag_class = TagClass.opening if tag_lvt == 6 else TagClass.closing
+                tag = _tag_pool.get((tag_class, tag_number))
+                if tag is None:
+                    tag = _tag_pool[(tag_class, tag_number)] = Tag._make(
+                        tag_class, tag_number, 0, b""
+                    )
+                return tag
 
             # application tagged boolean has no more data
-            if (tag.tag_class == TagClass.application) and (
-                tag.tag_number == TagNumber.boolean
-            ):
-                # tag_lvt contains value
-                tag.tag_data = b""
-            else:
-                # tag_lvt contains length
-                tag.tag_data = pdu_data.get_data(tag.tag_lvt)
+            if (tag_class == 0) and (tag_number == 1):
+                # tag_lvt contains value, only share the valid ones
+                if tag_lvt not in (0, 1):
+                    return Tag._make(
+                        TagClass.application, TagNumber.boolean, tag_lvt, b""
+                    )
+                tag = _tag_pool.get((TagClass.application, tag_lvt))
+                if tag is None:
+                    tag = _tag_pool[(TagClass.application, tag_lvt)] = Tag._make(
+                        TagClass.application, TagNumber.boolean, tag_lvt, b""
+                    )
+                return tag
+
+            # tag_lvt contains length
+            tag_data = bytes(pdu_data.get_view(tag_lvt))
         except DecodingError:
             raise InvalidTag("invalid tag encoding")
 
+        return Tag._make(_tag_classes[tag_class], tag_number, tag_lvt, tag_data)
+
+    @staticmethod
+    def _make(
+        tag_class: TagClass,
+        tag_number: Union[TagNumber, int],
+        tag_lvt: int,
+        tag_data: bytes,
+    ) -> Tag:
+        """Build a tag from its parts without going through __init__()."""
+        tag = _new_tag(Tag)
+        tag.tag_class = tag_class
+        tag.tag_number = tag_number
+        tag.tag_lvt = tag_lvt
+        tag.tag_data = tag_data
         return tag
 
     def app_to_context(self, context: int) -> Tag:
@@ -290,8 +353,12 @@ class Tag:
         if not cls:
             return None
 
-        # tell the class to decode this tag and return an object
-        return cast(Atomic, cls.decode(TagList([self])))
+        # try the fast decoder, otherwise tell the class to decode this tag
+        value = cls.decode_app_tag(self)
+        if value is None:
+            value = cls.decode(TagList([self]))
+
+        return cast(Atomic, value)
 
     def __repr__(self) -> str:
         sname = self.__module__ + "." + self.__class__.__name__
@@ -371,6 +438,8 @@ class ApplicationTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args: _Any) -> None:
         if len(args) == 1 and isinstance(args[0], PDUData):
             Tag.__init__(self, args[0])
@@ -388,6 +457,8 @@ class ContextTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, context: int, data: Union[bytes, bytearray]) -> None:
         Tag.__init__(self, TagClass.context, context, len(data), data)
 
@@ -397,6 +468,8 @@ class OpeningTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, context: int) -> None:
         Tag.__init__(self, TagClass.opening, context)
 
@@ -406,16 +479,24 @@ class ClosingTag(Tag):
     Amazing documentation here.
     """
 
+    __slots__ = ()
+
     def __init__(self, context: int) -> None:
         Tag.__init__(self, TagClass.closing, context)
 
 
 class TagList(Iterable):
     """
-    Amazing documentation here.
+    A list of tags that is consumed from the front.  Rather than deleting
+    tags from the front of the list, a read index is moved forward, and
+    copies and the lists returned by pop_context() share the same tag
+    storage.  Shared storage is copied before it is modified.
     """
 
-    tagList: _List[Tag]
+    _tags: _List[Tag]
+    _start: int
+    _end: Optional[int]
+    _shared: bool
 
     def __init__(self, arg: Union[_List[Tag], TagList, PDUData, None] = None) -> None:
         self.tagList = []
@@ -423,24 +504,73 @@ class TagList(Iterable):
         if isinstance(arg, list):
             self.tagList = arg
         elif isinstance(arg, TagList):
-            self.tagList = arg.tagList[:]
+            # share the storage of the other list
+            self._tags = arg._tags
+            self._start = arg._start
+            self._end = arg._stop()
+            self._shared = arg._shared = True
         elif isinstance(arg, PDUData):
             self.decode(arg)
 
+    @property
+    def tagList(self) -> _List[Tag]:
+        """The tags that have not been consumed."""
+        if self._shared:
+            self._tags = self._tags[self._start : self._stop()]
+            self._start = 0
+            self._end = None
+            self._shared = False
+        elif self._start:
+            del self._tags[: self._start]
+            self._start = 0
+
+        return self._tags
+
+    @tagList.setter
+    def tagList(self, tags: _List[Tag]) -> None:
+        self._tags = tags
+        self._start = 0
+        self._end = None
+        self._shared = False
+
+    def _stop(self) -> int:
+        """Return the index in the storage after the last tag."""
+        return len(self._tags) if self._end is None else self._end
+
+    def _view(self, count: int) -> TagList:
+        """Return a list of the next count tags that shares the storage and
+        move the read index past them."""
+        tag_list = TagList()
+        tag_list._tags = self._tags
+        tag_list._start = self._start
+        tag_list._end = self._start + count
+        tag_list._shared = self._shared = True
+
+        self._start += count
+        return tag_list
+
     def append(self, tag: Tag) -> None:
         self.tagList.append(tag)
 
     def extend(self, taglist: Iterable[Tag]) -> None:
         self.tagList.extend(taglist)
 
-    def __getitem__(self, item: int) -> Tag:
-        return self.tagList[item]
+    def __getitem__(self, item: Union[int, slice]) -> _Any:
+        if isinstance(item, slice):
+            return self._tags[self._start : self._stop()][item]
+
+        count = self._stop() - self._start
+        if item < 0:
+            item += count
+        if not (0 <= item < count):
+            raise IndexError("tag list index out of range")
+        return self._tags[self._start + item]
 
     def __len__(self) -> int:
-        return len(self.tagList)
+        return self._stop() - self._start
 
     def __iter__(self) -> Iterator[Tag]:
-        return iter(self.tagList)
+        return islice(self._tags, self._start, self._stop())
 
     def __eq__(self, other: object) -> bool:
         """Tag lists are equal if all the tags are equal."""
@@ -448,7 +578,7 @@ class TagList(Iterable):
             return NotImplemented
         if len(self) != len(other):
             return False
-        return all(x == y for x, y in zip(self.tagList, other.tagList))
+        return all(x == y for x, y in zip(self, other))
 
     def __ne__(self, arg: _Any) -> bool:
         """Inverse of __eq__."""
@@ -456,27 +586,39 @@ class TagList(Iterable):
 
     def peek(self) -> Union[Tag, None]:
         """Return the tag at the front of the list."""
-        if self.tagList:
-            return self.tagList[0]
+        if self._start < self._stop():
+            return self._tags[self._start]
         else:
             return None
 
     def push(self, tag: Tag) -> None:
         """Return a tag back to the front of the list."""
-        self.tagList = [tag] + self.tagList
+        if self._start and (self._tags[self._start - 1] is tag):
+            # the tag was just popped, move the read index back
+            self._start -= 1
+        elif self._start and not self._shared:
+            self._start -= 1
+            self._tags[self._start] = tag
+        else:
+            self.tagList.insert(0, tag)
 
     def pop(self) -> Union[Tag, None]:
         """Remove the tag from the front of the list and return it."""
-        if self.tagList:
-            tag = self.tagList[0]
-            del self.tagList[0]
+        if self._start < self._stop():
+            tag = self._tags[self._start]
+            self._start += 1
             return tag
         else:
             return None
 
+    def skip(self, count: int) -> None:
+        """Remove count tags from the front of the list."""
+        self._start = min(self._start + count, self._stop())
+
     def pop_context(self) -> TagList:
         """Return a list of one application or context encoded tag, or a list
-        of tags with matching opening/closing pairs.
+        of tags with matching opening/closing pairs.  The list that is
+        returned shares the tags with this one rather than copying them.
         """
         # peek at the first tag
         tag = self.peek()
@@ -495,13 +637,15 @@ class TagList(Iterable):
             return TagList([])
 
         # forward pass
-        i = 0
+        tags = self._tags
+        i = self._start
+        stop = self._stop()
         lvl = 0
-        while i < len(self.tagList):
-            tag = self.tagList[i]
-            if tag.tag_class == TagClass.opening:
+        while i < stop:
+            tag_class = tags[i].tag_class
+            if tag_class == TagClass.opening:
                 lvl += 1
-            elif tag.tag_class == TagClass.closing:
+            elif tag_class == TagClass.closing:
                 lvl -= 1
                 if lvl == 0:
                     break
@@ -512,16 +656,15 @@ class TagList(Iterable):
             raise InvalidTag("mismatched open/close tags")
 
         # result is the list of tags
-        tag_list = TagList(self.tagList[: i + 1])
-        del self.tagList[: i + 1]
-
-        return tag_list
-
-    def encode(self) -> PDUData:
-        """Encode the tag list."""
-        pdu_data = PDUData()
-        for tag in self.tagList:
-            pdu_data.put_data(tag.encode().pduData)
+        return self._view(i + 1 - self._start)
+
+    def encode(self, pdu_data: Optional[PDUData] = None) -> PDUData:
+        """Encode the tag list, appending the tags to the PDU data if it is
+        provided rather than building a new one."""
+        if pdu_data is None:
+            pdu_data = PDUData()
+        for tag in self:
+            tag.encode(pdu_data)
         return pdu_data
 
     @classmethod
@@ -530,7 +673,7 @@ class TagList(Iterable):
         assert isinstance(pdu_data, PDUData)
 
         tag_list = TagList()
-        while pdu_data.pduData:
+        while pdu_data.remaining():
             tag_list.append(Tag.decode(pdu_data))
 
         return tag_list
@@ -541,7 +684,7 @@ class TagList(Iterable):
         file: TextIO = sys.stderr,
         _ids: Optional[_List[_Any]] = None,
     ) -> None:
-        for i, tag in enumerate(self.tagList):
+        for i, tag in enumerate(self):
             file.write("%s[%d] %r'\n" % ("    " * indent, i, tag))
 
 
@@ -774,6 +917,96 @@ class Atomic(Element):
         # handy reference
         self._value = args[0] if args else None
 
+    @classmethod
+    def decode_app_tag(cls, tag: Tag) -> Optional[Atomic]:
+        """
+        Decode an application tagged value directly from the tag data rather
+        than wrapping it in a tag list and going through decode(), or return
+        None if there is no fast decoder for this class and tag.
+        """
+        if tag.tag_class != TagClass.application:
+            return None
+
+        key = (cls, tag.tag_number)
+        decoder = _app_tag_class_decoders.get(key, False)
+        if decoder is False:
+            decoder = _app_tag_class_decoders[key] = _find_app_tag_decoder(
+                cls, tag.tag_number
+            )
+        if decoder is None:
+            return None
+
+        value = decoder(tag)
+        if value is None:
+            return None
+
+        # same as cls(value) without the metaclass overhead
+        return cast(Atomic, type.__call__(cls, cls.cast(value)))
+
+    @classmethod
+    def decode_app_tags(cls, tag_list: TagList) -> _List[Atomic]:
+        """
+        Decode the run of application tagged values at the front of the tag
+        list all at once and return them.  Tags that can't be decoded this way
+        are left in the list for decode().
+        """
+        codec = _find_bulk_app_tag_codec(cls)
+        if codec is None:
+            return []
+        tag_number, formats, unsigned, build, _ = codec
+
+        # collect the data from the matching tags
+        tag_datas = []
+        for tag in tag_list:
+            if (tag.tag_class != TagClass.application) or (
+                tag.tag_number != tag_number
+            ):
+                break
+            tag_datas.append(tag.tag_data)
+
+        # unpack runs of the same length together
+        values: _List[_Any] = []
+        for length, run in groupby(tag_datas, len):
+            run_datas = list(run)
+            fmt = formats.get(length, None)
+            if fmt:
+                values.extend(
+                    struct.unpack(">%d%s" % (len(run_datas), fmt), b"".join(run_datas))
+                )
+            elif unsigned and length:
+                values.extend(int.from_bytes(data, "big") for data in run_datas)
+            else:
+                break
+        if _debug:
+            Atomic._debug("    - %d of %d values", len(values), len(tag_datas))
+
+        result = build(cls, values)
+        tag_list.skip(len(values))
+
+        return cast(_List[Atomic], result)
+
+    @classmethod
+    def encode_app_tags(cls, items: _List[_Any]) -> Optional[_List[Tag]]:
+        """
+        Encode a list of instances of this class as application tags all at
+        once, or return None if they need to be encoded one at a time.
+        """
+        codec = _find_bulk_app_tag_codec(cls)
+        if codec is None:
+            return None
+        tag_number, _, _, _, encode_fn = codec
+
+        for item in items:
+            if item.__class__ is not cls:
+                return None
+
+        tag_datas = encode_fn(items)
+        if tag_datas is None:
+            return None
+
+        app_class = TagClass.application
+        return [Tag._make(app_class, tag_number, len(data), data) for data in tag_datas]
+
 
 @bacpypes_debugging
 class Null(Atomic, tuple):
@@ -1022,9 +1255,7 @@ class Unsigned(Atomic, int):
             raise InvalidTag("invalid tag length")
 
         # get the data
-        value = 0
-        for c in tag.tag_data:
-            value = (value << 8) + c
+        value = int.from_bytes(tag.tag_data, "big")
         if _debug:
             Unsigned._debug("    - value: %r", value)
 
@@ -1143,11 +1374,7 @@ class Integer(Atomic, int):
             raise InvalidTag("invalid tag length")
 
         # get the data
-        value = tag.tag_data[0]
-        if (value & 0x80) != 0:
-            value = (-1 << 8) | value
-        for c in tag.tag_data[1:]:
-            value = (value << 8) | c
+        value = int.from_bytes(tag.tag_data, "big", signed=True)
         if _debug:
             Unsigned._debug("    - value: %r", value)
 
@@ -1960,9 +2187,7 @@ class Enumerated(Atomic, int, metaclass=EnumeratedMetaclass):
             raise InvalidTag("invalid tag length")
 
         # get the data
-        value = 0
-        for c in tag.tag_data:
-            value = (value << 8) + c
+        value = int.from_bytes(tag.tag_data, "big")
         if _debug:
             Enumerated._debug("    - value: %r", value)
 
@@ -3171,3 +3396,193 @@ Tag._app_tag_class = [
     None,  # type: ignore[list-item]
     None,  # type: ignore[list-item]
 ]
+
+
+#
+#   Fast Application Tag Decoders
+#
+
+_real_struct = struct.Struct(">f")
+_double_struct = struct.Struct(">d")
+
+
+def _decode_boolean_tag(tag: Tag) -> Optional[bool]:
+    return bool(tag.tag_lvt)
+
+
+def _decode_unsigned_tag(tag: Tag) -> Optional[int]:
+    if not tag.tag_data:
+        return None
+    return int.from_bytes(tag.tag_data, "big")
+
+
+def _decode_integer_tag(tag: Tag) -> Optional[int]:
+    if not tag.tag_data:
+        return None
+    return int.from_bytes(tag.tag_data, "big", signed=True)
+
+
+def _decode_real_tag(tag: Tag) -> Optional[float]:
+    if len(tag.tag_data) != 4:
+        return None
+    return cast(float, _real_struct.unpack_from(tag.tag_data)[0])
+
+
+def _decode_double_tag(tag: Tag) -> Optional[float]:
+    if len(tag.tag_data) != 8:
+        return None
+    return cast(float, _double_struct.unpack_from(tag.tag_data)[0])
+
+
+def _decode_object_identifier_tag(tag: Tag) -> Optional[int]:
+    if len(tag.tag_data) != 4:
+        return None
+    return int.from_bytes(tag.tag_data, "big")
+
+
+# application tag number to the class and a function that returns the value
+# from the tag, or None if the tag should be decoded the long way to get the
+# appropriate error
+_app_tag_decoders: Dict[int, Tuple[type, Callable[[Tag], _Any]]] = {
+    TagNumber.boolean: (Boolean, _decode_boolean_tag),
+    TagNumber.unsigned: (Unsigned, _decode_unsigned_tag),
+    TagNumber.integer: (Integer, _decode_integer_tag),
+    TagNumber.real: (Real, _decode_real_tag),
+    TagNumber.double: (Double, _decode_double_tag),
+    TagNumber.enumerated: (Enumerated, _decode_unsigned_tag),
+    TagNumber.objectIdentifier: (ObjectIdentifier, _decode_object_identifier_tag),
+}
+
+# (class, tag number) to the decoder function or None
+_app_tag_class_decoders: Dict[Tuple[type, int], Optional[Callable[[Tag], _Any]]] = {}
+
+
+def _find_app_tag_decoder(
+    cls: type, tag_number: int
+) -> Optional[Callable[[Tag], _Any]]:
+    """
+    Return the decoder function for the class and tag number if the class
+    decodes application tags the same way as the class in the table.
+    """
+    if tag_number not in _app_tag_decoders:
+        return None
+    base_class, decoder = _app_tag_decoders[tag_number]
+
+    if not issubclass(cls, base_class):
+        return None
+    if cls._context is not None:  # type: ignore[attr-defined]
+        return None
+    if cls.decode.__func__ is not base_class.decode.__func__:  # type: ignore[attr-defined]
+        return None
+
+    return decoder
+
+
+#
+#   Bulk Application Tag Codecs
+#
+
+# struct format characters for the fixed length encodings by length
+_unsigned_formats = {1: "B", 2: "H", 4: "L"}
+
+
+def _build_atomics(cls: type, values: _List[_Any]) -> _List[Atomic]:
+    cast_fn = cls.cast  # type: ignore[attr-defined]
+    return [type.__call__(cls, cast_fn(value)) for value in values]
+
+
+def _build_object_identifiers(cls: type, values: _List[int]) -> _List[Atomic]:
+    # object types are shared rather than built for every identifier
+    object_type_class = cls.object_type_class  # type: ignore[attr-defined]
+    object_types: Dict[int, Enumerated] = {}
+
+    result = []
+    for value in values:
+        object_type = object_types.get(value >> 22)
+        if object_type is None:
+            object_type = object_types[value >> 22] = object_type_class(value >> 22)
+        result.append(type.__call__(cls, (object_type, value & 0x3FFFFF)))
+
+    return result
+
+
+def _encode_reals(items: _List[_Any]) -> Optional[_List[bytes]]:
+    data = struct.pack(">%df" % (len(items),), *items)
+    return [data[i : i + 4] for i in range(0, len(data), 4)]
+
+
+def _encode_doubles(items: _List[_Any]) -> Optional[_List[bytes]]:
+    data = struct.pack(">%dd" % (len(items),), *items)
+    return [data[i : i + 8] for i in range(0, len(data), 8)]
+
+
+def _encode_unsigneds(items: _List[_Any]) -> Optional[_List[bytes]]:
+    # let encode() raise the error for values that don't fit
+    if items and ((min(items) < 0) or (max(items) > 0xFFFFFFFF)):
+        return None
+    return [item.to_bytes((item.bit_length() + 7) // 8 or 1, "big") for item in items]
+
+
+def _encode_object_identifiers(items: _List[_Any]) -> Optional[_List[bytes]]:
+    data = struct.pack(
+        ">%dL" % (len(items),), *[(item[0] << 22) + item[1] for item in items]
+    )
+    return [data[i : i + 4] for i in range(0, len(data), 4)]
+
+
+# class to the application tag number, struct formats by length, True if
+# other lengths are unsigned integers, a function to build the objects
+# from the values, and a function that returns the tag data of each item
+_bulk_app_tag_codecs: Dict[type, Tuple[_Any, ...]] = {
+    Double: (TagNumber.double, {8: "d"}, False, _build_atomics, _encode_doubles),
+    Real: (TagNumber.real, {4: "f"}, False, _build_atomics, _encode_reals),
+    Unsigned: (
+        TagNumber.unsigned,
+        _unsigned_formats,
+        True,
+        _build_atomics,
+        _encode_unsigneds,
+    ),
+    Enumerated: (
+        TagNumber.enumerated,
+        _unsigned_formats,
+        True,
+        _build_atomics,
+        _encode_unsigneds,
+    ),
+    ObjectIdentifier: (
+        TagNumber.objectIdentifier,
+        {4: "L"},
+        False,
+        _build_object_identifiers,
+        _encode_object_identifiers,
+    ),
+}
+
+# class to the bulk codec or None
+_bulk_app_tag_class_codecs: Dict[type, Optional[Tuple[_Any, ...]]] = {}
+
+
+def _find_bulk_app_tag_codec(cls: type) -> Optional[Tuple[_Any, ...]]:
+    """
+    Return the bulk codec for the class if it encodes and decodes application
+    tags the same way as the class in the table.
+    """
+    if cls in _bulk_app_tag_class_codecs:
+        return _bulk_app_tag_class_codecs[cls]
+
+    codec = None
+    for base_class, base_codec in _bulk_app_tag_codecs.items():
+        if not issubclass(cls, base_class):
+            continue
+        if (
+            (cls._context is None)  # type: ignore[attr-defined]
+            and (cls.decode.__func__ is base_class.decode.__func__)  # type: ignore[attr-defined]
+            and (cls.encode is base_class.encode)  # type: ignore[attr-defined]
+            and (cls.cast.__func__ is base_class.cast.__func__)  # type: ignore[attr-defined]
+        ):
+            codec = base_codec
+        break
+
+    _bulk_app_tag_class_codecs[cls] = codec
+    return codec
@@ -676,7 +676,7 @@ class Result(LPDU):
             if not pdu.pduData:
                 error_details = ""
             else:
-                error_details = pdu.get_data(len(pdu.pduData)).decode("utf-8")
+                error_details = pdu.get_data(pdu.remaining()).decode("utf-8")
 
             return Result(
                 result_function=result_function,
@@ -731,7 +731,7 @@ class EncapsulatedNPDU(LPDU):
             EncapsulatedNPDU._debug("decode %r", pdu)
 
         lpdu = EncapsulatedNPDU()
-        lpdu.put_data(pdu.get_data(len(pdu.pduData)))
+        lpdu.put_data(pdu.get_data(pdu.remaining()))
 
         return lpdu
 
@@ -805,7 +805,7 @@ class AddressResolutionACK(LPDU):
         if not pdu.pduData:
             lpdu.websocket_uris = ""
         else:
-            lpdu.websocket_uris = pdu.get_data(len(pdu.pduData)).decode("utf-8")
+            lpdu.websocket_uris = pdu.get_data(pdu.remaining()).decode("utf-8")
 
         return lpdu
 
@@ -1216,7 +1216,7 @@ class ProprietaryMessage(LPDU):
 
         vendor_identifier = pdu.get_short()
         proprietary_function = pdu.get()
-        proprietary_data = pdu.get_data(len(pdu.pduData))
+        proprietary_data = pdu.get_data(pdu.remaining())
 
         return ProprietaryMessage(
             vendor_identifier,
@@ -15,6 +15,7 @@ from typing import (
 
 from ..settings import settings
 from ..debugging import bacpypes_debugging, DebugContents, ModuleLogger
+from ..timer import COARSE_RESOLUTION, Timer, get_timer_wheel
 
 from ..pdu import Address
 
@@ -34,6 +35,7 @@ from ..apdu import (
     UnconfirmedCOVNotificationRequest,
 )
 from ..vendor import get_vendor_info
+from .object import ValueCache
 
 # some debugging
 _debug = 0
@@ -175,9 +177,9 @@ class SubscriptionContextManager:
             SubscriptionContextManager._debug("    - loop time: %r", loop.time())
 
         # refresh time before it expires
-        self.refresh_subscription_handle = loop.call_later(
-            max(1.0, self.lifetime - 2.0), self.create_refresh_task
-        )
+        self.refresh_subscription_handle = get_timer_wheel(
+            COARSE_RESOLUTION
+        ).call_later(max(1.0, self.lifetime - 2.0), self.create_refresh_task)
         if _debug:
             SubscriptionContextManager._debug(
                 "    - refresh_subscription_handle: %r",
@@ -309,7 +311,7 @@ class Subscription(DebugContents):
         "lifetime",
     )
 
-    cancel_handle: Optional[asyncio.TimerHandle]
+    cancel_handle: Optional[Timer]
 
     def __init__(
         self, obj_ref, client_addr, proc_id, obj_id, confirmed, lifetime, cov_inc
@@ -338,8 +340,7 @@ class Subscription(DebugContents):
 
         # if lifetime is zero this is a permanent subscription
         if lifetime > 0:
-            loop = asyncio.get_running_loop()
-            self.cancel_handle = loop.call_later(
+            self.cancel_handle = get_timer_wheel(COARSE_RESOLUTION).call_later(
                 lifetime, self.obj_ref._app.cancel_subscription, self
             )
         else:
@@ -371,8 +372,7 @@ class Subscription(DebugContents):
 
         # reschedule a cancel if it's not infinite
         if lifetime > 0:
-            loop = asyncio.get_running_loop()
-            self.cancel_handle = loop.call_later(
+            self.cancel_handle = get_timer_wheel(COARSE_RESOLUTION).call_later(
                 lifetime, self.obj_ref._app.cancel_subscription, self
             )
 
@@ -384,6 +384,9 @@ class Subscription(DebugContents):
 
 @bacpypes_debugging
 class ChangeOfValueServices:
+    device_info_cache: "DeviceInfoCache"  # noqa: F821
+    value_cache: Optional[ValueCache] = None
+
     def __init__(self):
         if _debug:
             ChangeOfValueServices._debug("__init__")
@@ -463,6 +466,12 @@ class ChangeOfValueServices:
                 ChangeOfValueServices._debug("    - scm not found")
             raise ServicesError(errorCode="unknownSubscription")
 
+        # update the cache of values read from the device
+        if self.value_cache is not None:
+            await self.cache_property_values(
+                address, apdu.monitoredObjectIdentifier, apdu.listOfValues
+            )
+
         # queue the property values
         for property_value in apdu.listOfValues:
             await scm.put(property_value)
@@ -495,10 +504,44 @@ class ChangeOfValueServices:
                 ChangeOfValueServices._debug("    - scm not found")
             return
 
+        # update the cache of values read from the device
+        if self.value_cache is not None:
+            await self.cache_property_values(
+                address, apdu.monitoredObjectIdentifier, apdu.listOfValues
+            )
+
         # queue the property values
         for property_value in apdu.listOfValues:
             await scm.put(property_value)
 
+    async def cache_property_values(
+        self,
+        address: Address,
+        monitored_object_identifier: ObjectIdentifier,
+        list_of_values,
+    ) -> None:
+        """
+        Add the values from a change of value notification to the value cache.
+        """
+        if _debug:
+            ChangeOfValueServices._debug(
+                "cache_property_values %r %r", address, monitored_object_identifier
+            )
+        assert self.value_cache is not None
+
+        # get information about the device from the application cache
+        device_info = await self.device_info_cache.get_device_info(address)
+
+        # using the device info, look up the vendor information
+        if device_info:
+            vendor_info = get_vendor_info(device_info.vendor_identifier)
+        else:
+            vendor_info = get_vendor_info(0)
+
+        self.value_cache.put_property_values(
+            address, monitored_object_identifier, list_of_values, vendor_info
+        )
+
     # -----
 
     def add_subscription(self, cov):
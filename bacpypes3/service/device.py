@@ -14,6 +14,7 @@ from typing import (
 )
 
 from ..debugging import bacpypes_debugging, ModuleLogger
+from ..timer import get_timer_wheel
 
 from ..pdu import Address, GlobalBroadcast
 
@@ -99,7 +100,9 @@ class WhoIsFuture:
             WhoIsFuture._debug("    - loop time: %r", loop.time())
 
         # schedule a call
-        self.who_is_timeout_handle = loop.call_later(self.timeout, self.who_is_timeout)
+        self.who_is_timeout_handle = get_timer_wheel().call_later(
+            self.timeout, self.who_is_timeout
+        )
         if _debug:
             WhoIsFuture._debug(
                 "    - who_is_timeout_handle: %r", self.who_is_timeout_handle
@@ -369,7 +372,7 @@ class WhoHasFuture:
             WhoHasFuture._debug("    - loop time: %r", loop.time())
 
         # schedule a call
-        self.who_has_timeout_handle = loop.call_later(
+        self.who_has_timeout_handle = get_timer_wheel().call_later(
             self.timeout, self.who_has_timeout
         )
         if _debug:
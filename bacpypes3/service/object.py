@@ -4,9 +4,11 @@ Application Module
 
 from __future__ import annotations
 
+import asyncio
 import inspect
+from functools import partial
 from typing import Any as _Any
-from typing import Callable, Optional, Tuple, Union
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
 
 from ..apdu import (
     ErrorRejectAbortNack,
@@ -32,9 +34,10 @@ from ..basetypes import (
     ReadAccessResultElement,
     ReadAccessResultElementChoice,
     ReadAccessSpecification,
+    PropertyValue,
 )
-from ..constructeddata import Any, Array, List, SequenceOf
-from ..debugging import ModuleLogger, bacpypes_debugging
+from ..constructeddata import Array, List, SequenceOf
+from ..debugging import DebugContents, ModuleLogger, bacpypes_debugging
 from ..errors import ExecutionError, ObjectError, PropertyError, RejectException
 from ..object import DeviceObject
 from ..pdu import Address
@@ -45,6 +48,304 @@ from ..vendor import VendorInfo, get_vendor_info
 _debug = 0
 _log = ModuleLogger(globals())
 
+#
+#   ReadCoalescing
+#
+
+
+@bacpypes_debugging
+class ReadCoalescing:
+    """
+    Concurrent reads with the same parameters share one outstanding request
+    and every caller gets the same result, or the same exception.  The read
+    runs in its own task so a caller that is cancelled does not cancel it for
+    the others.
+    """
+
+    _debug: Callable[..., None]
+
+    reads: Dict[Tuple, asyncio.Future]
+    read_count: int
+    coalesced_count: int
+
+    def __init__(self) -> None:
+        if _debug:
+            ReadCoalescing._debug("__init__")
+
+        self.reads = {}
+        self.read_count = 0
+        self.coalesced_count = 0
+
+    async def read(self, key: Tuple, read_fn: Callable[[], Awaitable[_Any]]) -> _Any:
+        """
+        Return the result of the read in flight with the same key, or call
+        read_fn() to start one.
+        """
+        future = self.reads.get(key, None)
+        if future is not None:
+            if _debug:
+                ReadCoalescing._debug("read %r (coalesced)", key)
+            self.coalesced_count += 1
+        else:
+            if _debug:
+                ReadCoalescing._debug("read %r", key)
+            self.read_count += 1
+
+            future = asyncio.ensure_future(read_fn())
+            future.add_done_callback(partial(self._read_done, key))
+            self.reads[key] = future
+
+        return await asyncio.shield(future)
+
+    def _read_done(self, key: Tuple, future: asyncio.Future) -> None:
+        """
+        The read is finished, the exception is retrieved here in case all of
+        the callers have been cancelled and none of them will.
+        """
+        self.reads.pop(key, None)
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of reads sent, coalesced, and in flight."""
+        return {
+            "read_count": self.read_count,
+            "coalesced_count": self.coalesced_count,
+            "in_flight": len(self.reads),
+        }
+
+
+def _property_reference_key(property_reference: _Any) -> _Any:
+    """Property references are compared by identity, use their contents."""
+    if isinstance(property_reference, PropertyReference):
+        return (
+            property_reference.propertyIdentifier,
+            property_reference.propertyArrayIndex,
+        )
+    return property_reference
+
+
+#
+#   ValueCache
+#
+
+
+@bacpypes_debugging
+class ValueCache(DebugContents):
+    """
+    A bounded, least recently used cache of property values read from other
+    devices.  Each property identifier can have its own maximum age in
+    seconds, None for values that do not change, and properties that are not
+    listed use the default maximum age, zero when they should not be cached.
+
+    The values are not copied, every hit returns the same object that was
+    put in the cache, so they are read-only.  A caller that changes a list,
+    array, or sequence that it read must make its own copy first.
+    """
+
+    _debug: Callable[..., None]
+    _debug_contents = ("maxsize", "default_max_age", "hits", "misses")
+
+    max_age: Dict[PropertyIdentifier, Optional[float]]
+    default_max_age: Optional[float]
+    maxsize: int
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        max_age: Optional[Dict[_Any, Optional[float]]] = None,
+        default_max_age: Optional[float] = 0.0,
+        maxsize: int = 4096,
+    ) -> None:
+        if _debug:
+            ValueCache._debug(
+                "__init__ max_age=%r default_max_age=%r maxsize=%r",
+                max_age,
+                default_max_age,
+                maxsize,
+            )
+
+        self.max_age = {
+            PropertyIdentifier(prop): age for prop, age in (max_age or {}).items()
+        }
+        self.default_max_age = default_max_age
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        # dictionaries keep insertion order, the oldest entry is first, the
+        # values are the time the entry expires (None if never) and the value
+        self._cache: Dict[Tuple, Tuple[Optional[float], _Any]] = {}
+
+    @staticmethod
+    def key(
+        address: Address,
+        objid: _Any,
+        prop: _Any,
+        array_index: Optional[int] = None,
+    ) -> Tuple:
+        """
+        Return the key for a property value, the object identifier and
+        property identifier can be strings like they can in a request.
+        """
+        if not isinstance(objid, ObjectIdentifier):
+            objid = ObjectIdentifier(objid)
+        if isinstance(prop, str):
+            try:
+                prop = PropertyIdentifier(prop)
+            except ValueError:
+                pass
+
+        return (address, objid, prop, array_index)
+
+    def _lookup(self, key: Tuple, now: float) -> Tuple[bool, _Any]:
+        """Look for a value that is not too old without counting or moving it."""
+        entry = self._cache.get(key, None)
+        if entry is not None:
+            expires, value = entry
+            if (expires is None) or (expires > now):
+                return (True, value)
+        return (False, None)
+
+    def _touch(self, key: Tuple) -> None:
+        """The entry was used, make it the most recent one."""
+        self._cache[key] = self._cache.pop(key)
+
+    def get(self, key: Tuple) -> Tuple[bool, _Any]:
+        """
+        Return (True, value) if there is a value for the key that is not too
+        old, otherwise (False, None).  The value is shared, see above.
+        """
+        found, value = self._lookup(key, asyncio.get_event_loop().time())
+        if not found:
+            self._cache.pop(key, None)
+            self.misses += 1
+            return (False, None)
+
+        self.hits += 1
+        self._touch(key)
+        return (True, value)
+
+    def put(self, key: Tuple, value: _Any) -> None:
+        """
+        Add a value to the cache if the property should be cached, dropping
+        the oldest one when full.
+        """
+        max_age = self.max_age.get(key[2], self.default_max_age)
+        if (max_age is not None) and (max_age <= 0.0):
+            return
+        if self.maxsize <= 0:
+            return
+
+        if max_age is None:
+            expires = None
+        else:
+            expires = asyncio.get_event_loop().time() + max_age
+
+        cache = self._cache
+        cache.pop(key, None)
+        while len(cache) >= self.maxsize:
+            del cache[next(iter(cache))]
+        cache[key] = (expires, value)
+
+    def get_multiple(
+        self,
+        address: Address,
+        parameter_list: List[Union[ObjectIdentifier, List[PropertyReference]]],
+    ) -> Optional[
+        List[Tuple[ObjectIdentifier, PropertyIdentifier, Union[int, None], _Any]]
+    ]:
+        """
+        Return the results of a Read Property Multiple request if all of
+        the values are in the cache, otherwise None.  The request counts as
+        one hit or one miss and the entries are only made the most recent
+        ones when all of them are found.
+        """
+        now = asyncio.get_event_loop().time()
+        result_list = []
+        key_list = []
+        try:
+            while parameter_list:
+                objid, property_reference_list, *parameter_list = parameter_list
+                for property_reference in property_reference_list:
+                    if not isinstance(property_reference, PropertyReference):
+                        property_reference = PropertyReference(property_reference)
+                    key = ValueCache.key(
+                        address,
+                        objid,
+                        property_reference.propertyIdentifier,
+                        property_reference.propertyArrayIndex,
+                    )
+
+                    found, value = self._lookup(key, now)
+                    if not found:
+                        self.misses += 1
+                        return None
+                    result_list.append((key[1], key[2], key[3], value))
+                    key_list.append(key)
+        except (TypeError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        for key in key_list:
+            self._touch(key)
+
+        return result_list
+
+    def discard(self, key: Tuple) -> None:
+        """Remove a value from the cache, the property is being changed."""
+        self._cache.pop(key, None)
+
+    def put_property_values(
+        self,
+        address: Address,
+        objid: ObjectIdentifier,
+        list_of_values: List[PropertyValue],
+        vendor_info: VendorInfo,
+    ) -> None:
+        """
+        Add the values in a list of property values, like the ones in a change
+        of value notification.
+        """
+        object_class = vendor_info.get_object_class(objid[0])
+        if not object_class:
+            return
+
+        for property_value in list_of_values:
+            prop = property_value.propertyIdentifier
+            array_index = property_value.propertyArrayIndex
+
+            property_type = object_class.get_property_type(prop)
+            if not property_type:
+                continue
+            if issubclass(property_type, Array):
+                if array_index is None:
+                    pass
+                elif array_index == 0:
+                    property_type = Unsigned
+                else:
+                    property_type = property_type._subtype
+
+            try:
+                value = property_value.value.cast_out(property_type)
+            except Exception as err:
+                if _debug:
+                    ValueCache._debug("    - cast_out error: %r", err)
+                continue
+
+            self.put((address, objid, prop, array_index), value)
+
+    def clear(self) -> None:
+        """Remove all the values and reset the counters."""
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 #
 #   ReadProperty and WriteProperty Services
 #
@@ -56,6 +357,8 @@ class ReadWritePropertyServices:
 
     device_object: Optional[DeviceObject]
     device_info_cache: "DeviceInfoCache"  # noqa: F821
+    read_coalescing: Optional[ReadCoalescing] = None
+    value_cache: Optional[ValueCache] = None
 
     async def read_property(
         self,
@@ -74,6 +377,31 @@ class ReadWritePropertyServices:
                 "read_property %r %r %r %r", address, objid, prop, array_index
             )
 
+        if self.value_cache is not None:
+            found, value = self.value_cache.get(
+                ValueCache.key(address, objid, prop, array_index)
+            )
+            if found:
+                if _debug:
+                    ReadWritePropertyServices._debug("    - cached: %r", value)
+                return value
+
+        if self.read_coalescing is None:
+            return await self._read_property(address, objid, prop, array_index)
+
+        return await self.read_coalescing.read(
+            ("read_property",) + ValueCache.key(address, objid, prop, array_index),
+            lambda: self._read_property(address, objid, prop, array_index),
+        )
+
+    async def _read_property(
+        self,
+        address: Address,
+        objid: ObjectIdentifier,
+        prop: PropertyIdentifier,
+        array_index: Optional[int],
+    ) -> _Any:
+
         # create a request
         read_property_request = ReadPropertyRequest(
             objectIdentifier=objid,
@@ -149,6 +477,11 @@ class ReadWritePropertyServices:
                 "    - property_value: %r %r", property_value, property_type.__class__
             )
 
+        if self.value_cache is not None:
+            self.value_cache.put(
+                ValueCache.key(address, objid, prop, array_index), property_value
+            )
+
         return property_value
 
     async def write_property(
@@ -223,6 +556,11 @@ class ReadWritePropertyServices:
                 ReadWritePropertyServices._debug("    - cast: %r", value)
             value = property_type(value)
 
+        # the value is changing
+        if self.value_cache is not None:
+            self.value_cache.discard(ValueCache.key(address, objid, prop, array_index))
+            self.value_cache.discard(ValueCache.key(address, objid, prop))
+
         # build a request
         write_property_request = WritePropertyRequest(
             objectIdentifier=objid,
@@ -279,7 +617,7 @@ class ReadWritePropertyServices:
 
         # get the value
         try:
-            value = await obj.read_property(
+            value = await obj.read_property_to_any(
                 apdu.propertyIdentifier, apdu.propertyArrayIndex
             )
             if _debug:
@@ -377,13 +715,13 @@ async def read_property_to_any(obj, propertyIdentifier, propertyArrayIndex=None)
         )
 
     try:
-        # get the value
-        value = await obj.read_property(propertyIdentifier, propertyArrayIndex)
+        # get the encoded value
+        result = await obj.read_property_to_any(propertyIdentifier, propertyArrayIndex)
         if _debug:
-            read_property_to_any._debug("    - value: %r", value)
+            read_property_to_any._debug("    - result: %r", result)
 
         # property could be there, but it's not
-        if value is None:
+        if result is None:
             raise PropertyError(errorCode="unknownProperty")
     except AttributeError:
         raise PropertyError(errorCode="unknownProperty")
@@ -395,11 +733,6 @@ async def read_property_to_any(obj, propertyIdentifier, propertyArrayIndex=None)
     if datatype is None:
         raise PropertyError(errorCode="datatypeNotSupported")
 
-    # encode the value
-    result = Any(value)
-    if _debug:
-        read_property_to_any._debug("    - result: %r", result)
-
     # return the object
     return result
 
@@ -460,6 +793,8 @@ class ReadWritePropertyMultipleServices:
 
     device_object: Optional[DeviceObject]
     device_info_cache: "DeviceInfoCache"  # noqa: F821
+    read_coalescing: Optional[ReadCoalescing] = None
+    value_cache: Optional[ValueCache] = None
 
     async def read_property_multiple(
         self,
@@ -472,6 +807,36 @@ class ReadWritePropertyMultipleServices:
                 "read_property_multiple %r %r", address, parameter_list
             )
 
+        if self.value_cache is not None:
+            result_list = self.value_cache.get_multiple(address, parameter_list)
+            if result_list is not None:
+                if _debug:
+                    ReadWritePropertyMultipleServices._debug("    - cached")
+                return result_list
+
+        if self.read_coalescing is None:
+            return await self._read_property_multiple(
+                address, parameter_list, vendor_info
+            )
+
+        parameter_key = tuple(
+            tuple(_property_reference_key(ref) for ref in parameter)
+            if isinstance(parameter, (list, tuple))
+            else parameter
+            for parameter in parameter_list
+        )
+        return await self.read_coalescing.read(
+            ("read_property_multiple", address, parameter_key, id(vendor_info)),
+            lambda: self._read_property_multiple(address, parameter_list, vendor_info),
+        )
+
+    async def _read_property_multiple(
+        self,
+        address: Address,
+        parameter_list: List[Union[ObjectIdentifier, List[PropertyReference]]],
+        vendor_info: Optional[VendorInfo],
+    ) -> List[Tuple[ObjectIdentifier, PropertyIdentifier, Union[int, None], _Any]]:
+
         # if the vendor information was provided, use it, otherwise get the
         # device information based on its address and look up the vendor
         # information from that
@@ -627,6 +992,16 @@ class ReadWritePropertyMultipleServices:
                         property_value,
                         property_value.__class__,
                     )
+                if self.value_cache is not None:
+                    self.value_cache.put(
+                        (
+                            address,
+                            object_identifier,
+                            property_identifier,
+                            property_array_index,
+                        ),
+                        property_value,
+                    )
 
                 result_list.append(
                     (
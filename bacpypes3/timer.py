@@ -0,0 +1,339 @@
+"""
+Timer Wheel
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+
+from typing import (
+    Any as _Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .debugging import ModuleLogger, DebugContents, bacpypes_debugging
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+# each level of the wheel has this many slots
+_slot_bits = 8
+_slot_count = 1 << _slot_bits
+_slot_mask = _slot_count - 1
+_level_count = 4
+
+# default resolutions
+FINE_RESOLUTION = 0.01
+COARSE_RESOLUTION = 1.0
+
+# wheels for each event loop
+_timer_wheels: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[float, TimerWheel]
+] = weakref.WeakKeyDictionary()
+
+
+#
+#   Timer
+#
+
+
+class Timer:
+    """
+    A callback scheduled on a timer wheel.  It has the same cancel(),
+    cancelled() and when() methods as an asyncio.TimerHandle and it can be
+    restarted without scheduling anything with the event loop.
+    """
+
+    __slots__ = (
+        "_wheel",
+        "_callback",
+        "_args",
+        "_when",
+        "_tick",
+        "_slot",
+        "_cancelled",
+    )
+
+    _slot: Optional[Dict[Timer, None]]
+
+    def __init__(
+        self, wheel: TimerWheel, callback: Callable[..., None], args: Tuple[_Any, ...]
+    ) -> None:
+        self._wheel = wheel
+        self._callback = callback
+        self._args = args
+        self._when = 0.0
+        self._tick = 0
+        self._slot = None
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        state = "cancelled" if self._cancelled else "when=%r" % (self._when,)
+        return "<%s %r %s>" % (self.__class__.__name__, self._callback, state)
+
+    def when(self) -> float:
+        """Return the event loop time the callback was scheduled for."""
+        return self._when
+
+    def scheduled(self) -> bool:
+        """Return True if the callback has not been called or canceled."""
+        return self._slot is not None
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the callback, it can be restarted later."""
+        self._cancelled = True
+        self._wheel._remove(self)
+
+    def restart(self, delay: float) -> None:
+        """Schedule the callback for delay seconds from now."""
+        self._cancelled = False
+        self._wheel._schedule(self, self._wheel.loop.time() + delay)
+
+
+#
+#   TimerWheel
+#
+
+
+@bacpypes_debugging
+class TimerWheel(DebugContents):
+    """
+    A hierarchical timer wheel that shares one event loop timer for all of
+    the callbacks scheduled with it.  Each level has 256 slots and each slot
+    of a level covers all of the slots of the level below it, so timers far
+    in the future are kept coarsely and moved closer to the first level as
+    time passes.  Callbacks are called within half of the resolution of the
+    time they were scheduled for.
+    """
+
+    _debug: Callable[..., None]
+    _exception: Callable[..., None]
+    _debug_contents: Tuple[str, ...] = ("resolution", "count", "_tick", "_handle_tick")
+
+    resolution: float
+    count: int
+
+    _origin: float
+    _tick: int
+    _levels: List[List[Dict[Timer, None]]]
+    _handle: Optional[asyncio.TimerHandle]
+    _handle_tick: int
+
+    def __init__(
+        self,
+        resolution: float = FINE_RESOLUTION,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        if _debug:
+            TimerWheel._debug("__init__ resolution=%r", resolution)
+
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self._loop = weakref.ref(loop)
+
+        self.resolution = resolution
+        self.count = 0
+
+        # tick zero is now, this is the next tick to process
+        self._origin = loop.time()
+        self._tick = 0
+        self._levels = [
+            [{} for _ in range(_slot_count)] for _ in range(_level_count)
+        ]
+
+        self._handle = None
+        self._handle_tick = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop()
+        assert loop is not None
+        return loop
+
+    def call_later(self, delay: float, callback: Callable[..., None], *args) -> Timer:
+        """Schedule callback(*args) to be called delay seconds from now."""
+        return self.call_at(self.loop.time() + delay, callback, *args)
+
+    def call_at(self, when: float, callback: Callable[..., None], *args) -> Timer:
+        """Schedule callback(*args) to be called at the event loop time."""
+        timer = Timer(self, callback, args)
+        self._schedule(timer, when)
+        return timer
+
+    def _schedule(self, timer: Timer, when: float) -> None:
+        if timer._slot is not None:
+            del timer._slot[timer]
+            self.count -= 1
+
+        # an empty wheel has nothing to catch up on
+        if not self.count:
+            now_tick = int((self.loop.time() - self._origin) / self.resolution)
+            self._tick = max(self._tick, now_tick)
+
+        timer._when = when
+        timer._tick = max(self._tick, round((when - self._origin) / self.resolution))
+        level = self._insert(timer)
+        self.count += 1
+
+        # make sure the wheel is turning in time for this one, or in time to
+        # move it down from the level it is in
+        shift = _slot_bits * level
+        due_tick = max(self._tick, (timer._tick >> shift) << shift)
+        if (self._handle is None) or (due_tick < self._handle_tick):
+            self._set_handle(due_tick)
+
+    def _remove(self, timer: Timer) -> None:
+        if timer._slot is not None:
+            del timer._slot[timer]
+            timer._slot = None
+            self.count -= 1
+
+    def _insert(self, timer: Timer) -> int:
+        """Put the timer in the slot of the level that covers its tick."""
+        delta = timer._tick - self._tick
+        level = 0
+        while (level < _level_count - 1) and (
+            delta >= (1 << (_slot_bits * (level + 1)))
+        ):
+            level += 1
+
+        slot = self._levels[level][(timer._tick >> (_slot_bits * level)) & _slot_mask]
+        slot[timer] = None
+        timer._slot = slot
+
+        return level
+
+    def _next_tick(self) -> int:
+        """
+        Return the next tick that has timers to call or to move down a level,
+        the ticks in between have nothing to do and can be skipped.
+        """
+        tick = self._tick
+        next_tick = None
+        for level in range(_level_count):
+            shift = _slot_bits * level
+            parent_shift = shift + _slot_bits
+            slots = self._levels[level]
+
+            # the slot of the current tick has already been moved down unless
+            # this tick is the start of it
+            index = (tick >> shift) & _slot_mask
+            if (level > 0) and (tick & ((1 << shift) - 1)):
+                index += 1
+
+            # look at the rest of the slots for this slot of the level above,
+            # then the ones that have wrapped around for the next one
+            block = (tick >> parent_shift) << parent_shift
+            candidate = None
+            for i in range(index, _slot_count):
+                if slots[i]:
+                    candidate = block | (i << shift)
+                    break
+            else:
+                for i in range(min(index, _slot_count)):
+                    if slots[i]:
+                        candidate = (block + (1 << parent_shift)) | (i << shift)
+                        break
+
+            if (candidate is not None) and (
+                (next_tick is None) or (candidate < next_tick)
+            ):
+                next_tick = candidate
+
+        assert next_tick is not None
+        return next_tick
+
+    def _set_handle(self, tick: int) -> None:
+        if self._handle:
+            self._handle.cancel()
+
+        self._handle_tick = tick
+        self._handle = self.loop.call_at(
+            self._origin + tick * self.resolution, self._wakeup
+        )
+
+    def _wakeup(self) -> None:
+        self._handle = None
+
+        # the loop might wake up a little early
+        now_tick = int((self.loop.time() - self._origin) / self.resolution)
+        target_tick = max(now_tick, self._handle_tick)
+
+        # skip over the ticks that have nothing to do
+        while self.count:
+            next_tick = self._next_tick()
+            if next_tick > target_tick:
+                break
+            self._tick = next_tick
+            self._process_tick()
+        if not self.count:
+            self._tick = max(self._tick, target_tick + 1)
+            return
+        self._tick = max(self._tick, target_tick + 1)
+
+        next_tick = self._next_tick()
+        if (self._handle is None) or (next_tick < self._handle_tick):
+            self._set_handle(next_tick)
+
+    def _process_tick(self) -> None:
+        tick = self._tick
+
+        # when a level wraps around move the next slot of the level above down
+        level = 1
+        while (level < _level_count) and not (
+            tick & ((1 << (_slot_bits * level)) - 1)
+        ):
+            slots = self._levels[level]
+            index = (tick >> (_slot_bits * level)) & _slot_mask
+            if slots[index]:
+                timers = slots[index]
+                slots[index] = {}
+                for timer in timers:
+                    self._insert(timer)
+            level += 1
+
+        # the timers for this tick, callbacks that schedule something right
+        # away get the next tick
+        slots = self._levels[0]
+        index = tick & _slot_mask
+        timers = slots[index]
+        self._tick = tick + 1
+        if not timers:
+            return
+        slots[index] = {}
+
+        for timer in timers:
+            timer._slot = None
+            self.count -= 1
+
+            try:
+                timer._callback(*timer._args)
+            except Exception as err:
+                TimerWheel._exception("exception in %r: %r", timer, err)
+
+
+def get_timer_wheel(resolution: float = FINE_RESOLUTION) -> TimerWheel:
+    """
+    Return the timer wheel with the resolution that is shared by everything
+    running in the current event loop.
+    """
+    loop = asyncio.get_event_loop()
+
+    timer_wheels = _timer_wheels.get(loop, None)
+    if timer_wheels is None:
+        timer_wheels = _timer_wheels[loop] = {}
+
+    timer_wheel = timer_wheels.get(resolution, None)
+    if timer_wheel is None:
+        timer_wheel = timer_wheels[resolution] = TimerWheel(resolution, loop)
+
+    return timer_wheel
@@ -13,3 +13,7 @@ from . import test_utilities  # noqa: F401
 
 from . import test_primitive_data  # noqa: F401
 from . import test_constructed_data  # noqa: F401
+from . import test_local  # noqa: F401
+from . import test_appservice  # noqa: F401
+from . import test_timer  # noqa: F401
+from . import test_lib  # noqa: F401
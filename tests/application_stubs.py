@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Application Stubs
+-----------------
+"""
+
+import asyncio
+
+from bacpypes3.debugging import ModuleLogger
+from bacpypes3.app import DeviceInfoCache
+from bacpypes3.appservice import ApplicationServiceAccessPoint
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+class ElementService:
+    """
+    Stands in for the stack below an application and keeps the APDUs that
+    the application sends.
+    """
+
+    def __init__(self):
+        self.apdus = []
+
+    async def sap_indication(self, apdu):
+        self.apdus.append(apdu)
+
+
+async def settle():
+    """Give the tasks that are ready a few chances to run."""
+    for _ in range(4):
+        await asyncio.sleep(0)
+
+
+class ServiceAccessPoint(ApplicationServiceAccessPoint):
+    """
+    An application service access point that keeps the APDUs it sends down
+    the stack in sent and the ones it passes up to the application in
+    received.
+    """
+
+    def __init__(self, device_info_cache=None):
+        ApplicationServiceAccessPoint.__init__(
+            self, device_info_cache=device_info_cache or DeviceInfoCache()
+        )
+        self.sent = []
+        self.received = []
+
+    async def request(self, apdu):
+        self.sent.append(apdu)
+
+    async def sap_request(self, apdu):
+        self.received.append(apdu)
+
+    async def sap_response(self, apdu):
+        self.received.append(apdu)
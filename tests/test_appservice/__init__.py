@@ -0,0 +1,15 @@
+#!/usr/bin/python
+
+"""
+Test Application Service
+------------------------
+"""
+
+from . import test_transactions
+from . import test_invoke_id
+from . import test_scheduler
+from . import test_segmentation
+from . import test_apdu_timeout
+from . import test_read_coalescing
+from . import test_value_cache
+from . import test_response_cache
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Adaptive APDU Timeout
+--------------------------
+"""
+
+import unittest
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.apdu import ConfirmedRequestPDU, SimpleAckPDU
+from bacpypes3.appservice import ClientSSM
+from bacpypes3.app import DeviceInfo, DeviceInfoCache
+
+from ..application_stubs import ServiceAccessPoint
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def setup_device(device_instance, address):
+    device_info_cache = DeviceInfoCache()
+    device_info = DeviceInfo(device_instance, address)
+    device_info_cache.address_cache[address] = device_info
+    device_info_cache.instance_cache[device_instance] = device_info
+
+    return device_info_cache, device_info
+
+
+@bacpypes_debugging
+class TestRoundTripTime(unittest.TestCase):
+    def test_rtt_sample(self):
+        if _debug:
+            TestRoundTripTime._debug("test_rtt_sample")
+
+        address = Address("192.168.0.10")
+        device_info_cache, device_info = setup_device(10, address)
+
+        # first sample
+        device_info_cache.rtt_sample(device_info, 100.0)
+        assert device_info.apdu_rtt == 100.0
+        assert device_info.apdu_rtt_variation == 50.0
+
+        # smoothed
+        device_info_cache.rtt_sample(device_info, 20.0)
+        assert device_info.apdu_rtt == 90.0
+        assert device_info.apdu_rtt_variation == 57.5
+
+        device_info_cache.apdu_retry(device_info)
+        device_info_cache.apdu_failure(device_info)
+        assert device_info_cache.apdu_statistics() == {
+            10: {
+                "address": address,
+                "rtt": 90.0,
+                "rtt_variation": 57.5,
+                "rtt_count": 2,
+                "retry_count": 1,
+                "failure_count": 1,
+            }
+        }
+
+    def test_apdu_timeout(self):
+        if _debug:
+            TestRoundTripTime._debug("test_apdu_timeout")
+
+        address = Address("192.168.0.10")
+        device_info_cache, device_info = setup_device(10, address)
+        sap = ServiceAccessPoint(device_info_cache)
+
+        tr = ClientSSM(sap, address)
+        tr.device_info = device_info
+        device_info_cache.rtt_sample(device_info, 800.0)
+
+        # fixed unless it is turned on
+        assert tr.get_apdu_timeout() == 3000
+
+        sap.adaptiveApduTimeout = True
+        assert tr.get_apdu_timeout() == 800 + 4 * 400
+
+        # clamped
+        device_info.apdu_rtt = device_info.apdu_rtt_variation = 5.0
+        assert tr.get_apdu_timeout() == sap.minApduTimeout
+        device_info.apdu_rtt = 30000.0
+        assert tr.get_apdu_timeout() == sap.maxApduTimeout
+
+
+@bacpypes_debugging
+class TestClientRoundTripTime:
+    @pytest.mark.asyncio
+    async def test_response(self):
+        if _debug:
+            TestClientRoundTripTime._debug("test_response")
+
+        address = Address("192.168.0.10")
+        device_info_cache, device_info = setup_device(10, address)
+        sap = ServiceAccessPoint(device_info_cache)
+        sap.adaptiveApduTimeout = True
+
+        tr = ClientSSM(sap, address)
+        await tr.indication(ConfirmedRequestPDU(15, 1))
+        assert len(sap.sent) == 1
+        assert tr.apduTimeout == 3000
+
+        await tr.confirmation(SimpleAckPDU(15, 1))
+        assert len(sap.received) == 1
+        assert device_info.apdu_rtt_count == 1
+
+        # the next request uses the round trip time
+        tr = ClientSSM(sap, address)
+        await tr.indication(ConfirmedRequestPDU(15, 2))
+        assert tr.apduTimeout == sap.minApduTimeout
+
+        # a retry backs off and the response is not a sample
+        await tr.await_confirmation_timeout()
+        assert tr.retryCount == 1
+        assert tr.apduTimeout == 2 * sap.minApduTimeout
+        assert device_info.apdu_retry_count == 1
+
+        await tr.confirmation(SimpleAckPDU(15, 2))
+        assert device_info.apdu_rtt_count == 1
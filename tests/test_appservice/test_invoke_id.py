@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Invoke ID Allocation
+-------------------------
+"""
+
+import asyncio
+import unittest
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.apdu import ReadPropertyRequest, SimpleAckPDU
+from bacpypes3.app import Application, InvokeIDAllocator
+
+from ..application_stubs import ElementService
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestInvokeIDAllocator(unittest.TestCase):
+    def test_allocate(self):
+        if _debug:
+            TestInvokeIDAllocator._debug("test_allocate")
+
+        allocator = InvokeIDAllocator()
+
+        # the preferred invoke ID is used if it is available
+        assert allocator.allocate(10, 0) == 10
+        assert allocator.allocate(10, 0) == 0
+        assert allocator.allocate(None, 10) == 11
+        assert allocator.allocate(None, 255) == 255
+
+        # all of the rest
+        for _ in range(256 - 4):
+            assert allocator.allocate(None, 0) is not None
+        assert allocator.allocate(None, 0) is None
+
+        # make one available
+        allocator.release(100)
+        assert allocator.allocate(None, 200) == 100
+
+
+def _read_property(destination):
+    apdu = ReadPropertyRequest(
+        objectIdentifier="device,1",
+        propertyIdentifier="objectName",
+        destination=destination,
+    )
+    return apdu
+
+
+@bacpypes_debugging
+class TestInvokeIDBackpressure:
+    @pytest.mark.asyncio
+    async def test_exhausted(self):
+        if _debug:
+            TestInvokeIDBackpressure._debug("test_exhausted")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        destination = Address("192.168.0.10")
+
+        futures = [app.request(_read_property(destination)) for _ in range(258)]
+        await asyncio.sleep(0)
+
+        # all of the invoke IDs are used, two are waiting
+        assert len(element_service.apdus) == 256
+        assert len(set(apdu.apduInvokeID for apdu in element_service.apdus)) == 256
+        assert app.request_scheduler.waiting() == 2
+
+        # a waiting request that is canceled is dropped
+        futures[-1].cancel()
+        await asyncio.sleep(0)
+        assert app.request_scheduler.waiting() == 1
+
+        # complete one, the waiting request gets its invoke ID
+        apdu = element_service.apdus[7]
+        ack = SimpleAckPDU(context=apdu)
+        ack.pduSource = destination
+        await app.confirmation(ack)
+        await asyncio.sleep(0)  # done callback
+        await asyncio.sleep(0)  # send task
+
+        assert futures[7].result() is ack
+        assert len(element_service.apdus) == 257
+        assert element_service.apdus[-1].apduInvokeID == apdu.apduInvokeID
+        assert app.request_scheduler.waiting() == 0
+
+        # clean up
+        for future in futures:
+            future.cancel()
+        await asyncio.sleep(0)
+        assert destination not in app._requests
+        assert app.request_scheduler.outstanding == 0
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Read Coalescing
+--------------------
+"""
+
+import asyncio
+import gc
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier, Real
+from bacpypes3.basetypes import PropertyIdentifier
+from bacpypes3.constructeddata import Any
+from bacpypes3.apdu import Error, ReadPropertyACK
+from bacpypes3.app import Application
+from bacpypes3.service.object import ReadCoalescing
+
+from ..application_stubs import ElementService, settle
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestReadCoalescing:
+    @pytest.mark.asyncio
+    async def test_read_property(self):
+        if _debug:
+            TestReadCoalescing._debug("test_read_property")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.read_coalescing = ReadCoalescing()
+
+        address = Address("192.168.0.10")
+        objid = ObjectIdentifier("analog-value,1")
+        prop = PropertyIdentifier("presentValue")
+
+        tasks = [
+            asyncio.ensure_future(app.read_property(address, objid, prop))
+            for _ in range(3)
+        ]
+        other = asyncio.ensure_future(
+            app.read_property(address, objid, PropertyIdentifier("objectName"))
+        )
+        await settle()
+
+        # one request for the three identical reads
+        assert len(element_service.apdus) == 2
+        assert app.read_coalescing.stats() == {
+            "read_count": 2,
+            "coalesced_count": 2,
+            "in_flight": 2,
+        }
+
+        # a caller that gives up doesn't cancel the read for the others
+        tasks[0].cancel()
+
+        request = element_service.apdus[0]
+        ack = ReadPropertyACK(
+            objectIdentifier=objid,
+            propertyIdentifier=prop,
+            propertyValue=Any(Real(72.5)),
+            context=request,
+        )
+        ack.pduSource = address
+        await app.confirmation(ack)
+        await settle()
+
+        assert tasks[1].result() == 72.5
+        assert tasks[2].result() == 72.5
+        assert app.read_coalescing.stats()["in_flight"] == 1
+
+        # clean up
+        other.cancel()
+        for future in list(app.read_coalescing.reads.values()):
+            future.cancel()
+        await settle()
+        assert app.read_coalescing.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_read_property_normalized(self):
+        if _debug:
+            TestReadCoalescing._debug("test_read_property_normalized")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.read_coalescing = ReadCoalescing()
+        address = Address("192.168.0.10")
+
+        # the same property named different ways is one read
+        tasks = [
+            asyncio.ensure_future(
+                app.read_property(address, "analog-value,1", "presentValue")
+            ),
+            asyncio.ensure_future(
+                app.read_property(
+                    address,
+                    ObjectIdentifier("analog-value,1"),
+                    PropertyIdentifier("presentValue"),
+                )
+            ),
+        ]
+        await settle()
+        assert len(element_service.apdus) == 1
+        assert app.read_coalescing.coalesced_count == 1
+
+        # clean up
+        for task in tasks:
+            task.cancel()
+        await settle()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_error(self):
+        if _debug:
+            TestReadCoalescing._debug("test_abandoned_error")
+
+        loop = asyncio.get_running_loop()
+        contexts = []
+        loop.set_exception_handler(lambda loop, context: contexts.append(context))
+
+        async def read_fn():
+            await asyncio.sleep(0)
+            raise RuntimeError("read failed")
+
+        # every caller gives up before the read fails
+        read_coalescing = ReadCoalescing()
+        task = asyncio.ensure_future(read_coalescing.read(("key",), read_fn))
+        await asyncio.sleep(0)
+        task.cancel()
+        await settle()
+        del task
+
+        # nobody is left to see the exception but it was retrieved
+        gc.collect()
+        loop.set_exception_handler(None)
+        assert contexts == []
+        assert read_coalescing.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_read_property_multiple_error(self):
+        if _debug:
+            TestReadCoalescing._debug("test_read_property_multiple_error")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.read_coalescing = ReadCoalescing()
+
+        address = Address("192.168.0.10")
+        tasks = [
+            asyncio.ensure_future(
+                app.read_property_multiple(
+                    address, ["analog-value,1", ["presentValue", "units"]]
+                )
+            )
+            for _ in range(2)
+        ]
+        await settle()
+        assert len(element_service.apdus) == 1
+
+        error = Error(
+            errorClass="object",
+            errorCode="unknownObject",
+            service_choice=element_service.apdus[0].apduService,
+            context=element_service.apdus[0],
+        )
+        error.pduSource = address
+        await app.confirmation(error)
+        await settle()
+
+        # both callers get the same error
+        assert tasks[0].exception() is tasks[1].exception()
+        assert isinstance(tasks[0].exception(), Error)
+        assert app.read_coalescing.coalesced_count == 1
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Response Cache
+-------------------
+"""
+
+import asyncio
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import Real
+from bacpypes3.basetypes import PropertyIdentifier
+from bacpypes3.constructeddata import Any
+from bacpypes3.apdu import ReadPropertyACK, ReadPropertyRequest
+from bacpypes3.appservice import ResponseCache
+
+from ..application_stubs import ServiceAccessPoint
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def read_property_request(source, invoke_id, objid):
+    apdu = ReadPropertyRequest(
+        objectIdentifier=objid,
+        propertyIdentifier="presentValue",
+    )
+    apdu.apduInvokeID = invoke_id
+
+    # the generic request has the header fields the client would send
+    xpdu = apdu.encode()
+    xpdu.apduSeg = xpdu.apduMor = xpdu.apduSA = False
+    xpdu.apduMaxSegs = 0
+    xpdu.apduMaxResp = 5
+
+    pdu = xpdu.encode()
+    pdu.pduSource = source
+    return pdu
+
+
+@bacpypes_debugging
+class TestResponseCache:
+    async def answer(self, sap, value):
+        request = sap.received[-1]
+        ack = ReadPropertyACK(
+            objectIdentifier=request.objectIdentifier,
+            propertyIdentifier=PropertyIdentifier("presentValue"),
+            propertyValue=Any(Real(value)),
+            context=request,
+        )
+        await sap.sap_confirmation(ack)
+
+    @pytest.mark.asyncio
+    async def test_replay(self):
+        if _debug:
+            TestResponseCache._debug("test_replay")
+
+        sap = ServiceAccessPoint()
+        sap.responseCache = ResponseCache()
+        source = Address("192.168.0.10")
+
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        assert len(sap.received) == 1
+        await self.answer(sap, 72.5)
+        assert len(sap.sent) == 1
+        assert len(sap.serverTransactions) == 0
+
+        # the response was lost and the client sends it again
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        assert len(sap.received) == 1
+        assert len(sap.sent) == 2
+        assert sap.sent[1].encode().pduData == sap.sent[0].encode().pduData
+        assert sap.sent[1].pduDestination == source
+        assert sap.responseCache.hits == 1
+        assert len(sap.serverTransactions) == 0
+
+        # a different request with the same invoke ID is new
+        await sap.confirmation(read_property_request(source, 5, "analog-value,2"))
+        assert len(sap.received) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired(self):
+        if _debug:
+            TestResponseCache._debug("test_expired")
+
+        # responses are kept for the APDU timeout times the number of retries
+        sap = ServiceAccessPoint()
+        sap.apduTimeout = 20
+        sap.numberOfApduRetries = 2
+        sap.responseCache = ResponseCache()
+        source = Address("192.168.0.10")
+
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        await self.answer(sap, 72.5)
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        assert len(sap.received) == 1
+
+        # the same request after the retry window is run again
+        await asyncio.sleep(0.05)
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        assert len(sap.received) == 2
+        assert sap.responseCache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_expiry(self):
+        if _debug:
+            TestResponseCache._debug("test_replay_expiry")
+
+        sap = ServiceAccessPoint()
+        sap.responseCache = ResponseCache()
+        source = Address("192.168.0.10")
+
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        await self.answer(sap, 72.5)
+        expires = [entry[0] for entry in sap.responseCache._cache.values()]
+
+        # a replay does not keep the response around any longer
+        await asyncio.sleep(0.01)
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        assert sap.responseCache.hits == 1
+        assert [entry[0] for entry in sap.responseCache._cache.values()] == expires
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        if _debug:
+            TestResponseCache._debug("test_disabled")
+
+        sap = ServiceAccessPoint()
+        source = Address("192.168.0.10")
+
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        await self.answer(sap, 72.5)
+        await sap.confirmation(read_property_request(source, 5, "analog-value,1"))
+        assert len(sap.received) == 2
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Request Scheduler
+----------------------
+"""
+
+import asyncio
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.apdu import ReadPropertyRequest, SimpleAckPDU, WritePropertyRequest
+from bacpypes3.app import Application
+
+from ..application_stubs import ElementService
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def _read_property(destination):
+    return ReadPropertyRequest(
+        objectIdentifier="device,1",
+        propertyIdentifier="objectName",
+        destination=destination,
+    )
+
+
+def _write_property(destination):
+    return WritePropertyRequest(
+        objectIdentifier="analog-value,1",
+        propertyIdentifier="presentValue",
+        destination=destination,
+    )
+
+
+async def _ack(app, apdu):
+    ack = SimpleAckPDU(context=apdu)
+    ack.pduSource = apdu.pduDestination
+    await app.confirmation(ack)
+
+    # done callback and send task
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@bacpypes_debugging
+class TestRequestScheduler:
+    @pytest.mark.asyncio
+    async def test_per_address(self):
+        if _debug:
+            TestRequestScheduler._debug("test_per_address")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.request_scheduler.max_per_address = 2
+
+        device1 = Address("192.168.0.10")
+        device2 = Address("192.168.0.11")
+        for _ in range(3):
+            app.request(_read_property(device1))
+        app.request(_read_property(device2))
+        await asyncio.sleep(0)
+
+        # the third request to the first device waits
+        assert [apdu.pduDestination for apdu in element_service.apdus] == [
+            device1,
+            device1,
+            device2,
+        ]
+        assert app.request_scheduler.waiting() == 1
+        assert app.request_scheduler.stats()["waiting_by_address"] == {device1: 1}
+
+        await _ack(app, element_service.apdus[0])
+        assert len(element_service.apdus) == 4
+        assert app.request_scheduler.waiting() == 0
+        assert app.request_scheduler.waited_count == 1
+
+    @pytest.mark.asyncio
+    async def test_per_network(self):
+        if _debug:
+            TestRequestScheduler._debug("test_per_network")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.request_scheduler.max_per_network = 1
+
+        app.request(_read_property(Address("5:1")))
+        app.request(_read_property(Address("5:2")))
+        app.request(_read_property(Address("6:1")))
+        await asyncio.sleep(0)
+
+        assert [str(apdu.pduDestination) for apdu in element_service.apdus] == [
+            "5:1",
+            "6:1",
+        ]
+        assert app.request_scheduler.network_outstanding == {5: 1, 6: 1}
+
+        await _ack(app, element_service.apdus[0])
+        assert str(element_service.apdus[-1].pduDestination) == "5:2"
+
+    @pytest.mark.asyncio
+    async def test_priority_round_robin(self):
+        if _debug:
+            TestRequestScheduler._debug("test_priority_round_robin")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.request_scheduler.max_outstanding = 1
+
+        device1 = Address("192.168.0.10")
+        device2 = Address("192.168.0.11")
+        app.request(_read_property(device1))
+        await asyncio.sleep(0)
+        assert len(element_service.apdus) == 1
+
+        # two reads to the first device, one to the second, then a write
+        app.request(_read_property(device1))
+        app.request(_read_property(device1))
+        app.request(_read_property(device2))
+        app.request(_write_property(device2))
+        assert app.request_scheduler.stats()["waiting_by_priority"] == [1, 0, 3]
+
+        # the write goes first, then the reads alternate between devices
+        sent = []
+        while app.request_scheduler.waiting():
+            await _ack(app, element_service.apdus[-1])
+            apdu = element_service.apdus[-1]
+            sent.append((type(apdu).__name__, apdu.pduDestination))
+
+        assert sent == [
+            ("WritePropertyRequest", device2),
+            ("ReadPropertyRequest", device1),
+            ("ReadPropertyRequest", device2),
+            ("ReadPropertyRequest", device1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_send_failure(self):
+        if _debug:
+            TestRequestScheduler._debug("test_send_failure")
+
+        class _FailingElementService:
+            async def sap_indication(self, apdu):
+                raise RuntimeError("no route")
+
+        app = Application()
+        app.elementService = _FailingElementService()
+        destination = Address("192.168.0.10")
+
+        # the send task is kept until it is done and the error is passed along
+        future = app.request(_read_property(destination))
+        assert len(app._request_tasks) == 1
+        with pytest.raises(RuntimeError):
+            await future
+        assert not app._request_tasks
+        assert destination not in app._requests
+        assert app.request_scheduler.outstanding == 0
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Segmentation
+-----------------
+"""
+
+import unittest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.apdu import ComplexAckPDU, ConfirmedRequestPDU
+from bacpypes3.appservice import ApplicationServiceAccessPoint, ClientSSM, ServerSSM
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def setup_context(tr, apdu, segment_size, window_size):
+    apdu.put_data(bytes(i % 256 for i in range(3000)))
+    tr.set_segmentation_context(apdu)
+    tr.segmentSize = segment_size
+    tr.segmentCount = (len(apdu.pduData) + segment_size - 1) // segment_size
+    tr.actualWindowSize = window_size
+
+
+@bacpypes_debugging
+class TestSegmentPDU(unittest.TestCase):
+    def assert_segments_match(self, tr):
+        for indx in range(tr.segmentCount):
+            apdu_pdu = tr.get_segment(indx).encode()
+            segment_pdu = tr.get_segment_pdu(indx)
+
+            assert segment_pdu.pduData == apdu_pdu.pduData
+            assert segment_pdu.pduDestination == apdu_pdu.pduDestination
+            assert segment_pdu.pduExpectingReply == apdu_pdu.pduExpectingReply
+            assert segment_pdu.pduUserData == apdu_pdu.pduUserData
+
+    def test_complex_ack(self):
+        if _debug:
+            TestSegmentPDU._debug("test_complex_ack")
+
+        sap = ApplicationServiceAccessPoint()
+        tr = ServerSSM(sap, Address("192.168.0.10"))
+        tr.invokeID = 7
+        setup_context(tr, ComplexAckPDU(12, 7), 480, 4)
+        assert tr.segmentCount == 7
+
+        self.assert_segments_match(tr)
+
+    def test_confirmed_request(self):
+        if _debug:
+            TestSegmentPDU._debug("test_confirmed_request")
+
+        sap = ApplicationServiceAccessPoint()
+        tr = ClientSSM(sap, Address("192.168.0.10"))
+        tr.invokeID = 9
+        setup_context(tr, ConfirmedRequestPDU(15, 9), 206, 2)
+
+        self.assert_segments_match(tr)
+
+    def test_unsegmented(self):
+        if _debug:
+            TestSegmentPDU._debug("test_unsegmented")
+
+        sap = ApplicationServiceAccessPoint()
+        tr = ServerSSM(sap, Address("192.168.0.10"))
+        tr.invokeID = 3
+        setup_context(tr, ComplexAckPDU(12, 3), 4000, 1)
+        assert tr.segmentCount == 1
+
+        self.assert_segments_match(tr)
+
+
+@bacpypes_debugging
+class TestAdaptiveSegmentation(unittest.TestCase):
+    def test_learning(self):
+        if _debug:
+            TestAdaptiveSegmentation._debug("test_learning")
+
+        sap = ApplicationServiceAccessPoint()
+        sap.adaptiveSegmentation = True
+        peer = Address("192.168.0.10")
+
+        # first transaction starts with the defaults
+        tr = ServerSSM(sap, peer)
+        segmentation_info = tr.segmentationInfo
+        assert segmentation_info is sap.segmentationInfo[peer]
+        assert tr.proposedWindowSize == sap.proposedWindowSize
+        assert tr.segmentTimeout == sap.segmentTimeout
+
+        # quick acks grow the window and shrink the timeout
+        for _ in range(10):
+            sap.segments_acknowledged(segmentation_info, 20.0)
+        assert segmentation_info.proposedWindowSize == 12
+        assert segmentation_info.segmentTimeout == sap.minSegmentTimeout
+
+        # the next transaction picks that up
+        tr = ClientSSM(sap, peer)
+        assert tr.proposedWindowSize == 12
+        assert tr.segmentTimeout == sap.minSegmentTimeout
+
+        # losing segments backs off
+        tr.segment_lost()
+        assert segmentation_info.proposedWindowSize == 6
+        assert tr.segmentTimeout == 2 * sap.minSegmentTimeout
+        assert segmentation_info.lossCount == 1
+
+        # window is limited
+        for _ in range(100):
+            sap.segments_acknowledged(segmentation_info, None)
+        assert segmentation_info.proposedWindowSize == sap.maxProposedWindowSize
+
+    def test_disabled(self):
+        if _debug:
+            TestAdaptiveSegmentation._debug("test_disabled")
+
+        sap = ApplicationServiceAccessPoint()
+        tr = ServerSSM(sap, Address("192.168.0.10"))
+        assert tr.segmentationInfo is None
+
+        # nothing is learned
+        tr.segment_lost()
+        tr.segments_received()
+        assert not sap.segmentationInfo
+        assert tr.segmentTimeout == sap.segmentTimeout
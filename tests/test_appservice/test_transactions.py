@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Transaction Tables
+-----------------------
+"""
+
+import unittest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.appservice import (
+    ApplicationServiceAccessPoint,
+    ClientSSM,
+    ServerSSM,
+    COMPLETED,
+    ABORTED,
+)
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestTransactionTable(unittest.TestCase):
+    def test_add_get_remove(self):
+        if _debug:
+            TestTransactionTable._debug("test_add_get_remove")
+
+        sap = ApplicationServiceAccessPoint()
+        peer = Address("192.168.0.10")
+
+        tr1 = ServerSSM(sap, peer)
+        tr2 = ServerSSM(sap, peer)
+        sap.serverTransactions.add(tr1, 1)
+        sap.serverTransactions.add(tr2, 2)
+
+        # found by address and invoke ID
+        assert sap.serverTransactions.get(Address("192.168.0.10"), 1) is tr1
+        assert sap.serverTransactions.get(peer, 2) is tr2
+        assert sap.serverTransactions.get(peer, 3) is None
+        assert sap.serverTransactions.get(Address("192.168.0.11"), 1) is None
+
+        assert len(sap.serverTransactions) == 2
+        assert sap.serverTransactions.peer_count(peer) == 2
+
+        # completing a transaction removes it
+        tr1.set_state(COMPLETED)
+        assert sap.serverTransactions.get(peer, 1) is None
+        assert sap.serverTransactions.peer_count(peer) == 1
+
+        # aborting a transaction removes it, peer is no longer counted
+        tr2.set_state(ABORTED)
+        assert len(sap.serverTransactions) == 0
+        assert sap.serverTransactions.peer_count(peer) == 0
+        assert peer not in sap.serverTransactions.peerCounts
+
+    def test_replace(self):
+        if _debug:
+            TestTransactionTable._debug("test_replace")
+
+        sap = ApplicationServiceAccessPoint()
+        peer = Address("192.168.0.10")
+
+        tr1 = ClientSSM(sap, peer)
+        tr2 = ClientSSM(sap, peer)
+        sap.clientTransactions.add(tr1, 5)
+        sap.clientTransactions.add(tr2, 5)
+        assert sap.clientTransactions.get(peer, 5) is tr2
+        assert sap.clientTransactions.peer_count(peer) == 1
+
+        # the replaced transaction finishing does not remove the new one
+        tr1.set_state(ABORTED)
+        assert sap.clientTransactions.get(peer, 5) is tr2
+        assert list(sap.clientTransactions) == [tr2]
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Value Cache
+----------------
+"""
+
+import asyncio
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import CharacterString, ObjectIdentifier, Real
+from bacpypes3.basetypes import PropertyIdentifier, PropertyValue
+from bacpypes3.constructeddata import Any
+from bacpypes3.apdu import ReadPropertyACK
+from bacpypes3.app import Application
+from bacpypes3.vendor import get_vendor_info
+from bacpypes3.service.object import ValueCache
+
+from ..application_stubs import ElementService, settle
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestValueCache:
+    @pytest.mark.asyncio
+    async def test_max_age(self):
+        if _debug:
+            TestValueCache._debug("test_max_age")
+
+        cache = ValueCache(
+            max_age={"presentValue": 2.0, "units": None}, default_max_age=0.0
+        )
+        address = Address("192.168.0.10")
+
+        pv_key = ValueCache.key(address, "analog-value,1", "presentValue")
+        units_key = ValueCache.key(address, "analog-value,1", "units")
+        name_key = ValueCache.key(address, "analog-value,1", "objectName")
+        assert pv_key == (
+            address,
+            ObjectIdentifier("analog-value,1"),
+            PropertyIdentifier("presentValue"),
+            None,
+        )
+
+        cache.put(pv_key, 72.5)
+        cache.put(units_key, "degreesFahrenheit")
+        cache.put(name_key, "not cached")
+        assert len(cache) == 2
+        assert cache.get(pv_key) == (True, 72.5)
+        assert cache.get(name_key) == (False, None)
+
+        # the present value expires, the units do not
+        cache._cache[pv_key] = (asyncio.get_event_loop().time() - 0.1, 72.5)
+        assert cache.get(pv_key) == (False, None)
+        assert cache.get(units_key) == (True, "degreesFahrenheit")
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_lru(self):
+        if _debug:
+            TestValueCache._debug("test_lru")
+
+        cache = ValueCache(default_max_age=10.0, maxsize=2)
+        address = Address("192.168.0.10")
+        keys = [
+            ValueCache.key(address, ("analog-value", i), "presentValue")
+            for i in range(3)
+        ]
+
+        cache.put(keys[0], 0)
+        cache.put(keys[1], 1)
+        cache.get(keys[0])
+        cache.put(keys[2], 2)
+
+        # the least recently used is dropped
+        assert cache.get(keys[1]) == (False, None)
+        assert cache.get(keys[0]) == (True, 0)
+        assert cache.get(keys[2]) == (True, 2)
+
+    @pytest.mark.asyncio
+    async def test_property_values(self):
+        if _debug:
+            TestValueCache._debug("test_property_values")
+
+        cache = ValueCache(default_max_age=10.0)
+        address = Address("192.168.0.10")
+        objid = ObjectIdentifier("analog-value,1")
+
+        cache.put_property_values(
+            address,
+            objid,
+            [
+                PropertyValue(propertyIdentifier="presentValue", value=Any(Real(3.5))),
+                PropertyValue(
+                    propertyIdentifier="objectName",
+                    value=Any(CharacterString("av1")),
+                ),
+            ],
+            get_vendor_info(0),
+        )
+
+        assert cache.get_multiple(
+            address, [objid, ["presentValue", "objectName"]]
+        ) == [
+            (objid, PropertyIdentifier("presentValue"), None, 3.5),
+            (objid, PropertyIdentifier("objectName"), None, "av1"),
+        ]
+        assert cache.get_multiple(address, [objid, ["presentValue", "units"]]) is None
+
+    @pytest.mark.asyncio
+    async def test_get_multiple(self):
+        if _debug:
+            TestValueCache._debug("test_get_multiple")
+
+        cache = ValueCache(default_max_age=10.0, maxsize=2)
+        address = Address("192.168.0.10")
+        objid = ObjectIdentifier("analog-value,1")
+        pv_key = ValueCache.key(address, objid, "presentValue")
+        name_key = ValueCache.key(address, objid, "objectName")
+
+        cache.put(pv_key, 72.5)
+        cache.put(name_key, "av1")
+
+        # a partial miss is one miss and does not change the order
+        parameter_list = [objid, ["presentValue", "units"]]
+        assert cache.get_multiple(address, parameter_list) is None
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert list(cache._cache) == [pv_key, name_key]
+
+        # finding all of them is one hit and they become the most recent
+        parameter_list = [objid, ["objectName", "presentValue"]]
+        assert cache.get_multiple(address, parameter_list) is not None
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert list(cache._cache) == [name_key, pv_key]
+
+
+@bacpypes_debugging
+class TestReadThrough:
+    @pytest.mark.asyncio
+    async def test_read_property(self):
+        if _debug:
+            TestReadThrough._debug("test_read_property")
+
+        app = Application()
+        app.elementService = element_service = ElementService()
+        app.value_cache = ValueCache(default_max_age=10.0)
+
+        address = Address("192.168.0.10")
+        objid = ObjectIdentifier("analog-value,1")
+        prop = PropertyIdentifier("presentValue")
+
+        task = asyncio.ensure_future(app.read_property(address, objid, prop))
+        await settle()
+        assert len(element_service.apdus) == 1
+
+        ack = ReadPropertyACK(
+            objectIdentifier=objid,
+            propertyIdentifier=prop,
+            propertyValue=Any(Real(72.5)),
+            context=element_service.apdus[0],
+        )
+        ack.pduSource = address
+        await app.confirmation(ack)
+        await settle()
+        assert task.result() == 72.5
+
+        # the second read is answered from the cache
+        assert await app.read_property(address, "analog-value,1", "presentValue") == 72.5
+        assert len(element_service.apdus) == 1
+        assert app.value_cache.hits == 1
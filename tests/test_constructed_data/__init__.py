@@ -3,6 +3,7 @@ Test BACpypes Constructed Data Module
 """
 
 from . import test_any
+from . import test_apci_sequence
 from . import test_array
 from . import test_choice
 from . import test_list
@@ -8,9 +8,18 @@ Test Any
 
 import inspect
 import unittest
+import pytest
 
 from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
-from bacpypes3.primitivedata import Integer
+from bacpypes3.errors import InvalidTag
+from bacpypes3.primitivedata import (
+    Boolean,
+    Integer,
+    ObjectType,
+    Real,
+    Unsigned,
+    Unsigned8,
+)
 from bacpypes3.constructeddata import Any, Sequence
 
 # some debugging
@@ -80,6 +89,29 @@ class TestAny000(unittest.TestCase):
         obj2 = obj1.cast_out(Integer)
         assert obj2 == value
 
+    def test_cast_out_atomic(self):
+        if _debug:
+            TestAny000._debug("test_cast_out_atomic")
+
+        for cls, value in (
+            (Boolean, True),
+            (Integer, -300),
+            (Real, 1.5),
+            (Unsigned, 70000),
+            (ObjectType, "device"),
+        ):
+            obj = Any(cls(value)).cast_out(cls)
+            assert type(obj) is cls
+            assert obj == cls(value)
+
+        # the class limits are still checked
+        with pytest.raises(ValueError):
+            Any(Unsigned(300)).cast_out(Unsigned8)
+
+        # mismatched types are still an error
+        with pytest.raises(InvalidTag):
+            Any(Unsigned(1)).cast_out(Real)
+
     def test_copy(self):
         if _debug:
             TestAny000._debug("test_copy")
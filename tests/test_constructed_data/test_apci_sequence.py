@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test APCISequence
+-----------------
+"""
+
+import inspect
+import unittest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.errors import DecodingError, InvalidTag
+from bacpypes3.pdu import PDU, Address
+from bacpypes3.primitivedata import ObjectIdentifier, Unsigned
+from bacpypes3.apdu import (
+    APDU,
+    APCISequence,
+    IAmRequest,
+    WhoIsRequest,
+)
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+def lazy_decode(apdu):
+    """
+    Encode the APDU then decode it both eagerly and lazily.
+    """
+    if _debug:
+        lazy_decode._debug("lazy_decode %r", apdu)
+
+    pdu = apdu.encode()
+    pdu.pduSource = Address("1")
+
+    apdu1 = APCISequence.decode(APDU.decode(pdu.encode()))
+    apdu2 = APCISequence.decode(APDU.decode(pdu.encode()), lazy=True)
+    if _debug:
+        lazy_decode._debug("    - apdu1, apdu2: %r, %r", apdu1, apdu2)
+
+    assert isinstance(apdu2, apdu1.__class__)
+    assert apdu2.__class__.__name__ == apdu1.__class__.__name__
+    assert apdu2.pduSource == apdu1.pduSource
+
+    return apdu1, apdu2
+
+
+@bacpypes_debugging
+class TestLazyDecode(unittest.TestCase):
+    def test_i_am(self):
+        if _debug:
+            TestLazyDecode._debug("test_i_am")
+
+        apdu1, apdu2 = lazy_decode(
+            IAmRequest(
+                iAmDeviceIdentifier="device,100",
+                maxAPDULengthAccepted=1024,
+                segmentationSupported="segmentedBoth",
+                vendorID=999,
+            )
+        )
+
+        # nothing decoded yet
+        assert "iAmDeviceIdentifier" not in vars(apdu2)
+
+        # only the elements up to the one referenced are decoded
+        assert apdu2.iAmDeviceIdentifier == ObjectIdentifier("device,100")
+        assert "maxAPDULengthAccepted" not in vars(apdu2)
+
+        # the rest are decoded when the sequence is compared
+        assert apdu2 == apdu1
+        assert apdu2.vendorID == 999
+
+    def test_changed_value(self):
+        if _debug:
+            TestLazyDecode._debug("test_changed_value")
+
+        apdu1, apdu2 = lazy_decode(
+            IAmRequest(
+                iAmDeviceIdentifier="device,100",
+                maxAPDULengthAccepted=1024,
+                segmentationSupported="segmentedBoth",
+                vendorID=999,
+            )
+        )
+
+        # a value changed by the application is kept
+        apdu2.vendorID = 15
+        assert apdu2.iAmDeviceIdentifier == ObjectIdentifier("device,100")
+        assert apdu2.vendorID == 15
+
+        apdu3 = APCISequence.decode(APDU.decode(apdu2.encode().encode()))
+        assert apdu3.vendorID == 15
+
+    def test_optional(self):
+        if _debug:
+            TestLazyDecode._debug("test_optional")
+
+        # optional elements that are not encoded are None
+        apdu1, apdu2 = lazy_decode(WhoIsRequest(deviceInstanceRangeHighLimit=10))
+        assert apdu2.deviceInstanceRangeHighLimit == 10
+        assert apdu2.deviceInstanceRangeLowLimit is None
+        assert apdu2 == apdu1
+
+    def test_malformed(self):
+        if _debug:
+            TestLazyDecode._debug("test_malformed")
+
+        pdu = WhoIsRequest(
+            deviceInstanceRangeLowLimit=1, deviceInstanceRangeHighLimit=1000
+        ).encode()
+        pdu.pduSource = Address("1")
+        apdu = APDU.decode(pdu.encode())
+
+        # the tags are still decoded up front
+        apdu.pduData = apdu.pduData[:-1]
+        with self.assertRaises(InvalidTag):
+            APCISequence.decode(apdu, lazy=True)
+
+    def test_class_unchanged(self):
+        if _debug:
+            TestLazyDecode._debug("test_class_unchanged")
+
+        lazy_decode(WhoIsRequest(deviceInstanceRangeHighLimit=10))
+
+        # the service class itself still has its plain elements
+        element = inspect.getattr_static(WhoIsRequest, "deviceInstanceRangeLowLimit")
+        assert inspect.isclass(element) and issubclass(element, Unsigned)
+        apdu = WhoIsRequest()
+        assert apdu.deviceInstanceRangeLowLimit is None
+
+        # and does not refer to its lazy subclass
+        for value in vars(WhoIsRequest).values():
+            assert not (inspect.isclass(value) and issubclass(value, WhoIsRequest))
+
+    def test_malformed_element(self):
+        if _debug:
+            TestLazyDecode._debug("test_malformed_element")
+
+        pdu = IAmRequest(
+            iAmDeviceIdentifier="device,100",
+            maxAPDULengthAccepted=1024,
+            segmentationSupported="segmentedBoth",
+            vendorID=999,
+        ).encode()
+        data = bytes(pdu.encode().pduData)
+
+        # the vendor identifier is an enumerated rather than an unsigned
+        apdu = APDU.decode(PDU(data[:-3] + b"\x91\x05", source=Address("1")))
+        apdu = APCISequence.decode(apdu, lazy=True)
+
+        # the elements before it are fine, the error is raised every time
+        assert apdu.iAmDeviceIdentifier == ObjectIdentifier("device,100")
+        with self.assertRaises(DecodingError):
+            apdu.vendorID
+        with self.assertRaises(DecodingError):
+            apdu.vendorID
@@ -9,7 +9,14 @@ Test ArrayOf
 import unittest
 
 from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
-from bacpypes3.primitivedata import Integer
+from bacpypes3.primitivedata import (
+    Integer,
+    ObjectIdentifier,
+    Real,
+    TagList,
+    Unsigned,
+    Unsigned8,
+)
 from bacpypes3.constructeddata import ArrayOf
 
 # some debugging
@@ -120,3 +127,51 @@ class TestThing001(unittest.TestCase):
 
         # encode and decode
         array_of_endec(Thing001, [4, 5])
+
+
+#
+#   Bulk encoding and decoding
+#
+
+
+@bacpypes_debugging
+class TestBulk(unittest.TestCase):
+    def test_bulk_endec(self):
+        if _debug:
+            TestBulk._debug("test_bulk_endec")
+
+        for cls, values in (
+            (ArrayOf(ObjectIdentifier), [("device", 1), ("analog-value", 4194303)]),
+            (ArrayOf(Real), [0.5, -1.25, 1e10]),
+            (ArrayOf(Unsigned), [0, 255, 256, 65536, 4294967295]),
+            (ArrayOf(Integer, _context=1), [1, -1]),
+        ):
+            obj = cls(values)
+
+            # the tags are the same as encoding one item at a time
+            tag_list = obj.encode()
+            item_tags = []
+            for item in obj:
+                item_tags.extend(item.encode())
+            if cls._context is None:
+                assert tag_list == TagList(item_tags)
+
+            # values and their types are the same
+            obj2 = cls.decode(tag_list)
+            assert obj2 == obj
+            for item in obj2:
+                assert type(item) is cls._subtype
+
+    def test_bulk_decode_fallback(self):
+        if _debug:
+            TestBulk._debug("test_bulk_decode_fallback")
+
+        # a run of tags followed by one that is decoded by itself
+        tag_list = ArrayOf(Unsigned)([1, 2, 3]).encode()
+        tag_list.extend(Real(1.0).encode())
+        assert ArrayOf(Unsigned).decode(tag_list) == [1, 2, 3]
+        assert len(tag_list) == 1
+
+        # class limits are still checked
+        with self.assertRaises(ValueError):
+            ArrayOf(Unsigned8).decode(ArrayOf(Unsigned)([1, 256]).encode())
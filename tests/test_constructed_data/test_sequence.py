@@ -444,3 +444,18 @@ class TestThing008(unittest.TestCase):
 
         # pre-initialized value
         sequence_endec(Thing008)
+
+    def test_codec_plan(self):
+        if _debug:
+            TestThing008._debug("test_codec_plan")
+
+        # the plan is built once for each class
+        plan = Thing008._codec_plan()
+        assert Thing008._codec_plan() is plan
+        assert Thing007._codec_plan() is not plan
+
+        # steps follow the element order
+        assert [step.attr for step in plan] == ["i", "j"]
+        assert plan[0].optional and plan[0].context is None
+        assert TagNumber.integer in plan[0].app_tags
+        assert plan[1].context == 1
@@ -0,0 +1,9 @@
+#!/usr/bin/python
+
+"""
+Test Library
+------------
+"""
+
+from . import test_batchread
+from . import test_pollscheduler
@@ -0,0 +1,402 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Batch Read
+---------------
+"""
+
+import asyncio
+import unittest
+
+from types import SimpleNamespace
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.pdu import Address
+from bacpypes3.basetypes import Segmentation, ServicesSupported
+from bacpypes3.apdu import AbortPDU, AbortReason
+from bacpypes3.app import DeviceInfo
+from bacpypes3.lib.batchread import (
+    AddressGroupWorker,
+    BatchRead,
+    DeviceAddressObjectPropertyReference,
+    ReadMetadata,
+)
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+def make_batch(
+    max_apdu_length_accepted=1476,
+    segmentation_supported=Segmentation.segmentedBoth,
+    max_segments_accepted=16,
+):
+    asap = SimpleNamespace(
+        maxApduLengthAccepted=max_apdu_length_accepted,
+        segmentationSupported=segmentation_supported,
+        maxSegmentsAccepted=max_segments_accepted,
+    )
+    return SimpleNamespace(app=SimpleNamespace(device_object=None, asap=asap))
+
+
+def make_worker(address, object_count, properties):
+    daopr_list = [
+        DeviceAddressObjectPropertyReference(
+            (i, prop), address, ("analog-value", i), prop
+        )
+        for i in range(object_count)
+        for prop in properties
+    ]
+    return AddressGroupWorker(address, daopr_list)
+
+
+@bacpypes_debugging
+class TestChunkList(unittest.TestCase):
+    def test_small_device(self):
+        if _debug:
+            TestChunkList._debug("test_small_device")
+
+        address = Address("5:10")
+        device_info = DeviceInfo(10, address, max_apdu_length_accepted=50)
+        worker = make_worker(address, 20, ["presentValue"])
+
+        chunk_list = worker.chunk_list(make_batch(), device_info)
+        assert sum(len(chunk) for chunk in chunk_list) == 20
+        assert all(1 <= len(chunk) < 10 for chunk in chunk_list)
+
+    def test_segmented_device(self):
+        if _debug:
+            TestChunkList._debug("test_segmented_device")
+
+        address = Address("192.168.0.10")
+        device_info = DeviceInfo(
+            10,
+            address,
+            max_apdu_length_accepted=1476,
+            segmentation_supported=Segmentation.segmentedBoth,
+        )
+        worker = make_worker(address, 100, ["presentValue", "statusFlags"])
+
+        # the request is the limit, not the response
+        chunk_list = worker.chunk_list(make_batch(), device_info)
+        assert sum(len(chunk) for chunk in chunk_list) == 200
+        assert len(chunk_list) == 1
+
+        # without segmentation the responses are the limit
+        device_info.segmentation_supported = Segmentation.noSegmentation
+        assert len(worker.chunk_list(make_batch(), device_info)) > 1
+
+    def test_strings(self):
+        if _debug:
+            TestChunkList._debug("test_strings")
+
+        address = Address("192.168.0.10")
+        device_info = DeviceInfo(10, address, max_apdu_length_accepted=480)
+
+        names = make_worker(address, 50, ["objectName"])
+        values = make_worker(address, 50, ["presentValue"])
+
+        # values are smaller than names so they pack into fewer requests
+        batch = make_batch()
+        assert len(values.chunk_list(batch, device_info)) < len(
+            names.chunk_list(batch, device_info)
+        )
+
+
+class _Application:
+    """
+    Looks enough like an application to batch read from a device that
+    aborts requests for more than a few properties.
+    """
+
+    def __init__(self, max_references):
+        self.device_object = None
+        self.asap = make_batch().app.asap
+        self.max_references = max_references
+        self.rpm_sizes = []
+        self.rp_count = 0
+
+    async def read_property_multiple(self, address, parameter_list):
+        result_list = []
+        while parameter_list:
+            objid, property_reference_list, *parameter_list = parameter_list
+            for property_reference in property_reference_list:
+                result_list.append(
+                    (objid, property_reference.propertyIdentifier, None, objid[1])
+                )
+        self.rpm_sizes.append(len(result_list))
+
+        if len(result_list) > self.max_references:
+            raise AbortPDU(reason=AbortReason.bufferOverflow)
+        return result_list
+
+    async def read_property(self, address, objid, prop, array_index=None):
+        self.rp_count += 1
+        return objid[1]
+
+
+@bacpypes_debugging
+class TestSplitAndRetry:
+    async def read(self, app, worker, device_info):
+        results = {}
+        batch = BatchRead(worker.daopr_list)
+        batch.app = app
+        batch.callback = results.__setitem__
+        batch._stop = asyncio.Event()
+
+        await worker.read_property_multiple(batch, device_info)
+        return results
+
+    @pytest.mark.asyncio
+    async def test_split(self):
+        if _debug:
+            TestSplitAndRetry._debug("test_split")
+
+        address = Address("192.168.0.10")
+        device_info = DeviceInfo(10, address, max_apdu_length_accepted=1476)
+        worker = make_worker(address, 40, ["presentValue"])
+        app = _Application(max_references=12)
+
+        # all of the values are read and the working size is remembered
+        results = await self.read(app, worker, device_info)
+        assert results == {(i, "presentValue"): i for i in range(40)}
+        assert device_info.rpm_chunk_size == 10
+        assert app.rp_count == 0
+
+        # the next time the smaller size is used from the start
+        app.rpm_sizes = []
+        results = await self.read(app, worker, device_info)
+        assert len(results) == 40
+        assert max(app.rpm_sizes) == 10
+
+    @pytest.mark.asyncio
+    async def test_read_property(self):
+        if _debug:
+            TestSplitAndRetry._debug("test_read_property")
+
+        address = Address("192.168.0.10")
+        device_info = DeviceInfo(10, address, max_apdu_length_accepted=1476)
+        worker = make_worker(address, 3, ["presentValue"])
+        app = _Application(max_references=0)
+
+        # down to single Read Property requests
+        results = await self.read(app, worker, device_info)
+        assert results == {(i, "presentValue"): i for i in range(3)}
+        assert device_info.rpm_chunk_size == 1
+        assert app.rp_count == 3
+
+    @pytest.mark.asyncio
+    async def test_split_concurrent(self):
+        if _debug:
+            TestSplitAndRetry._debug("test_split_concurrent")
+
+        address = Address("192.168.0.10")
+        device_info = DeviceInfo(10, address, max_apdu_length_accepted=1476)
+        worker = make_worker(address, 8, ["presentValue"])
+        app = _SlowApplication()
+        app.max_references = 4
+
+        # the one chunk is split and the pieces are read at the same time
+        results = {}
+        batch = BatchRead(worker.daopr_list, max_outstanding=2)
+        batch.app = app
+        batch.callback = results.__setitem__
+        batch._stop = asyncio.Event()
+
+        await worker.read_property_multiple(batch, device_info)
+        assert results == {(i, "presentValue"): i for i in range(8)}
+        assert app.rpm_sizes == [8, 4, 4]
+        assert app.max_address_outstanding == 2
+
+
+class _DeviceInfoCache:
+    def __init__(self, rpm_chunk_size=1):
+        self.device_info = {}
+        self.rpm_chunk_size = rpm_chunk_size
+
+    async def get_device_info(self, address):
+        device_info = self.device_info.get(address, None)
+        if device_info is None:
+            device_info = self.device_info[address] = DeviceInfo(
+                len(self.device_info),
+                address,
+                max_apdu_length_accepted=1476,
+                protocol_services_supported=ServicesSupported(
+                    ["read-property-multiple"]
+                ),
+                rpm_chunk_size=self.rpm_chunk_size,
+            )
+        return device_info
+
+
+class _SlowApplication(_Application):
+    """
+    Every request takes a little while, keep track of how many are
+    outstanding at the same time overall and for each address.
+    """
+
+    def __init__(self):
+        _Application.__init__(self, max_references=1)
+        self.device_info_cache = _DeviceInfoCache()
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self.address_outstanding = {}
+        self.max_address_outstanding = 0
+
+    async def read_property_multiple(self, address, parameter_list):
+        self.outstanding += 1
+        self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        count = self.address_outstanding.get(address, 0) + 1
+        self.address_outstanding[address] = count
+        self.max_address_outstanding = max(self.max_address_outstanding, count)
+
+        await asyncio.sleep(0.001)
+
+        self.outstanding -= 1
+        self.address_outstanding[address] -= 1
+        return await _Application.read_property_multiple(self, address, parameter_list)
+
+
+@bacpypes_debugging
+class TestConcurrency:
+    def make_daopr_list(self):
+        return [
+            DeviceAddressObjectPropertyReference(
+                (d, i), f"192.168.0.{d}", ("analog-value", i), "presentValue"
+            )
+            for d in range(1, 7)
+            for i in range(4)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequential(self):
+        if _debug:
+            TestConcurrency._debug("test_sequential")
+
+        app = _SlowApplication()
+        results = {}
+        await BatchRead(self.make_daopr_list()).run(app, results.__setitem__)
+
+        assert len(results) == 24
+        assert app.max_outstanding == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent(self):
+        if _debug:
+            TestConcurrency._debug("test_concurrent")
+
+        app = _SlowApplication()
+        results = {}
+        batch = BatchRead(
+            self.make_daopr_list(), concurrency=3, max_outstanding=2, max_requests=5
+        )
+        await batch.run(app, results.__setitem__)
+
+        assert results == {(d, i): i for d in range(1, 7) for i in range(4)}
+        assert app.max_outstanding == 5
+        assert app.max_address_outstanding == 2
+
+    @pytest.mark.asyncio
+    async def test_network_concurrency(self):
+        if _debug:
+            TestConcurrency._debug("test_network_concurrency")
+
+        app = _SlowApplication()
+        results = {}
+        batch = BatchRead(
+            self.make_daopr_list(), concurrency=3, network_concurrency={None: 1}
+        )
+        await batch.run(app, results.__setitem__)
+
+        assert len(results) == 24
+        assert app.max_outstanding == 1
+
+
+@bacpypes_debugging
+class TestStream:
+    def make_daopr_list(self, device_count=2, object_count=4):
+        return [
+            DeviceAddressObjectPropertyReference(
+                (d, i), f"192.168.0.{d}", ("analog-value", i), "presentValue"
+            )
+            for d in range(1, device_count + 1)
+            for i in range(object_count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stream(self):
+        if _debug:
+            TestStream._debug("test_stream")
+
+        app = _SlowApplication()
+        results = {}
+        async for key, value in BatchRead(self.make_daopr_list()).stream(app):
+            results[key] = value
+
+        assert results == {(d, i): i for d in range(1, 3) for i in range(4)}
+
+    @pytest.mark.asyncio
+    async def test_metadata(self):
+        if _debug:
+            TestStream._debug("test_metadata")
+
+        app = _Application(max_references=2)
+        app.device_info_cache = _DeviceInfoCache(rpm_chunk_size=None)
+
+        metadata = {}
+        batch = BatchRead(self.make_daopr_list(device_count=1))
+        async for key, value, info in batch.stream(app, metadata=True):
+            assert value == key[1]
+            metadata[key] = info
+
+        # the first request was too big, so was split in half
+        assert app.rpm_sizes == [4, 2, 2]
+        for info in metadata.values():
+            assert isinstance(info, ReadMetadata)
+            assert info.address == Address("192.168.0.1")
+            assert info.service == "read-property-multiple"
+            assert info.request_size == 2
+            assert info.retries == 1
+            assert info.latency is not None
+        assert metadata[(1, 0)].request_id == 2
+        assert metadata[(1, 3)].request_id == 3
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self):
+        if _debug:
+            TestStream._debug("test_backpressure")
+
+        app = _SlowApplication()
+        batch = BatchRead(self.make_daopr_list(device_count=4))
+
+        # a slow consumer keeps the requests from getting too far ahead
+        count = 0
+        async for key, value in batch.stream(app, buffer_size=2):
+            await asyncio.sleep(0.005)
+            count += 1
+            assert len(batch._buffer) <= 3
+            assert len(app.rpm_sizes) <= count + 3
+
+        assert count == 16
+
+    @pytest.mark.asyncio
+    async def test_break(self):
+        if _debug:
+            TestStream._debug("test_break")
+
+        app = _SlowApplication()
+        batch = BatchRead(self.make_daopr_list(device_count=4))
+        stream = batch.stream(app, buffer_size=1)
+        async for key, value in stream:
+            break
+        await stream.aclose()
+
+        # nothing more is read
+        assert batch._stop.is_set()
+        request_count = len(app.rpm_sizes)
+        await asyncio.sleep(0.01)
+        assert len(app.rpm_sizes) == request_count < 16
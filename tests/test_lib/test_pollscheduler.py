@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Poll Scheduler
+-------------------
+"""
+
+import asyncio
+import time
+
+from types import SimpleNamespace
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.basetypes import Segmentation, ServicesSupported
+from bacpypes3.app import DeviceInfo
+from bacpypes3.lib.batchread import DeviceAddressObjectPropertyReference
+from bacpypes3.lib.pollscheduler import PollScheduler
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+class _DeviceInfoCache:
+    def __init__(self):
+        self.device_info = {}
+
+    async def get_device_info(self, address):
+        device_info = self.device_info.get(address, None)
+        if device_info is None:
+            device_info = self.device_info[address] = DeviceInfo(
+                len(self.device_info),
+                address,
+                max_apdu_length_accepted=1476,
+                protocol_services_supported=ServicesSupported(
+                    ["read-property-multiple"]
+                ),
+            )
+        return device_info
+
+
+class _Application:
+    """
+    Looks enough like an application to read from devices, each request takes
+    delay seconds.
+    """
+
+    def __init__(self, delay=0.0):
+        self.device_object = None
+        self.asap = SimpleNamespace(
+            maxApduLengthAccepted=1476,
+            segmentationSupported=Segmentation.segmentedBoth,
+            maxSegmentsAccepted=16,
+        )
+        self.device_info_cache = _DeviceInfoCache()
+        self.delay = delay
+        self.requests = []
+
+    async def read_property_multiple(self, address, parameter_list):
+        result_list = []
+        while parameter_list:
+            objid, property_reference_list, *parameter_list = parameter_list
+            for property_reference in property_reference_list:
+                result_list.append(
+                    (objid, property_reference.propertyIdentifier, None, objid[1])
+                )
+        self.requests.append((address, len(result_list)))
+
+        await asyncio.sleep(self.delay)
+        return result_list
+
+
+def make_daopr(device, instance):
+    return DeviceAddressObjectPropertyReference(
+        (device, instance),
+        f"192.168.{device // 200}.{device % 200 + 1}",
+        ("analog-value", instance),
+        "presentValue",
+    )
+
+
+@bacpypes_debugging
+class TestPollScheduler:
+    async def poll(self, scheduler, app, duration):
+        results = []
+        run_task = asyncio.create_task(
+            scheduler.run(app, lambda key, value: results.append((key, value)))
+        )
+        await asyncio.sleep(duration)
+        scheduler.stop()
+        await run_task
+        return results
+
+    @pytest.mark.asyncio
+    async def test_intervals(self):
+        if _debug:
+            TestPollScheduler._debug("test_intervals")
+
+        scheduler = PollScheduler(jitter=0.0, group_window=0.01)
+        for i in range(3):
+            scheduler.add_point(make_daopr(1, i), 0.05)
+        for i in range(3, 5):
+            scheduler.add_point(make_daopr(1, i), 0.1)
+
+        app = _Application()
+        results = await self.poll(scheduler, app, 0.225)
+
+        # points with the same deadline are read in the same request
+        counts = {}
+        for key, value in results:
+            assert value == key[1]
+            counts[key] = counts.get(key, 0) + 1
+        assert [counts[(1, i)] for i in range(5)] == [4, 4, 4, 2, 2]
+        assert [size for address, size in app.requests] == [3, 5, 3, 5]
+        assert scheduler.stats()["missed_deadlines"] == 0
+
+    @pytest.mark.asyncio
+    async def test_jitter(self):
+        if _debug:
+            TestPollScheduler._debug("test_jitter")
+
+        scheduler = PollScheduler(jitter=10.0)
+        now = asyncio.get_running_loop().time()
+
+        point_list = [
+            scheduler.add_point(make_daopr(d, i), 1.0)
+            for d in range(1, 21)
+            for i in range(5)
+        ]
+        later = asyncio.get_running_loop().time()
+        for point in point_list:
+            assert now <= point.deadline < later + 1.0
+
+        # the points of a device are due together, the devices are not
+        deadlines = {}
+        for point in point_list:
+            deadlines.setdefault(point.daopr.deviceAddress, set()).add(point.deadline)
+        assert all(len(deadline_set) == 1 for deadline_set in deadlines.values())
+        assert len(set.union(*deadlines.values())) > 1
+
+        # longer intervals line up with shorter ones
+        point = scheduler.add_point(make_daopr(1, 10), 5.0)
+        deadline = scheduler.points[(1, 0)].deadline
+        assert (point.deadline - deadline) == pytest.approx(
+            round(point.deadline - deadline)
+        )
+
+    @pytest.mark.asyncio
+    async def test_missed_deadlines(self):
+        if _debug:
+            TestPollScheduler._debug("test_missed_deadlines")
+
+        scheduler = PollScheduler(jitter=0.0)
+        point = scheduler.add_point(make_daopr(1, 0), 0.02)
+
+        # each read takes longer than a few intervals
+        app = _Application(delay=0.07)
+        results = await self.poll(scheduler, app, 0.2)
+
+        assert 2 <= len(results) <= 3
+        stats = scheduler.stats()
+        assert stats["missed_deadlines"] >= 4
+        assert stats["missed_deadlines"] == point.missed
+        assert stats["max_lag"] > 0.0
+
+    @pytest.mark.asyncio
+    async def test_remove_point(self):
+        if _debug:
+            TestPollScheduler._debug("test_remove_point")
+
+        scheduler = PollScheduler(jitter=0.0)
+        scheduler.add_point(make_daopr(1, 0), 0.02)
+        scheduler.add_point(make_daopr(1, 1), 0.02)
+        scheduler.remove_point((1, 1))
+
+        results = await self.poll(scheduler, _Application(), 0.05)
+        assert {key for key, value in results} == {(1, 0)}
+        assert scheduler.stats()["points"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_busy(self):
+        if _debug:
+            TestPollScheduler._debug("test_stop_busy")
+
+        scheduler = PollScheduler(jitter=0.0, group_window=0.0, max_batches=1)
+        scheduler.add_point(make_daopr(1, 0), 0.01)
+        scheduler.add_point(make_daopr(2, 0), 0.03)
+
+        # the only batch slot is busy with a slow read
+        app = _Application(delay=0.5)
+        run_task = asyncio.create_task(scheduler.run(app))
+        await asyncio.sleep(0.05)
+        assert scheduler.stats()["running"] == 1
+
+        # stopping does not wait for the read to finish
+        start = time.perf_counter()
+        scheduler.stop()
+        await asyncio.wait_for(run_task, 0.1)
+        assert time.perf_counter() - start < 0.1
+        assert scheduler.stats()["running"] == 0
+
+        # let the abandoned read finish
+        await asyncio.sleep(0.5)
+
+    @pytest.mark.asyncio
+    async def test_scale(self):
+        if _debug:
+            TestPollScheduler._debug("test_scale")
+
+        daopr_list = [make_daopr(i % 1000, i) for i in range(20000)]
+
+        # scheduling is not where the time goes
+        start = time.perf_counter()
+        scheduler = PollScheduler()
+        for i, daopr in enumerate(daopr_list):
+            scheduler.add_point(daopr, 1.0 + (i % 3600))
+        assert len(scheduler.points) == 20000
+        assert time.perf_counter() - start < 2.0
@@ -0,0 +1,8 @@
+#!/usr/bin/python
+
+"""
+Test Local Objects
+------------------
+"""
+
+from . import test_object
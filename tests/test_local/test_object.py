@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Local Object
+-----------------
+"""
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.primitivedata import CharacterString
+from bacpypes3.basetypes import PropertyIdentifier, ServicesSupported
+from bacpypes3.app import Application
+from bacpypes3.local.analog import AnalogValueObject
+from bacpypes3.local.device import DeviceObject
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+class _ComputedAnalogValueObject(AnalogValueObject):
+    @property
+    def description(self) -> CharacterString:
+        return CharacterString(f"value {self.presentValue}")
+
+
+@bacpypes_debugging
+class TestEncodedCache:
+    @pytest.mark.asyncio
+    async def test_encoded_cache(self):
+        if _debug:
+            TestEncodedCache._debug("test_encoded_cache")
+
+        obj = AnalogValueObject(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            description="first",
+            presentValue=1.0,
+        )
+
+        # the encoding is saved and the copies are equal
+        value1 = await obj.read_property_to_any("description")
+        assert "description" in obj._encoded_cache
+        value2 = await obj.read_property_to_any("description")
+        assert value1 == value2
+        assert value1.cast_out(CharacterString) == "first"
+
+        # changing the value forgets the encoding
+        obj.description = "second"
+        assert "description" not in obj._encoded_cache
+        value3 = await obj.read_property_to_any("description")
+        assert value3.cast_out(CharacterString) == "second"
+
+        # so does writing it
+        await obj.write_property("description", "third")
+        value4 = await obj.read_property_to_any("description")
+        assert value4.cast_out(CharacterString) == "third"
+
+        # values that change often are not saved
+        await obj.read_property_to_any("presentValue")
+        assert "presentValue" not in obj._encoded_cache
+
+    @pytest.mark.asyncio
+    async def test_encoded_cache_property_list(self):
+        if _debug:
+            TestEncodedCache._debug("test_encoded_cache_property_list")
+
+        obj = AnalogValueObject(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            presentValue=1.0,
+        )
+        property_list_type = obj.get_property_type("propertyList")
+        description = PropertyIdentifier("description")
+
+        value = await obj.read_property_to_any("propertyList")
+        assert description not in value.cast_out(property_list_type)
+
+        # a new property is in the list
+        obj.description = "here"
+        value = await obj.read_property_to_any("propertyList")
+        assert description in value.cast_out(property_list_type)
+
+    @pytest.mark.asyncio
+    async def test_encoded_cache_computed(self):
+        if _debug:
+            TestEncodedCache._debug("test_encoded_cache_computed")
+
+        device_object = DeviceObject(
+            objectIdentifier="device,1",
+            objectName="dev1",
+        )
+
+        # nothing is supported until the object is bound to an application
+        value = await device_object.read_property_to_any("protocolServicesSupported")
+        assert not value.cast_out(ServicesSupported)["read-property"]
+
+        app = Application()
+        app.add_object(device_object)
+        value = await device_object.read_property_to_any("protocolServicesSupported")
+        assert value.cast_out(ServicesSupported)["read-property"]
+
+    @pytest.mark.asyncio
+    async def test_encoded_cache_getter(self):
+        if _debug:
+            TestEncodedCache._debug("test_encoded_cache_getter")
+
+        obj = _ComputedAnalogValueObject(
+            objectIdentifier="analog-value,1",
+            objectName="av1",
+            presentValue=1.0,
+        )
+
+        # a computed property is read every time
+        value = await obj.read_property_to_any("description")
+        assert value.cast_out(CharacterString) == "value 1.0"
+        obj.presentValue = 2.0
+        value = await obj.read_property_to_any("description")
+        assert value.cast_out(CharacterString) == "value 2.0"
+        assert "description" not in obj._encoded_cache
+
+        # the object name is still saved
+        await obj.read_property_to_any("objectName")
+        assert "objectName" in obj._encoded_cache
@@ -18,6 +18,9 @@ from bacpypes3.pdu import (
     LocalBroadcast,
     RemoteBroadcast,
     GlobalBroadcast,
+    IPv4Address,
+    AddressCache,
+    address_cache,
 )
 
 # some debugging
@@ -511,3 +514,47 @@ class TestAddressEquality(unittest.TestCase, MatchAddressMixin):
         assert Address("3:4@6.7.8.9") == RemoteStation(3, 4, route=Address("6.7.8.9"))
         assert Address("5:*@6.7.8.9") == RemoteBroadcast(5, route=Address("6.7.8.9"))
         assert Address("*:*@6.7.8.9") == GlobalBroadcast(route=Address("6.7.8.9"))
+
+
+@bacpypes_debugging
+class TestAddressCache(unittest.TestCase):
+    def test_address_cache(self):
+        if _debug:
+            TestAddressCache._debug("test_address_cache")
+
+        address_cache.clear()
+
+        # parsed once and shared
+        test_addr = Address("192.168.1.10")
+        assert Address("192.168.1.10") is test_addr
+        assert address_cache.misses == 1
+        assert address_cache.hits == 1
+
+        # socket tuples share the cache
+        test_addr = IPv4Address.from_tuple(("192.168.1.10", 47809))
+        assert isinstance(test_addr, IPv4Address)
+        assert test_addr.addrTuple == ("192.168.1.10", 47809)
+        assert Address(("192.168.1.10", 47809)) is test_addr
+
+        # octets are cached, keyword arguments are not
+        assert Address(xtob("c0a8010abac0")) is Address(bytearray(xtob("c0a8010abac0")))
+        assert Address("192.168.1.10") is not Address("192.168.1.10", network_type="ipv4")
+
+    def test_address_cache_lru(self):
+        if _debug:
+            TestAddressCache._debug("test_address_cache_lru")
+
+        cache = AddressCache(maxsize=2)
+        addr1, addr2, addr3 = Address(1), Address(2), Address(3)
+
+        cache.put("1", addr1)
+        cache.put("2", addr2)
+        assert cache.get("1") is addr1
+
+        # the least recently used one is dropped
+        cache.put("3", addr3)
+        assert len(cache) == 2
+        assert cache.get("2") is None
+        assert cache.get("1") is addr1
+        assert cache.get("3") is addr3
+        assert (cache.hits, cache.misses) == (3, 1)
@@ -1 +1,74 @@
-# placeholder
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test PDU Data
+-------------
+"""
+
+import unittest
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger, xtob
+from bacpypes3.errors import DecodingError
+from bacpypes3.pdu import PDUData
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestPDUData(unittest.TestCase):
+    def test_get(self):
+        if _debug:
+            TestPDUData._debug("test_get")
+
+        pdu_data = PDUData(xtob("01020304050607080900"))
+        assert pdu_data.remaining() == 10
+
+        assert pdu_data.get() == 0x01
+        assert pdu_data.get_short() == 0x0203
+        assert pdu_data.get_long() == 0x04050607
+        assert pdu_data.remaining() == 3
+
+        # the remaining octets are still available
+        assert pdu_data.pduData == xtob("080900")
+
+        assert pdu_data.get_data(2) == xtob("0809")
+        assert bytes(pdu_data.get_view(1)) == xtob("00")
+        assert pdu_data.remaining() == 0
+        assert pdu_data.pduData == b""
+
+        with pytest.raises(DecodingError):
+            pdu_data.get()
+        with pytest.raises(DecodingError):
+            pdu_data.get_data(1)
+
+    def test_get_then_put(self):
+        if _debug:
+            TestPDUData._debug("test_get_then_put")
+
+        pdu_data = PDUData(xtob("010203"))
+        assert pdu_data.get() == 0x01
+
+        # appending keeps the unread octets in order
+        pdu_data.put(0x04)
+        pdu_data.put_short(0x0506)
+        pdu_data.put_data(xtob("07"))
+        assert pdu_data.remaining() == 6
+        assert pdu_data.pduData == xtob("020304050607")
+
+    def test_copy(self):
+        if _debug:
+            TestPDUData._debug("test_copy")
+
+        pdu_data = PDUData(xtob("010203"))
+        pdu_data.get()
+
+        # the copy only has the remaining octets
+        pdu_copy = PDUData(pdu_data)
+        assert pdu_copy.pduData == xtob("0203")
+
+        pdu_copy.get()
+        assert pdu_data.pduData == xtob("0203")
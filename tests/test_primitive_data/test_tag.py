@@ -10,12 +10,21 @@ import unittest
 import pytest
 
 from bacpypes3.debugging import bacpypes_debugging, ModuleLogger, xtob
+from bacpypes3.errors import InvalidTag
 from bacpypes3.pdu import PDUData
 from bacpypes3.primitivedata import (
     Tag,
+    TagList,
+    TagNumber,
+    ApplicationTag,
     ContextTag,
     OpeningTag,
+    ClosingTag,
+    Boolean,
+    _tag_pool,
 )
+from bacpypes3.basetypes import PropertyReference
+from bacpypes3.constructeddata import ListOf
 
 # some debugging
 _debug = 0
@@ -171,3 +180,183 @@ class TestOpeningTag(unittest.TestCase):
         opening_endec(14, "EE")
         opening_endec(15, "FE0F")
         opening_endec(254, "FEFE")
+
+
+class _CountingList(list):
+    """
+    A list that counts the number of items that are copied or shifted when
+    it is sliced or changed at the front.
+    """
+
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self.moved = 0
+
+    def __getitem__(self, item):
+        value = list.__getitem__(self, item)
+        if isinstance(item, slice):
+            self.moved += len(value)
+        return value
+
+    def __delitem__(self, item):
+        if isinstance(item, slice):
+            self.moved += len(self)
+        elif item != -1:
+            self.moved += len(self) - item
+        list.__delitem__(self, item)
+
+    def insert(self, index, item):
+        self.moved += len(self) - index
+        list.insert(self, index, item)
+
+    def pop(self, index=-1):
+        if index != -1:
+            self.moved += len(self) - index
+        return list.pop(self, index)
+
+
+@bacpypes_debugging
+class TestTagList(unittest.TestCase):
+    def test_tag_list_encode(self):
+        if _debug:
+            TestTagList._debug("test_tag_list_encode")
+
+        tag_list = TagList(
+            [
+                OpeningTag(1),
+                ContextTag(2, xtob("01")),
+                ApplicationTag(TagNumber.octetString, xtob("00" * 300)),
+                ClosingTag(1),
+            ]
+        )
+        blob = xtob("1E" "2901" "65FE012C" + "00" * 300 + "1F")
+
+        # encode into a new buffer
+        assert tag_list.encode().pduData == blob
+
+        # encode on the end of an existing buffer
+        pdu_data = PDUData(xtob("FF"))
+        assert tag_list.encode(pdu_data) is pdu_data
+        assert pdu_data.pduData == xtob("FF") + blob
+
+        # decode it back again
+        assert TagList.decode(PDUData(blob)) == tag_list
+
+    def test_tag_list_pop_push(self):
+        if _debug:
+            TestTagList._debug("test_tag_list_pop_push")
+
+        tag1 = ContextTag(1, xtob("01"))
+        tag2 = ContextTag(2, xtob("02"))
+        tag_list = TagList([tag1, tag2])
+
+        assert tag_list.peek() is tag1
+        assert tag_list.pop() is tag1
+        assert len(tag_list) == 1
+        assert tag_list.tagList == [tag2]
+
+        # push back the same tag and a different one
+        tag_list.push(tag1)
+        assert list(tag_list) == [tag1, tag2]
+        tag_list.push(tag2)
+        assert list(tag_list) == [tag2, tag1, tag2]
+
+        assert tag_list.pop() is tag2
+        assert tag_list.pop() is tag1
+        assert tag_list.pop() is tag2
+        assert tag_list.pop() is None
+        assert tag_list.peek() is None
+
+    def test_tag_list_pop_context(self):
+        if _debug:
+            TestTagList._debug("test_tag_list_pop_context")
+
+        tags = [
+            OpeningTag(1),
+            OpeningTag(2),
+            ClosingTag(2),
+            ClosingTag(1),
+            ContextTag(3, xtob("03")),
+        ]
+        tag_list = TagList(tags[:])
+
+        # the context is a view of the first four tags
+        context = tag_list.pop_context()
+        assert list(context) == tags[:4]
+        assert context[-1] is tags[3]
+        assert list(tag_list) == tags[4:]
+
+        # changing the context does not change the rest of the list
+        context.append(ContextTag(4, xtob("04")))
+        assert len(context) == 5
+        assert list(tag_list) == tags[4:]
+
+        # a copy does not change the original
+        tag_list_copy = TagList(tag_list)
+        assert tag_list_copy.pop() is tags[4]
+        assert len(tag_list) == 1
+
+        # mismatched open/close tags
+        with pytest.raises(InvalidTag):
+            TagList([OpeningTag(1)]).pop_context()
+
+    def test_tag_list_decode_compact(self):
+        if _debug:
+            TestTagList._debug("test_tag_list_decode_compact")
+
+        tags = [
+            OpeningTag(1),
+            Boolean(True).encode()[0],
+            ContextTag(2, xtob("02")),
+            ClosingTag(1),
+            OpeningTag(1),
+            Boolean(True).encode()[0],
+            ClosingTag(1),
+        ]
+        blob = TagList(tags).encode().pduData
+
+        tag_list = TagList.decode(PDUData(blob))
+        assert list(tag_list) == tags
+
+        # tags are compact
+        for tag in tag_list:
+            assert not hasattr(tag, "__dict__")
+
+        # tags without data are shared
+        assert tag_list[0] is tag_list[4]
+        assert tag_list[1] is tag_list[5]
+        assert tag_list[3] is tag_list[6]
+
+    def test_tag_decode_malformed_boolean(self):
+        if _debug:
+            TestTagList._debug("test_tag_decode_malformed_boolean")
+
+        # booleans with a value that is not 0 or 1 are not shared
+        pool_size = len(_tag_pool)
+        for value in (2, 1000, 70000):
+            blob = xtob("15FF") + value.to_bytes(4, "big")
+            tag = Tag.decode(PDUData(blob))
+            assert tag.tag_number == TagNumber.boolean
+            assert tag.tag_lvt == value
+        assert len(_tag_pool) == pool_size
+
+    def test_tag_list_decode_linear(self):
+        if _debug:
+            TestTagList._debug("test_tag_list_decode_linear")
+
+        def moved_tags(count):
+            list_class = ListOf(PropertyReference)
+            obj = list_class(
+                [PropertyReference("presentValue") for _ in range(count)]
+            )
+            blob = obj.encode().encode().pduData
+
+            tag_list = TagList.decode(PDUData(blob))
+            tag_list._tags = _CountingList(tag_list._tags)
+            assert len(list_class.decode(tag_list)) == count
+            assert not tag_list
+            return tag_list._tags.moved
+
+        # decoding each element does not copy or shift the rest of the tags
+        assert moved_tags(10) == 0
+        assert moved_tags(2000) == 0
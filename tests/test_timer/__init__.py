@@ -0,0 +1,8 @@
+#!/usr/bin/python
+
+"""
+Test Timers
+-----------
+"""
+
+from . import test_timer_wheel
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Test Timer Wheel
+----------------
+"""
+
+import asyncio
+
+import pytest
+
+from bacpypes3.debugging import bacpypes_debugging, ModuleLogger
+from bacpypes3.timer import TimerWheel, get_timer_wheel
+
+# some debugging
+_debug = 0
+_log = ModuleLogger(globals())
+
+
+@bacpypes_debugging
+class TestTimerWheel:
+    @pytest.mark.asyncio
+    async def test_call_later(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_call_later")
+
+        loop = asyncio.get_running_loop()
+        wheel = TimerWheel(0.1)
+        calls = []
+
+        def callback(label):
+            calls.append((label, round(loop.time(), 3)))
+
+        # near, far enough for the second level, and far enough for the third
+        wheel.call_later(1.0, callback, "a")
+        wheel.call_later(30.0, callback, "b")
+        wheel.call_later(7000.0, callback, "c")
+        assert wheel.count == 3
+
+        await clocked_test(10000.0)
+        assert calls == [("a", 1.0), ("b", 30.0), ("c", 7000.0)]
+        assert wheel.count == 0
+
+    @pytest.mark.asyncio
+    async def test_restart_cancel(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_restart_cancel")
+
+        loop = asyncio.get_running_loop()
+        wheel = TimerWheel(0.1)
+        calls = []
+
+        def callback():
+            calls.append(round(loop.time(), 3))
+
+        timer1 = wheel.call_later(1.0, callback)
+        timer2 = wheel.call_later(2.0, callback)
+
+        # move the first one later, cancel the second
+        await clocked_test(0.5)
+        timer1.restart(5.0)
+        assert timer1.when() == pytest.approx(5.5)
+        timer2.cancel()
+        assert timer2.cancelled()
+        assert not timer2.scheduled()
+
+        await clocked_test(10.0)
+        assert calls == [5.5]
+
+        # a timer can be restarted from its own callback
+        def again():
+            calls.append(round(loop.time(), 3))
+            if len(calls) < 4:
+                timer3.restart(1.0)
+
+        timer3 = wheel.call_later(1.0, again)
+        await clocked_test(10.0)
+        assert calls == [5.5, 11.5, 12.5, 13.5]
+
+    @pytest.mark.asyncio
+    async def test_shared(self):
+        if _debug:
+            TestTimerWheel._debug("test_shared")
+
+        # one for each resolution in this loop
+        assert get_timer_wheel() is get_timer_wheel()
+        assert get_timer_wheel(1.0) is not get_timer_wheel()
+
+    @pytest.mark.asyncio
+    async def test_idle_hours(self, clocked_test):
+        if _debug:
+            TestTimerWheel._debug("test_idle_hours")
+
+        loop = asyncio.get_running_loop()
+        wheel = TimerWheel(0.01)
+        calls = []
+
+        def callback(label):
+            calls.append((label, round(loop.time(), 3)))
+
+        # count the ticks that are processed
+        tick_count = 0
+        process_tick = wheel._process_tick
+
+        def counted_process_tick():
+            nonlocal tick_count
+            tick_count += 1
+            process_tick()
+
+        wheel._process_tick = counted_process_tick  # type: ignore[assignment]
+
+        wheel.call_later(1.0, callback, "a")
+        await clocked_test(1.0)
+        assert calls == [("a", 1.0)]
+
+        # a day later the wheel does not catch up on the idle ticks
+        await clocked_test(86400.0)
+        tick_count = 0
+        wheel.call_later(1.0, callback, "b")
+        await clocked_test(2.0)
+        assert calls[-1] == ("b", 86402.0)
+        assert tick_count <= 2
+
+        # a timer hours away skips the empty slots in between
+        tick_count = 0
+        wheel.call_later(3 * 3600.0, callback, "c")
+        wheel.call_later(5.0, callback, "d")
+        await clocked_test(4 * 3600.0)
+        assert calls[-2:] == [("d", 86408.0), ("c", 97203.0)]
+        assert tick_count <= 10